@@ -0,0 +1,110 @@
+"""Upstream call latency benchmark, pooled client against `requests.get`.
+
+Starts a local keep-alive stub server and times sequential calls made
+with a new connection each (`requests.get`) and with the pooled
+`HttpClient`. Run from the project root:
+
+    python -m benchmarks.http_client_benchmark
+"""
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+import requests
+
+from src.viper_boot.utils.http_client import HttpClient
+
+CALLS = 1000
+BODY = b'{"args": {}, "url": "http://127.0.0.1/get"}'
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive stub upstream returning a small JSON body."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes, avoid delayed ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa # pylint: disable=C0103
+        """Get request handler."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *_args: Any) -> None:
+        """Silence request logging.
+
+        Parameters:
+            *_args (Any): log arguments
+        """  # noqa: RST210
+
+
+def _measure(call: Callable[[], Any]) -> Dict[str, float]:
+    """
+    Time sequential calls.
+
+    Parameters:
+        call (Callable[[], Any]): upstream call
+
+    Returns:
+        latency percentiles in milliseconds
+    """
+    call()  # warm up
+    latencies: List[float] = []
+    for _ in range(CALLS):
+        start = time.perf_counter()
+        call().raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        "mean": statistics.mean(latencies),
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+def run() -> Dict[str, Dict[str, float]]:
+    """
+    Time both clients against the local stub server.
+
+    Returns:
+        latency percentiles per client
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/get"
+
+    client = HttpClient({"url": url})
+    try:
+        return {
+            "requests.get": _measure(lambda: requests.get(url, timeout=5)),
+            "HttpClient": _measure(client.get),
+        }
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def main() -> None:
+    """Print benchmark results as a table."""
+    print(f"{'client':<14}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, result in run().items():
+        print(
+            f"{name:<14}{result['mean']:>10.3f}"
+            f"{result['p50']:>10.3f}{result['p99']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
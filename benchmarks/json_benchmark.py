@@ -0,0 +1,108 @@
+"""JSON encoding benchmark, encoder backends against pretty stdlib output.
+
+Run from the project root:
+
+    python -m benchmarks.json_benchmark
+"""
+import json
+import timeit
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from src.viper_boot.utils.json_encoder import JSON_ENCODERS
+
+STUDENT_COUNTS = (1, 100, 1000)
+REPEAT = 5
+NUMBER = 100
+
+
+def _students(count: int) -> List[Dict[str, Any]]:
+    """
+    Build serialized students.
+
+    Parameters:
+        count (int): number of students
+
+    Returns:
+        serialized students
+    """
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "student": {
+                "first_name": "James",
+                "last_name": "Smith",
+                "dob": "1978-10-10",
+                "gender": "MALE",
+            },
+        }
+        for _ in range(count)
+    ]
+
+
+def _encoders() -> List[Tuple[str, Callable[[Any], bytes]]]:
+    """
+    Get the installed encoders and the previous pretty stdlib encoding.
+
+    Returns:
+        encoder name and encode function
+    """
+    encoders: List[Tuple[str, Callable[[Any], bytes]]] = [
+        ("stdlib-pretty", lambda data: json.dumps(data, indent=2).encode())
+    ]
+    for name, cls in JSON_ENCODERS.items():
+        try:
+            encoders.append((name, cls().encode))
+        except ValueError:
+            continue  # Optional backend not installed
+
+    return encoders
+
+
+def run() -> List[Dict[str, Any]]:
+    """
+    Time encoding of every encoder for every student count.
+
+    Returns:
+        best time per call in microseconds and body size, per encoder and
+        student count
+    """
+    results = []
+    for count in STUDENT_COUNTS:
+        data = _students(count)
+        for name, encode in _encoders():
+            best = min(
+                timeit.repeat(
+                    lambda: encode(data),  # noqa: B023
+                    repeat=REPEAT,
+                    number=NUMBER,
+                )
+            )
+            results.append(
+                {
+                    "encoder": name,
+                    "students": count,
+                    "usec_per_call": best / NUMBER * 1e6,
+                    "bytes": len(encode(data)),
+                }
+            )
+
+    return results
+
+
+def main() -> None:
+    """Print benchmark results as a table."""
+    print(f"{'encoder':<15}{'students':>9}{'usec/call':>12}{'bytes':>10}")
+    for result in run():
+        print(
+            f"{result['encoder']:<15}{result['students']:>9}"
+            f"{result['usec_per_call']:>12.2f}{result['bytes']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
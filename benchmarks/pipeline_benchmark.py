@@ -0,0 +1,133 @@
+"""End-to-end request benchmark, asyncio server against a local stub upstream.
+
+Serves the application with the asyncio server and sends sequential
+requests on a keep-alive connection, every request calls the local stub
+upstream. Run from the project root:
+
+    python -m benchmarks.pipeline_benchmark
+"""
+import asyncio
+import os
+import socket
+import statistics
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+
+from src.viper_boot.application import Application
+from src.viper_boot.config.config import Config
+from src.viper_boot.server.asyncio_server import AsyncioServer
+from src.viper_boot.server.stub_upstream import StubUpstream
+from src.viper_boot.utils.http_client import HttpClient
+
+REQUESTS = 1000
+
+# Request paths by operation, new student ids miss the cache
+PATHS: Dict[str, Callable[[], str]] = {
+    "get_student_by_id": lambda: f"/api/v1/student/{uuid.uuid4()}",
+    "get_students": lambda: "/api/v1/students?limit=100",
+}
+
+
+@contextmanager
+def application(upstream: str) -> Iterator[str]:
+    """
+    Serve the application with the asyncio server in a background thread.
+
+    Parameters:
+        upstream (str): upstream API URL, replaces the settings `api.url`
+
+    Yields:
+        application URL
+    """
+    previous = os.environ.get("DYNACONF_API__url")
+    os.environ["DYNACONF_API__url"] = upstream
+    Config().reload()  # Upstream clients apply the new URL
+    sock = socket.create_server(("127.0.0.1", 0))
+    server = AsyncioServer(Application().asgi(), sock=sock)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(
+        target=loop.run_until_complete, args=(server.serve(),), daemon=True
+    )
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+    finally:
+        loop.call_soon_threadsafe(server.stop)
+        thread.join(10)
+        loop.close()
+        if previous is None:
+            os.environ.pop("DYNACONF_API__url", None)
+        else:
+            os.environ["DYNACONF_API__url"] = previous
+        Config().reload()
+
+
+def measure(client: HttpClient, path: Callable[[], str]) -> Dict[str, float]:
+    """
+    Time sequential requests.
+
+    Parameters:
+        client (HttpClient): client of the application
+        path (Callable[[], str]): returns the path of the next request
+
+    Returns:
+        latency percentiles in milliseconds
+    """
+    client.get(client.url + path()).raise_for_status()  # warm up
+    latencies: List[float] = []
+    for _ in range(REQUESTS):
+        url = client.url + path()
+        start = time.perf_counter()
+        client.get(url).raise_for_status()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    return {
+        "mean": statistics.mean(latencies),
+        "p50": latencies[len(latencies) // 2],
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+def run() -> Dict[str, Dict[str, Any]]:
+    """
+    Time requests of every operation through the served application.
+
+    Returns:
+        latency percentiles per operation
+    """
+    stub = StubUpstream(port=0)
+    stub.start()
+    try:
+        with application(stub.url) as url:
+            client = HttpClient({"url": url, "retries": 0})
+            try:
+                return {
+                    operation: measure(client, path)
+                    for operation, path in PATHS.items()
+                }
+            finally:
+                client.close()
+    finally:
+        stub.stop()
+
+
+def main() -> None:
+    """Print benchmark results as a table."""
+    print(f"{'operation':<20}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, result in run().items():
+        print(
+            f"{name:<20}{result['mean']:>10.3f}"
+            f"{result['p50']:>10.3f}{result['p99']:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Router lookup benchmark, radix tree against linear regex matching.
+
+Run from the project root:
+
+    python -m benchmarks.router_benchmark
+"""
+import re
+import timeit
+import uuid
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Pattern
+from typing import Tuple
+
+from src.viper_boot.server.router import Route
+from src.viper_boot.server.router import Router
+
+ROUTE_COUNTS = (10, 100, 1000)
+REPEAT = 5
+NUMBER = 10000
+
+
+class LinearRegexRouter:
+    """Reference router, tries every compiled template in turn."""
+
+    _PATH_KEY_PATTERN = re.compile(r"{([^{}]+)}")
+
+    def __init__(self) -> None:
+        """Initialise the router with no routes."""
+        self._routes: List[Tuple[Pattern[str], Route]] = []
+
+    def add(self, route: Route) -> None:
+        """
+        Add route to the router.
+
+        Parameters:
+            route (Route): route to add
+        """
+        pattern = self._PATH_KEY_PATTERN.sub(
+            lambda key: f"(?P<{key.group(1)}>[^/]+)", route.path
+        )
+        self._routes.append((re.compile(pattern), route))
+
+    def match(self, method: str, path: str) -> Tuple[Route, Dict[str, Any]]:
+        """
+        Find route for the request.
+
+        Parameters:
+            method (str): HTTP method
+            path (str): request path
+
+        Raises:
+            LookupError: if no route matches
+
+        Returns:
+            matched route and path parameters
+        """
+        for pattern, route in self._routes:
+            matched = pattern.fullmatch(path)
+            if matched is not None and route.method == method:
+                return route, matched.groupdict()
+
+        raise LookupError(path)
+
+
+def _build(router: Any, count: int) -> str:
+    """
+    Register `count` resources with a collection and an item route each.
+
+    Parameters:
+        router (Any): router to fill
+        count (int): number of routes
+
+    Returns:
+        path of the last registered item route, worst case for linear scan
+    """
+    for index in range(count // 2):
+        router.add(Route("GET", f"/api/v1/resource{index}s", None, 200, False))
+        router.add(
+            Route(
+                "GET",
+                f"/api/v1/resource{index}/{{id}}",
+                None,
+                200,
+                False,
+                {"id": "uuid"},
+            )
+        )
+
+    return f"/api/v1/resource{count // 2 - 1}/{uuid.uuid4()}"
+
+
+def run() -> List[Dict[str, Any]]:
+    """
+    Time lookups of both routers for every route count.
+
+    Returns:
+        best time per lookup in microseconds, per router and route count
+    """
+    results = []
+    for count in ROUTE_COUNTS:
+        for name, router in (
+            ("radix", Router()),
+            ("linear-regex", LinearRegexRouter()),
+        ):
+            path = _build(router, count)
+            best = min(
+                timeit.repeat(
+                    lambda: router.match("GET", path),  # noqa: B023
+                    repeat=REPEAT,
+                    number=NUMBER,
+                )
+            )
+            results.append(
+                {
+                    "router": name,
+                    "routes": count,
+                    "usec_per_lookup": best / NUMBER * 1e6,
+                }
+            )
+
+    return results
+
+
+def main() -> None:
+    """Print benchmark results as a table."""
+    print(f"{'router':<14}{'routes':>8}{'usec/lookup':>14}")
+    for result in run():
+        print(
+            f"{result['router']:<14}{result['routes']:>8}"
+            f"{result['usec_per_lookup']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
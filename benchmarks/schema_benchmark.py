@@ -0,0 +1,112 @@
+"""Schema benchmark, compiled serializers against marshmallow schemas.
+
+Run from the project root:
+
+    python -m benchmarks.schema_benchmark
+"""
+import timeit
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from src.viper_boot.schemas import compile_schema
+from src.viper_boot.schemas import StudentSchema
+
+STUDENT_COUNTS = (1, 100, 1000)
+REPEAT = 5
+NUMBER = 100
+
+
+def _students(count: int) -> List[Dict[str, Any]]:
+    """
+    Build upstream student payloads.
+
+    Parameters:
+        count (int): number of students
+
+    Returns:
+        student payloads
+    """
+    return [
+        {
+            "id": uuid.uuid4().hex,
+            "student": {
+                "first_name": "James",
+                "last_name": "Smith",
+                "dob": "1978-10-10",
+                "gender": "MALE",
+            },
+        }
+        for _ in range(count)
+    ]
+
+
+def _cases(
+    data: List[Dict[str, Any]]
+) -> List[Tuple[str, str, Callable[[], Any]]]:
+    """
+    Get load and dump calls of both serializers.
+
+    Parameters:
+        data (List[Dict[str, Any]]): student payloads
+
+    Returns:
+        serializer name, operation and call
+    """
+    compiled = compile_schema(StudentSchema)
+    students = compiled.load(data, many=True)
+    return [
+        (
+            "marshmallow",
+            "load",
+            lambda: StudentSchema(many=True).load(data),
+        ),
+        ("compiled", "load", lambda: compiled.load(data, many=True)),
+        (
+            "marshmallow",
+            "dump",
+            lambda: StudentSchema(many=True).dump(students),
+        ),
+        ("compiled", "dump", lambda: compiled.dump(students, many=True)),
+    ]
+
+
+def run() -> List[Dict[str, Any]]:
+    """
+    Time load and dump of both serializers for every student count.
+
+    Returns:
+        best time per call in microseconds, per serializer, operation
+        and student count
+    """
+    results = []
+    for count in STUDENT_COUNTS:
+        for name, operation, call in _cases(_students(count)):
+            best = min(timeit.repeat(call, repeat=REPEAT, number=NUMBER))
+            results.append(
+                {
+                    "serializer": name,
+                    "operation": operation,
+                    "students": count,
+                    "usec_per_call": best / NUMBER * 1e6,
+                }
+            )
+
+    return results
+
+
+def main() -> None:
+    """Print benchmark results as a table."""
+    print(f"{'serializer':<13}{'op':<6}{'students':>9}{'usec/call':>14}")
+    for result in run():
+        print(
+            f"{result['serializer']:<13}{result['operation']:<6}"
+            f"{result['students']:>9}{result['usec_per_call']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
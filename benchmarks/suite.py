@@ -0,0 +1,339 @@
+"""Benchmark suite of the request pipeline, compared against a baseline.
+
+Times router lookup, `StudentSchema` load and dump, OpenAPI registration
+and spec generation, `Config.get` and end-to-end requests against a local
+stub upstream. Results are written as JSON, cases slower than the
+baseline by more than the threshold are reported as regressions and the
+suite exits with status 1. Run from the project root:
+
+    python -m benchmarks.suite                  # Compare with the baseline
+    python -m benchmarks.suite --save-baseline  # Keep results as baseline
+"""
+import argparse
+import copy
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from benchmarks import pipeline_benchmark
+from benchmarks.router_benchmark import _build
+from benchmarks.schema_benchmark import _students
+from src.viper_boot.application import Application
+from src.viper_boot.config.config import Config
+from src.viper_boot.openapi_docs.open_api import OpenApi
+from src.viper_boot.schemas import compile_schema
+from src.viper_boot.schemas import StudentSchema
+from src.viper_boot.server.router import Router
+
+OUTPUT = Path(".reports/benchmark.json")
+BASELINE = Path("benchmarks/baseline.json")
+THRESHOLD = 0.2
+REPEAT = 5
+
+ROUTE_COUNT = 1000
+STUDENT_COUNTS = (1, 100, 10000)
+
+# Routes registered by the application, see `Application.__init__`
+ROUTES = (
+    ("/api/v1/students", "get_students"),
+    ("/api/v1/students:batchGet", "get_students_batch"),
+    ("/api/v1/student/{id}", "get_student_by_id"),
+    ("/api/v1/student", "create_student"),
+    ("/api/v1/student/{id}", "update_student"),
+    ("/api/v1/student/{id}", "delete_student"),
+)
+
+# Registration consumes the spec of a handler, kept before any is registered
+_APISPECS = {
+    name: copy.deepcopy(
+        getattr(Application.__wrapped__, name).__apispec__  # type: ignore
+    )
+    for _, name in ROUTES
+}
+
+Case = Tuple[str, Callable[[], Any], Optional[Callable[[], Any]], int]
+
+
+def _best(
+    call: Callable[[], Any],
+    setup: Optional[Callable[[], Any]] = None,
+    number: int = 1,
+) -> float:
+    """
+    Time calls, repeated to keep the best run.
+
+    Parameters:
+        call (Callable[[], Any]): timed call
+        setup (Optional[Callable[[], Any]]): untimed call before every run
+        number (int): calls per run
+
+    Returns:
+        best time per call in microseconds
+    """
+    best = float("inf")
+    for _ in range(REPEAT):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def _router_cases() -> List[Case]:
+    """
+    Get router lookup case, worst case path of the last route.
+
+    Returns:
+        name, call, setup and calls per run
+    """
+    router = Router()
+    path = _build(router, ROUTE_COUNT)
+    return [
+        (
+            f"router.match[{ROUTE_COUNT}]",
+            lambda: router.match("GET", path),
+            None,
+            10000,
+        )
+    ]
+
+
+def _schema_cases() -> List[Case]:
+    """
+    Get compiled `StudentSchema` load and dump cases.
+
+    Returns:
+        name, call, setup and calls per run
+    """
+    compiled = compile_schema(StudentSchema)
+    cases: List[Case] = []
+    for count in STUDENT_COUNTS:
+        data = _students(count)
+        students = compiled.load(data, many=True)
+        number = max(1000 // count, 3)
+        cases.append(
+            (
+                f"schema.load[{count}]",
+                lambda data=data: compiled.load(data, many=True),
+                None,
+                number,
+            )
+        )
+        cases.append(
+            (
+                f"schema.dump[{count}]",
+                lambda students=students: compiled.dump(students, many=True),
+                None,
+                number,
+            )
+        )
+    return cases
+
+
+def _openapi_cases() -> List[Case]:
+    """
+    Get case registering the application routes and generating the spec.
+
+    Returns:
+        name, call, setup and calls per run
+    """
+    state: Dict[str, Any] = {}
+
+    def setup() -> None:
+        state["openapi"] = OpenApi.__wrapped__()  # type: ignore
+        state["handlers"] = [
+            (path, _handler(name)) for path, name in ROUTES
+        ]
+
+    def call() -> None:
+        openapi = state["openapi"]
+        for path, handler in state["handlers"]:
+            openapi.register(path, handler)
+        openapi.generate_spec()
+
+    return [("openapi.register+generate_spec", call, setup, 1)]
+
+
+def _config_cases() -> List[Case]:
+    """
+    Get `Config.get` case, reading the snapshot of the settings.
+
+    Returns:
+        name, call, setup and calls per run
+    """
+    config = Config()
+    return [("config.get", lambda: config.get["API"]["url"], None, 100000)]
+
+
+def _handler(name: str) -> Callable[..., Any]:
+    """
+    Create handler of the application with an unregistered spec.
+
+    Parameters:
+        name (str): handler name
+
+    Returns:
+        handler function
+    """
+    def handler(*args: Any, **kwargs: Any) -> Any:
+        return getattr(Application(), name)(*args, **kwargs)
+
+    handler.__name__ = name
+    handler.__apispec__ = copy.deepcopy(_APISPECS[name])  # type: ignore
+    return handler
+
+
+def run(selected: Sequence[str] = ()) -> Dict[str, float]:
+    """
+    Run the benchmark cases.
+
+    Parameters:
+        selected (Sequence[str]): run only cases whose name contains one of
+            these, all cases if empty
+
+    Returns:
+        microseconds per call by case name, end-to-end requests by median
+    """
+    def wanted(name: str) -> bool:
+        return not selected or any(part in name for part in selected)
+
+    results: Dict[str, float] = {}
+    for cases in (_router_cases, _schema_cases, _openapi_cases, _config_cases):
+        for name, call, setup, number in cases():
+            if wanted(name):
+                results[name] = _best(call, setup, number)
+                print(f"{name:<34}{results[name]:>14.2f}")
+
+    # Serves the application, last as it registers the handlers
+    if wanted("pipeline."):
+        for operation, result in pipeline_benchmark.run().items():
+            name = f"pipeline.{operation}"
+            results[name] = result["p50"] * 1000
+            print(f"{name:<34}{results[name]:>14.2f}")
+
+    return results
+
+
+def compare(
+    results: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float = THRESHOLD,
+) -> List[Tuple[str, float, float]]:
+    """
+    Find cases slower than the baseline by more than the threshold.
+
+    Parameters:
+        results (Dict[str, float]): microseconds per call by case name
+        baseline (Dict[str, float]): baseline results
+        threshold (float): tolerated slowdown, 0.2 for 20 percent
+
+    Returns:
+        name, baseline and current time of regressed cases
+    """
+    return [
+        (name, baseline[name], usec)
+        for name, usec in results.items()
+        if name in baseline and usec > baseline[name] * (1 + threshold)
+    ]
+
+
+def save(results: Dict[str, float], path: Path) -> None:
+    """
+    Write results with the platform they were measured on.
+
+    Parameters:
+        results (Dict[str, float]): microseconds per call by case name
+        path (Path): JSON file
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "unit": "usec",
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def load(path: Path) -> Dict[str, float]:
+    """
+    Read results written by `save`.
+
+    Parameters:
+        path (Path): JSON file
+
+    Returns:
+        microseconds per call by case name, empty if the file is missing
+    """
+    if not path.is_file():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the suite, write results and report regressions.
+
+    Parameters:
+        argv (Optional[Sequence[str]]): command line arguments
+
+    Returns:
+        exit status, 1 when a case regressed or there is no baseline
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument("-k", dest="selected", action="append", default=[])
+    parser.add_argument("--output", type=Path, default=OUTPUT)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<34}{'usec/call':>14}")
+    results = run(args.selected)
+    save(results, args.output)
+    print(f"Results written to {args.output}")
+
+    if args.save_baseline:
+        save(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load(args.baseline)
+    if not baseline:
+        print(
+            f"No baseline at {args.baseline}, save one with --save-baseline"
+        )
+        return 1
+
+    print(f"\n{'case':<34}{'baseline':>12}{'current':>12}{'change':>9}")
+    for name, usec in results.items():
+        if name in baseline:
+            change = usec / baseline[name] - 1
+            print(
+                f"{name:<34}{baseline[name]:>12.2f}{usec:>12.2f}"
+                f"{change:>+9.1%}"
+            )
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, before, after in regressions:
+        print(
+            f"Regression: {name} {before:.2f} -> {after:.2f} usec, more "
+            f"than {args.threshold:.0%} slower"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
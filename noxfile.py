@@ -525,6 +525,45 @@ def coverage_lcov_report(_session: Session) -> None:
     )
 
 
+@session(python=PYTHON_VERSIONS[0])
+def benchmark(_session: Session) -> None:
+    """Run the benchmark suite and compare results with the baseline.
+
+    Fails when a case is slower than the baseline by more than the
+    threshold or when there is no baseline,
+    `nox -s benchmark -- --save-baseline` keeps the results as the new
+    baseline.
+
+    Parameters:
+        _session (Session): Session object
+
+    Return:
+        None
+    """
+    args = _session.posargs or []
+    _session.install(".")
+    _session.run(
+        "python",
+        "-m",
+        "benchmarks.suite",
+        "--output",
+        f"{REPORTS_FOLDER}/benchmark.json",
+        *args,
+    )
+
+    # Print status
+    output.write(
+        _full_msg(
+            start_msg="benchmark",
+            postfix='',
+            end_msg=SESSION_PASSED_STATUS,
+            end_color=SESSION_PASSED_COLOR,
+            use_color=True,
+            cols=80,
+        ),
+    )
+
+
 @session(python=PYTHON_VERSIONS[0])
 def xdoctest(_session: Session) -> None:
     """Run examples with xdoctest.
@@ -1 +1,2 @@
 """Main Package."""
+from ._version import __version__
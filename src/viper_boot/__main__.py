@@ -1,270 +1,147 @@
 """Main Application Handler."""
+import importlib
 import json
-import webbrowser
-from typing import Any
+import sys
+from contextlib import nullcontext
+from typing import Protocol
+from typing import Tuple
+from typing import TYPE_CHECKING
+from typing import cast
 
 import click
 
-from .config.config import Config
-from .controllers.student_controller import StudentController
-from .openapi_docs.decorators import openapi
-from .openapi_docs.decorators import response_schema
-from .openapi_docs.open_api import OpenApi
-from .utils.banner import Banner
-from .utils.decorators import singleton
-
-
-# Include all controllers
-student_controller = StudentController()
-(
-    PersonSchema,
-    StudentSchema,
-    StudentIdSchema,
-    StudentParamsSchema,
-) = student_controller.schemas
-
-
-@singleton
-class _Application:
-    """Main application class runner."""
-
-    _openapi: Any
-
-    def __init__(self) -> None:
-        """Application Runner."""
-        # Set application config environment
-        Config().environment = "development"
-
-        # Print project banner
-        Banner.paste()
-
-        # Register APIs with OpenAPI spec
-        self._openapi = OpenApi()
-        self._openapi.register("/api/v1/students", self.get_students)
-        self._openapi.register("/api/v1/student/{id}", self.get_student_by_id)
-        self._openapi.register("/api/v1/student", self.create_student)
-        self._openapi.register("/api/v1/student/{id}", self.update_student)
-        self._openapi.register("/api/v1/student/{id}", self.delete_student)
-
-    @property
-    def settings(self) -> str:
-        """
-        Getter method for application settings.
-
-        Returns:
-            Application settings
-        """
-        return self.settings
-
-    def openapi_serve(self) -> None:
-        """Serve OpenAPI docs."""
-        # Generate Open API docs
-        self._openapi.generate_doc()
-
-        # Serve Open API docs
-        webbrowser.open("http://127.0.0.1:3000", new=2)
-        self._openapi.serve_doc()
-
-    # Get all students API
-    # path="/api/v1/students"
-    # --------------------
-    @openapi(
-        tags=["Student"],
-        method="GET",
-        summary="Get all students",
-        description="Get all student from database",
-        responses={
-            200: {
-                "description": "Ok. Get students",
-                "content": {
-                    "application/json": {
-                        "schema": {"type": "array", "items": StudentSchema}
-                    }
-                },
-                "links": {
-                    "GetStudentById": {
-                        "operationRef": "/api/student/{id}",
-                        "parameters": {"id": "$response.body#/id"},
-                        "description": "The `id` value returned in the "
-                        "response can be used as "
-                        "the `id` parameter "
-                        "in `GET /api/student/{id}`.",
-                    }
-                },
-            },
-            400: {"description": "Bad request"},
-            401: {"description": "Unauthorized"},
-            422: {"description": "Validation error"},
-            500: {"description": "Server error"},
-        },
-    )  # type: ignore
-    @response_schema(StudentSchema)  # type: ignore
-    def get_students(self) -> None:
-        """Endpoint handler for student API, return all students."""
-        response = student_controller.get_all()
-        print(json.dumps(response, indent=2))
-
-    # Get student by id API
-    # path="/api/v1/student/{id}"
-    # ---------------------
-    @openapi(
-        tags=["Student"],
-        method="GET",
-        summary="Get student by id",
-        description="Get student by id from database",
-        parameters=[
-            {
-                "in": "path",
-                "name": "id",
-                "schema": StudentParamsSchema,
-                "required": "true",
-            }
-        ],
-        responses={
-            200: {
-                "description": "Ok. Get student",
-                "content": {"application/json": {"schema": StudentSchema}},
-            },
-            400: {"description": "Bad request"},
-            401: {"description": "Unauthorized"},
-            422: {"description": "Validation error"},
-            500: {"description": "Server error"},
-        },
-    )  # type: ignore
-    @response_schema(StudentSchema)  # type: ignore
-    def get_student_by_id(self, _id: str) -> None:
-        """
-        Endpoint handler for student API, return particular students.
-
-        Parameters:
-            _id (str): student id
-        """
-        response = student_controller.get()
-        print(json.dumps(response, indent=2))
-
-    # Create student API
-    # path="/api/v1/student"
-    # ------------------
-    @openapi(
-        tags=["Student"],
-        method="POST",
-        summary="Create student",
-        description="Create new student in database",
-        requestBody={
-            "description": "Optional description in *Markdown*",
-            "required": True,
-            "content": {"application/json": {"schema": PersonSchema}},
-        },
-        responses={
-            201: {
-                "description": "Ok. Create student",
-                "content": {"application/json": {"schema": StudentIdSchema}},
-            },
-            400: {"description": "Bad request"},
-            401: {"description": "Unauthorized"},
-            422: {"description": "Validation error"},
-            500: {"description": "Server error"},
-        },
-    )  # type: ignore
-    # For OpenAPI >=3 we don"t need request_schema
-    # @request_schema(PersonSchema)  # type: ignore
-    def create_student(self, request: Any) -> None:
-        """
-        Endpoint handler for student API, create student.
-
-        Parameters:
-            request (Any): student request object
-        """
-        response = student_controller.post(request)
-        print(json.dumps(response, indent=2))
-
-    # Put student by id API
-    # path="/api/v1/student/{id}"
-    # ---------------------
-    @openapi(
-        tags=["Student"],
-        method="PATCH",
-        summary="Update student by id",
-        description="Update student by id in database",
-        parameters=[
-            {
-                "in": "path",
-                "name": "id",
-                "schema": StudentParamsSchema,
-                "required": "true",
-            }
-        ],
-        responses={
-            200: {
-                "description": "Ok. Student updated",
-                "content": {"application/json": {"schema": StudentSchema}},
-            },
-            400: {"description": "Bad request"},
-            401: {"description": "Unauthorized"},
-            422: {"description": "Validation error"},
-            500: {"description": "Server error"},
-        },
-    )  # type: ignore
-    @response_schema(StudentSchema)  # type: ignore
-    def update_student(self, _id: str, request: Any) -> None:
-        """
-        Endpoint handler for student API, update particular students.
-
-        Parameters:
-            _id (str): student id
-            request (Any): student object
-        """
-        response = student_controller.patch(_id, request)
-        print(json.dumps(response, indent=2))
-
-    # Delete student by id API
-    # path="/api/v1/student/{id}"
-    # ---------------------
-    @openapi(
-        tags=["Student"],
-        method="DELETE",
-        summary="Delete student by id",
-        description="Delete student by id from database",
-        parameters=[
-            {
-                "in": "path",
-                "name": "id",
-                "schema": StudentParamsSchema,
-                "required": "true",
-            }
-        ],
-        responses={
-            204: {"description": "Ok. Student deleted"},
-            400: {"description": "Bad request"},
-            401: {"description": "Unauthorized"},
-            422: {"description": "Validation error"},
-            500: {"description": "Server error"},
-        },
-    )  # type: ignore
-    def delete_student(self, _id: str) -> None:
-        """
-        Endpoint handler for student API, delete particular students.
-
-        Parameters:
-            _id (str): student id
-        """
-        response = student_controller.delete(_id)
-        print(json.dumps(response, indent=2))
-
-
-@click.command()
+from .utils.lazy_import import ImportProfiler
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .server.asgi import AsgiApplication
+
+
+class _Application(Protocol):
+    """Interface of `Application` used by the command."""
+
+    def asgi(self) -> "AsgiApplication":
+        """Get ASGI application."""
+
+    def openapi_serve(
+        self,
+        server: str = "http",
+        workers: int = 1,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        watch_config: bool = False,
+    ) -> None:
+        """Serve OpenAPI docs and APIs."""
+
+
+def _application() -> _Application:
+    """
+    Import and initialise the application.
+
+    Controllers, services, schemas and the OpenAPI spec are imported
+    here, not when the command is loaded, so `--help` and `--version`
+    start without them.
+
+    Returns:
+        application
+    """
+    module = importlib.import_module(".application", __package__)
+    return cast(_Application, module.Application())
+
+
+def create_asgi_app() -> "AsgiApplication":
+    """
+    ASGI application factory, e.g. `uvicorn --factory`.
+
+    Returns:
+        ASGI application
+    """
+    return _application().asgi()
+
+
+@click.group(invoke_without_command=True)
 @click.version_option()
-def main() -> None:
-    """viper_boot."""
-    _Application()
+@click.option(
+    "--server",
+    type=click.Choice(["http", "asyncio"]),
+    default="http",
+    show_default=True,
+    help="Server to run, asyncio serves concurrent keep-alive connections.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Pre-forked worker processes sharing the listening socket.",
+)
+@click.option(
+    "--max-requests",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Recycle a worker after serving this many requests, 0 to never.",
+)
+@click.option(
+    "--max-requests-jitter",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="Random extra requests per worker before it is recycled.",
+)
+@click.option(
+    "--watch-config",
+    is_flag=True,
+    default=False,
+    help="Reload settings files on change, without restarting workers.",
+)
+@click.option(
+    "--import-profile",
+    is_flag=True,
+    default=False,
+    help="Print the time spent importing each module at startup.",
+)
+@click.pass_context
+# Click passes every option as an argument
+def main(  # pylint: disable=R0913,R0917
+    context: click.Context,
+    server: str,
+    workers: int,
+    max_requests: int,
+    max_requests_jitter: int,
+    watch_config: bool,
+    import_profile: bool,
+) -> None:
+    """
+    viper_boot.
+
+    Serves the registered APIs without a command.
+
+    Parameters:
+        context (click.Context): command context
+        server (str): server to run
+        workers (int): number of worker processes
+        max_requests (int): requests per worker before recycling
+        max_requests_jitter (int): random extra requests per worker
+        watch_config (bool): reload settings files on change
+        import_profile (bool): print import times of the application
+    """
+    if context.invoked_subcommand is not None:
+        return
+
+    with ImportProfiler() if import_profile else nullcontext() as profiler:
+        application = _application()
+    if profiler is not None:
+        profiler.report(sys.stderr)
 
     # Initialise, register and serve OpenAPI docs.
-    _Application().openapi_serve()
+    application.openapi_serve(
+        server, workers, max_requests, max_requests_jitter, watch_config
+    )
 
     # Invoking APIs manually
-    # _Application().get_student_by_id(uuid.uuid4().hex)
-    # _Application().get_students()
-    # _Application().create_student(
+    # application.get_student_by_id(uuid.uuid4().hex)
+    # application.get_students()
+    # application.create_student(
     #     {
     #         "first_name": "James",
     #         "last_name": "Smith",
@@ -272,7 +149,7 @@ def main() -> None:
     #         "gender": GenderEnum.MALE,
     #     }
     # )
-    # _Application().update_student(
+    # application.update_student(
     #     uuid.uuid4().hex,
     #     {
     #         "first_name": "James",
@@ -281,7 +158,178 @@ def main() -> None:
     #         "gender": GenderEnum.MALE.name,
     #     }
     # )
-    # _Application().delete_student(uuid.uuid4().hex)
+    # application.delete_student(uuid.uuid4().hex)
+
+
+@main.command(
+    name="stub-upstream", help="Serve a local stub of the upstream API."
+)
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", type=int, default=8099, show_default=True)
+@click.option(
+    "--latency",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Milliseconds before every response.",
+)
+@click.option(
+    "--jitter",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Random extra milliseconds before every response.",
+)
+@click.option(
+    "--error-rate",
+    type=click.FloatRange(min=0, max=1),
+    default=0.0,
+    show_default=True,
+    help="Share of requests failing with --error-status.",
+)
+@click.option(
+    "--error-status",
+    type=click.IntRange(min=400, max=599),
+    default=503,
+    show_default=True,
+)
+@click.option(
+    "--payload-size",
+    type=click.IntRange(min=0),
+    default=256,
+    show_default=True,
+    help="Approximate response body size in bytes.",
+)
+# Click passes every option as an argument
+def stub_upstream(  # pylint: disable=R0913,R0917
+    host: str,
+    port: int,
+    latency: float,
+    jitter: float,
+    error_rate: float,
+    error_status: int,
+    payload_size: int,
+) -> None:
+    """
+    Serve a local stub of the upstream API.
+
+    Parameters:
+        host (str): interface to bind
+        port (int): port to bind
+        latency (float): milliseconds before every response
+        jitter (float): random extra milliseconds
+        error_rate (float): share of requests failing
+        error_status (int): HTTP status of failed requests
+        payload_size (int): response body size in bytes
+    """
+    # Tooling is imported on use, it is not needed to start the server
+    # pylint: disable=import-outside-toplevel
+    from .server.stub_upstream import StubUpstream
+
+    StubUpstream(
+        host,
+        port,
+        latency=latency / 1000,
+        jitter=jitter / 1000,
+        error_rate=error_rate,
+        error_status=error_status,
+        payload_size=payload_size,
+    ).serve()
+
+
+@main.command(
+    help="Send requests to a server and report throughput and latency."
+)
+@click.option(
+    "--url",
+    default="http://127.0.0.1:3000",
+    show_default=True,
+    help="Server to load.",
+)
+@click.option(
+    "--rate",
+    type=click.FloatRange(min=0),
+    default=0.0,
+    show_default=True,
+    help="Requests per second, 0 for closed-loop --concurrency clients.",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Clients with a keep-alive connection each.",
+)
+@click.option(
+    "--duration",
+    type=click.FloatRange(min=0, min_open=True),
+    default=10.0,
+    show_default=True,
+    help="Seconds to send requests.",
+)
+@click.option(
+    "--request",
+    "requests",
+    multiple=True,
+    metavar="'METHOD PATH'",
+    help="Request of the mix, repeatable, defaults to every student API "
+    "operation. `{id}` is replaced by a new student id.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    default=False,
+    help="Print the report as JSON.",
+)
+# Click passes every option as an argument
+def load(  # pylint: disable=R0913,R0917
+    url: str,
+    rate: float,
+    concurrency: int,
+    duration: float,
+    requests: Tuple[str, ...],
+    as_json: bool,
+) -> None:
+    """
+    Send requests to a server and report throughput and latency.
+
+    Parameters:
+        url (str): server URL
+        rate (float): requests per second, 0 for closed-loop
+        concurrency (int): number of clients
+        duration (float): seconds to send requests
+        requests (Tuple[str, ...]): `METHOD PATH` of the requests
+        as_json (bool): print the report as JSON
+    """
+    # Tooling is imported on use, it is not needed to start the server
+    # pylint: disable=import-outside-toplevel
+    from .utils.load_generator import LoadGenerator
+    from .utils.load_generator import LoadRequest
+    from .utils.load_generator import STUDENT_REQUESTS
+
+    mix = []
+    for request in requests:
+        method, _, path = request.strip().partition(" ")
+        if not path.strip().startswith("/"):
+            raise click.BadParameter(
+                f"expected 'METHOD PATH', got {request!r}",
+                param_hint="--request",
+            )
+        mix.append(LoadRequest(method.upper(), path.strip()))
+
+    mode = f"{rate:g} requests/s" if rate else "closed-loop"
+    click.echo(
+        f"Loading {url} for {duration:g}s, {mode}, {concurrency} clients",
+        err=as_json,
+    )
+    report = LoadGenerator(
+        url, mix or STUDENT_REQUESTS, concurrency, rate, duration
+    ).run()
+    if as_json:
+        click.echo(json.dumps(report.as_dict(), indent=2))
+    else:
+        report.write(sys.stdout)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,3 @@
+"""API Version, stamped at packaging time."""
+# Bumped by commitizen with the release tag, see `version_files`
+__version__ = "0.0.1"
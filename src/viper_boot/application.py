@@ -0,0 +1,446 @@
+"""Application Handlers."""
+import webbrowser
+from typing import Any
+from urllib.parse import urlencode
+
+from .config.config import Config
+from .config.config_watcher import watched
+from .controllers.student_controller import StudentController
+from .openapi_docs.decorators import openapi
+from .openapi_docs.decorators import request_schema
+from .openapi_docs.decorators import response_schema
+from .openapi_docs.open_api import OpenApi
+from .schemas import compile_schema
+from .schemas import PersonSchema
+from .schemas import StudentIdSchema
+from .schemas import StudentIdsSchema
+from .schemas import StudentPageParamsSchema
+from .schemas import StudentParamsSchema
+from .schemas import StudentSchema
+from .server.asgi import AsgiApplication
+from .server.dispatcher import Response
+from .server.workers import Arbiter
+from .services.base_student_service import CACHE
+from .utils.banner import Banner
+from .utils.decorators import singleton
+from .utils.json_encoder import create_json_encoder
+from .utils.metrics import METRICS
+from .utils.profiling import PROFILER
+from .utils.tracing import TRACER
+
+
+# Include all controllers
+student_controller = StudentController()
+
+
+@singleton
+class Application:
+    """Main application class runner."""
+
+    _openapi: Any
+
+    def __init__(self) -> None:
+        """Application Runner."""
+        # Set application config environment
+        Config().environment = "development"
+
+        # Encode JSON responses with the configured backend
+        Response.encoder = create_json_encoder(Config().get.get("JSON"))
+        Config().subscribe(
+            lambda settings: setattr(
+                Response, "encoder", create_json_encoder(settings.get("JSON"))
+            )
+        )
+
+        # Time requests per operation, served at `/metrics`
+        METRICS.configure(Config().get.get("METRICS"))
+        Config().subscribe(
+            lambda settings: METRICS.configure(settings.get("METRICS"))
+        )
+        METRICS.add_collector(
+            "viper_boot_cache",
+            CACHE.stats,
+            counters=("hits", "misses", "evictions", "expirations"),
+        )
+
+        # Trace sampled requests, exported to a local file or collector
+        TRACER.configure(Config().get.get("TRACING"))
+        Config().subscribe(
+            lambda settings: TRACER.configure(settings.get("TRACING"))
+        )
+
+        # Profile requests asking for it, and the process on SIGUSR2
+        PROFILER.configure(Config().get.get("PROFILING"))
+        Config().subscribe(
+            lambda settings: PROFILER.configure(settings.get("PROFILING"))
+        )
+
+        # Print project banner
+        Banner.paste()
+
+        # Register APIs with OpenAPI spec
+        self._openapi = OpenApi()
+        self._openapi.register("/api/v1/students", self.get_students)
+        self._openapi.register(
+            "/api/v1/students:batchGet", self.get_students_batch
+        )
+        self._openapi.register("/api/v1/student/{id}", self.get_student_by_id)
+        self._openapi.register("/api/v1/student", self.create_student)
+        self._openapi.register("/api/v1/student/{id}", self.update_student)
+        self._openapi.register("/api/v1/student/{id}", self.delete_student)
+
+    @property
+    def settings(self) -> str:
+        """
+        Getter method for application settings.
+
+        Returns:
+            Application settings
+        """
+        return self.settings
+
+    def openapi_serve(
+        self,
+        server: str = "http",
+        workers: int = 1,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        watch_config: bool = False,
+    ) -> None:
+        """
+        Serve OpenAPI docs and APIs.
+
+        Parameters:
+            server (str): `http` for blocking HTTP server, `asyncio` for
+                concurrent asyncio server
+            workers (int): number of pre-forked worker processes, 1 serves
+                in the current process
+            max_requests (int): requests a worker serves before it is
+                recycled, 0 to never recycle
+            max_requests_jitter (int): random extra requests per worker
+            watch_config (bool): reload settings files when they change,
+                watched by every worker process
+        """
+        # Generate Open API docs
+        self._openapi.generate_doc()
+
+        # Start shared cache before the workers are forked
+        CACHE.start()
+
+        # Sample the serving process on SIGUSR2, inherited by the workers
+        PROFILER.install_signal()
+
+        serve = (
+            self._openapi.serve_asgi
+            if server == "asyncio"
+            else self._openapi.serve_doc
+        )
+        if watch_config:
+            serve = watched(serve, Config())
+
+        # Serve Open API docs
+        webbrowser.open("http://127.0.0.1:3000", new=2)
+        if workers > 1:
+            host, port = self._openapi.address
+            Arbiter(
+                serve,
+                host,
+                port,
+                workers,
+                max_requests=max_requests,
+                max_requests_jitter=max_requests_jitter,
+            ).run()
+        else:
+            serve()
+
+    def asgi(self) -> AsgiApplication:
+        """
+        Create ASGI application serving OpenAPI docs and APIs.
+
+        Returns:
+            ASGI application
+        """
+        self._openapi.render_index()
+        PROFILER.install_signal()
+        return AsgiApplication(self._openapi.dispatcher)
+
+    # Get all students API
+    # path="/api/v1/students"
+    # --------------------
+    @openapi(
+        tags=["Student"],
+        method="GET",
+        summary="Get all students",
+        description="Get all student from database. With `cursor` or "
+        "`limit` one page is returned, the `Link` header points to the next "
+        "page. With `stream` all students are streamed.",
+        responses={
+            200: {
+                "description": "Ok. Get students",
+                "content": {
+                    "application/json": {
+                        "schema": {"type": "array", "items": StudentSchema}
+                    }
+                },
+                "links": {
+                    "GetStudentById": {
+                        "operationRef": "/api/student/{id}",
+                        "parameters": {"id": "$response.body#/id"},
+                        "description": "The `id` value returned in the "
+                        "response can be used as "
+                        "the `id` parameter "
+                        "in `GET /api/student/{id}`.",
+                    }
+                },
+            },
+            400: {"description": "Bad request"},
+            401: {"description": "Unauthorized"},
+            422: {"description": "Validation error"},
+            500: {"description": "Server error"},
+        },
+    )  # type: ignore
+    @request_schema(StudentPageParamsSchema, location="query")  # type: ignore  # noqa: E501
+    @response_schema(StudentSchema)  # type: ignore
+    def get_students(self, **query: str) -> Any:
+        """
+        Endpoint handler for student API, return all students.
+
+        Parameters:
+            **query (str): `cursor`, `limit`, `stream` and `pretty` query
+                parameters
+
+        Returns:
+            API response
+        """  # noqa: RST210
+        params = compile_schema(StudentPageParamsSchema).load(query)
+        limit = params.get("limit", 100)
+        pretty = params.get("pretty", False)
+
+        if "stream" in params:
+            return Response.json_stream(
+                200,
+                student_controller.iter_all(limit),
+                ndjson=params["stream"] == "ndjson",
+                batch_size=limit,
+                pretty=pretty,
+            )
+
+        if "cursor" in params or "limit" in params:
+            students, next_cursor = student_controller.get_page(
+                params.get("cursor"), limit
+            )
+            response = Response.json(200, students, pretty)
+            if next_cursor is not None:
+                link = urlencode({"cursor": next_cursor, "limit": limit})
+                response.headers.append(
+                    ("Link", f'</api/v1/students?{link}>; rel="next"')
+                )
+            return response
+
+        response = student_controller.get_all()
+        return response
+
+    # Get students by ids API
+    # path="/api/v1/students:batchGet"
+    # --------------------
+    @openapi(
+        tags=["Student"],
+        method="POST",
+        summary="Get students by ids",
+        description="Get up to 1000 students by id from database in one "
+        "request",
+        requestBody={
+            "required": True,
+            "content": {"application/json": {"schema": StudentIdsSchema}},
+        },
+        responses={
+            200: {
+                "description": "Ok. Get students, unknown ids are omitted",
+                "content": {
+                    "application/json": {
+                        "schema": {"type": "array", "items": StudentSchema}
+                    }
+                },
+            },
+            400: {"description": "Bad request"},
+            401: {"description": "Unauthorized"},
+            422: {"description": "Validation error"},
+            500: {"description": "Server error"},
+        },
+    )  # type: ignore
+    @response_schema(StudentSchema)  # type: ignore
+    def get_students_batch(self, request: Any) -> Any:
+        """
+        Endpoint handler for student API, return students by ids.
+
+        Parameters:
+            request (Any): student ids request object
+
+        Returns:
+            API response
+        """
+        # Deserializing request body
+        ids = compile_schema(StudentIdsSchema).load(request)["ids"]
+        response = student_controller.get_many(ids)
+        return response
+
+    # Get student by id API
+    # path="/api/v1/student/{id}"
+    # ---------------------
+    @openapi(
+        tags=["Student"],
+        method="GET",
+        summary="Get student by id",
+        description="Get student by id from database",
+        parameters=[
+            {
+                "in": "path",
+                "name": "id",
+                "schema": StudentParamsSchema,
+                "required": "true",
+            }
+        ],
+        responses={
+            200: {
+                "description": "Ok. Get student",
+                "content": {"application/json": {"schema": StudentSchema}},
+            },
+            400: {"description": "Bad request"},
+            401: {"description": "Unauthorized"},
+            422: {"description": "Validation error"},
+            500: {"description": "Server error"},
+        },
+    )  # type: ignore
+    @response_schema(StudentSchema)  # type: ignore
+    def get_student_by_id(self, _id: str) -> Any:
+        """
+        Endpoint handler for student API, return particular students.
+
+        Parameters:
+            _id (str): student id
+
+        Returns:
+            API response
+        """
+        response = student_controller.get(_id)
+        return response
+
+    # Create student API
+    # path="/api/v1/student"
+    # ------------------
+    @openapi(
+        tags=["Student"],
+        method="POST",
+        summary="Create student",
+        description="Create new student in database",
+        requestBody={
+            "description": "Optional description in *Markdown*",
+            "required": True,
+            "content": {"application/json": {"schema": PersonSchema}},
+        },
+        responses={
+            201: {
+                "description": "Ok. Create student",
+                "content": {"application/json": {"schema": StudentIdSchema}},
+            },
+            400: {"description": "Bad request"},
+            401: {"description": "Unauthorized"},
+            422: {"description": "Validation error"},
+            500: {"description": "Server error"},
+        },
+    )  # type: ignore
+    # For OpenAPI >=3 we don"t need request_schema
+    # @request_schema(PersonSchema)  # type: ignore
+    def create_student(self, request: Any) -> Any:
+        """
+        Endpoint handler for student API, create student.
+
+        Parameters:
+            request (Any): student request object
+
+        Returns:
+            API response
+        """
+        # Validating request body, sent on as a wire record
+        person = compile_schema(PersonSchema).validate(request)
+        response = student_controller.post(person)
+        return response
+
+    # Put student by id API
+    # path="/api/v1/student/{id}"
+    # ---------------------
+    @openapi(
+        tags=["Student"],
+        method="PATCH",
+        summary="Update student by id",
+        description="Update student by id in database",
+        parameters=[
+            {
+                "in": "path",
+                "name": "id",
+                "schema": StudentParamsSchema,
+                "required": "true",
+            }
+        ],
+        responses={
+            200: {
+                "description": "Ok. Student updated",
+                "content": {"application/json": {"schema": StudentSchema}},
+            },
+            400: {"description": "Bad request"},
+            401: {"description": "Unauthorized"},
+            422: {"description": "Validation error"},
+            500: {"description": "Server error"},
+        },
+    )  # type: ignore
+    @response_schema(StudentSchema)  # type: ignore
+    def update_student(self, _id: str, request: Any) -> Any:
+        """
+        Endpoint handler for student API, update particular students.
+
+        Parameters:
+            _id (str): student id
+            request (Any): student object
+
+        Returns:
+            API response
+        """
+        response = student_controller.patch(_id, request)
+        return response
+
+    # Delete student by id API
+    # path="/api/v1/student/{id}"
+    # ---------------------
+    @openapi(
+        tags=["Student"],
+        method="DELETE",
+        summary="Delete student by id",
+        description="Delete student by id from database",
+        parameters=[
+            {
+                "in": "path",
+                "name": "id",
+                "schema": StudentParamsSchema,
+                "required": "true",
+            }
+        ],
+        responses={
+            204: {"description": "Ok. Student deleted"},
+            400: {"description": "Bad request"},
+            401: {"description": "Unauthorized"},
+            422: {"description": "Validation error"},
+            500: {"description": "Server error"},
+        },
+    )  # type: ignore
+    def delete_student(self, _id: str) -> Any:
+        """
+        Endpoint handler for student API, delete particular students.
+
+        Parameters:
+            _id (str): student id
+
+        Returns:
+            API response
+        """
+        response = student_controller.delete(_id)
+        return response
@@ -1,2 +1,4 @@
 """Config Package."""
 from .config import Config
+from .config_watcher import ConfigWatcher
+from .config_watcher import watched
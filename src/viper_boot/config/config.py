@@ -1,6 +1,12 @@
 """Application Config Module."""
+import threading
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
 
 from dynaconf import Dynaconf
 
@@ -8,6 +14,8 @@
     singleton
 )
 
+from ..utils.tracing import TRACER
+
 PACKAGE_NAME = "viper_boot"
 
 
@@ -31,15 +39,40 @@ def __init__(self, env: str = "development") -> None:
         @see https://dynaconf.readthedocs.io/en/docs_223/guides/advanced_usage.html # noqa
         """
         self._environment = env
+        self.settings = self._create_settings()
+
+        # Resolved settings by environment, see `get`
+        self._snapshots: Dict[str, Mapping[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Mapping[str, Any]], None]] = []
+
+    @property
+    def files(self) -> List[Path]:
+        """
+        Getter method for settings files, in loading order.
+
+        Returns:
+            settings file paths, including missing optional files
+        """
+        return [
+            self._CONFIG_PATH / "settings.toml",  # Default settings
+            self._CONFIG_PATH / "settings_dev.toml",  # Dev settings
+            self._CONFIG_PATH / "settings_prd.toml",  # Prd settings
+            self._CONFIG_PATH / ".secrets.toml",  # Sensitive data (gitignored)
+        ]
+
+    def _create_settings(self) -> Dynaconf:
+        """
+        Create settings loading the settings files.
 
+        Returns:
+            settings of all environments
+        """
         # Create `settings` instance
         # More options on https://www.dynaconf.com/configuration/
-        self.settings = Dynaconf(
+        return Dynaconf(
             settings_files=[  # Paths or globs to any toml|yaml|ini|json|py
-                f"{self._CONFIG_PATH}/settings.toml",  # Default settings  # noqa
-                f"{self._CONFIG_PATH}/settings_dev.toml",  # Dev settings
-                f"{self._CONFIG_PATH}/settings_prd.toml",  # Prd settings
-                f"{self._CONFIG_PATH}/.secrets.toml"  # Sensitive data (gitignored)  # noqa
+                str(path) for path in self.files
             ],
 
             environments=True,  # Enable layered environments
@@ -58,14 +91,61 @@ def __init__(self, env: str = "development") -> None:
         # NOTE: On Dynaconf 4.0.0 all the above will be also possible as a pydantic schema :)  # noqa
 
     @property
-    def get(self) -> Any:
+    def get(self) -> Mapping[str, Any]:
         """
         Getter method for settings.
 
+        Settings of the environment are resolved once and cached as an
+        immutable snapshot, until `reload` is called.
+
         Returns:
             Application settings
         """
-        return self.settings.from_env(self._environment).as_dict()
+        environment = self._environment
+        snapshot = self._snapshots.get(environment)
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshots.get(environment)
+                if snapshot is None:
+                    snapshot = _freeze(
+                        self.settings.from_env(environment).as_dict()
+                    )
+                    self._snapshots[environment] = snapshot
+
+        return snapshot
+
+    def reload(self) -> None:
+        """
+        Read settings files again and swap in the new snapshot.
+
+        The files are parsed into new settings first, readers keep the
+        previous snapshot until it is swapped, then listeners are called
+        with the new snapshot. Settings are not swapped when parsing fails.
+        """
+        with TRACER.span("Config.reload"):
+            environment = self._environment
+            settings = self._create_settings()
+            snapshot = _freeze(settings.from_env(environment).as_dict())
+            with self._lock:
+                self.settings = settings
+                self._snapshots = {environment: snapshot}
+                listeners = list(self._listeners)
+
+            for listener in listeners:
+                listener(snapshot)
+
+    def subscribe(
+        self, listener: Callable[[Mapping[str, Any]], None]
+    ) -> None:
+        """
+        Call listener with the new settings after every reload.
+
+        Parameters:
+            listener (Callable[[Mapping[str, Any]], None]): e.g. applies
+                new pool sizes to a client
+        """
+        with self._lock:
+            self._listeners.append(listener)
 
     @property
     def environment(self) -> Any:
@@ -86,3 +166,22 @@ def environment(self, value: str) -> None:
             value (str): value to set
         """
         self._environment = value
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Make settings value immutable.
+
+    Parameters:
+        value (Any): settings value
+
+    Returns:
+        read-only mapping for tables, tuple for arrays, value otherwise
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType(
+            {key: _freeze(item) for key, item in value.items()}
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
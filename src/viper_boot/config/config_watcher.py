@@ -0,0 +1,241 @@
+"""Settings Files Watcher."""
+import ctypes
+import ctypes.util
+import os
+import select
+import threading
+import traceback
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+# inotify flags, see `man inotify`
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_IN_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+)
+
+Signature = Dict[Path, Optional[Tuple[int, int]]]
+
+
+class ConfigWatcher:
+    """
+    Reload config when its settings files change.
+
+    A daemon thread waits for changes of the settings directory with
+    inotify where available, else it polls the files every `interval`
+    seconds. Files are re-parsed on the watcher thread and the settings
+    snapshot is swapped atomically, so request threads never block on
+    parsing. Invalid files are reported and the previous snapshot is kept.
+
+    Threads do not survive `fork`, so every worker process starts its own
+    watcher.
+    """
+
+    def __init__(
+        self, config: Any, interval: float = 1.0, debounce: float = 0.2
+    ) -> None:
+        """
+        Initialise the watcher.
+
+        Parameters:
+            config (Any): `Config` to reload
+            interval (float): seconds between polls, and between stop flag
+                checks with inotify
+            debounce (float): seconds to wait for editors to finish writing
+                before files are re-parsed
+        """
+        self._config = config
+        self._interval = interval
+        self._debounce = debounce
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._signature: Signature = {}
+
+    def start(self) -> None:
+        """Start watching settings files in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        # Watch before the signature is taken, so no change is missed
+        self._stopping.clear()
+        inotify = _Inotify.create(self._config.files[0].parent)
+        self._signature = self.signature()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(inotify,),
+            name="config-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and wait for the watcher thread."""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def signature(self) -> Signature:
+        """
+        Get modification time and size of the settings files.
+
+        Returns:
+            `(mtime_ns, size)` by path, None for missing files
+        """
+        signature: Signature = {}
+        for path in self._config.files:
+            try:
+                stat = path.stat()
+            except OSError:
+                signature[path] = None
+            else:
+                signature[path] = (stat.st_mtime_ns, stat.st_size)
+        return signature
+
+    def check(self) -> bool:
+        """
+        Reload config if settings files changed since the last check.
+
+        Returns:
+            True when config was reloaded
+        """
+        signature = self.signature()
+        if signature == self._signature:
+            return False
+
+        self._signature = signature
+        try:
+            self._config.reload()
+        except Exception:  # pylint: disable=broad-except
+            # Keep serving the previous settings until the files are fixed
+            print("Config reload failed, previous settings are kept")
+            traceback.print_exc()
+            return False
+
+        print(f"Config reloaded in process {os.getpid()}")
+        return True
+
+    def _run(self, inotify: Optional["_Inotify"]) -> None:
+        """
+        Wait for changes until stopped.
+
+        Parameters:
+            inotify (Optional[_Inotify]): directory watch, None to poll
+        """
+        try:
+            while not self._stopping.is_set():
+                if inotify is None:
+                    self._stopping.wait(self._interval)
+                elif not inotify.wait(self._interval):
+                    continue
+                elif self._stopping.wait(self._debounce):
+                    break
+                else:
+                    inotify.drain()
+
+                self.check()
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+
+class _Inotify:
+    """Linux inotify watch of a directory, via `ctypes`."""
+
+    def __init__(self, fd: int) -> None:
+        """
+        Initialise the watch.
+
+        Parameters:
+            fd (int): inotify file descriptor
+        """
+        self._fd = fd
+
+    @classmethod
+    def create(cls, directory: Path) -> Optional["_Inotify"]:
+        """
+        Watch directory entries being written, moved, created or deleted.
+
+        Parameters:
+            directory (Path): directory to watch
+
+        Returns:
+            watch, None where inotify is not available
+        """
+        name = ctypes.util.find_library("c")
+        if name is None:
+            return None
+        try:
+            libc = ctypes.CDLL(name, use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None  # Not Linux, or no inotify support in the C library
+        if fd < 0:
+            return None
+
+        watch = libc.inotify_add_watch(
+            fd, os.fsencode(directory), ctypes.c_uint32(_IN_MASK)
+        )
+        if watch < 0:
+            os.close(fd)
+            return None
+        return cls(fd)
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait for events.
+
+        Parameters:
+            timeout (float): seconds to wait
+
+        Returns:
+            True when events are pending
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        return bool(readable)
+
+    def drain(self) -> None:
+        """Discard pending events, files are compared by signature."""
+        while True:
+            try:
+                if not os.read(self._fd, 4096):
+                    return
+            except BlockingIOError:
+                return
+
+    def close(self) -> None:
+        """Close the inotify file descriptor."""
+        os.close(self._fd)
+
+
+def watched(target: Any, config: Any, **options: float) -> Any:
+    """
+    Wrap a serve function to watch settings files while it serves.
+
+    Parameters:
+        target (Any): serve function, e.g. run by every worker process
+        config (Any): `Config` to reload
+        **options (float): `ConfigWatcher` options
+
+    Returns:
+        serve function starting a watcher in the serving process
+    """  # noqa: RST210
+
+    def serve(*args: Any, **kwargs: Any) -> Any:
+        watcher = ConfigWatcher(config, **options)
+        watcher.start()
+        try:
+            return target(*args, **kwargs)
+        finally:
+            watcher.stop()
+
+    return serve
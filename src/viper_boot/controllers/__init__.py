@@ -1,2 +1,17 @@
 """Controllers Package."""
-from .student_controller import StudentController
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .async_student_controller import AsyncStudentController
+    from .student_controller import StudentController
+
+# Submodules are imported on first use, see `lazy_exports`
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncStudentController": ".async_student_controller",
+        "StudentController": ".student_controller",
+    },
+)
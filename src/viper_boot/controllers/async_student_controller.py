@@ -0,0 +1,140 @@
+"""Async Student Controller."""
+from typing import Any
+from typing import AsyncIterator
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from ..schemas import PersonSchema
+from ..services import AsyncStudentService
+from ..utils.decorators import traced
+from .base_student_controller import BaseStudentController
+
+
+@traced
+class AsyncStudentController(BaseStudentController):
+    """Non-blocking API controller for student."""
+
+    @staticmethod
+    async def get(_id: str = None) -> Any:
+        """
+        Endpoint handler for get API, returns all students.
+
+        Parameters:
+            _id (str) : student id
+
+        Returns:
+            (StudentSchema): API response
+        """
+        # Serializing Object
+        student = await AsyncStudentService.get(_id)
+        return AsyncStudentController._dump(student)
+
+    @staticmethod
+    async def get_all() -> Any:
+        """
+        Endpoint handler for get API, returns all students.
+
+        Returns:
+            (StudentSchema): API response
+        """
+        # Serializing Object
+        students = await AsyncStudentService.get_all()
+        return AsyncStudentController._dump_many(students)
+
+    @staticmethod
+    async def get_page(
+        cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Endpoint handler for paginated get API, returns page of students.
+
+        Parameters:
+            cursor (Optional[str]): cursor of the page, None for the first
+            limit (int): number of students per page
+
+        Returns:
+            (StudentSchema): API response and cursor of the next page
+        """
+        students, next_cursor = await AsyncStudentService.get_page(
+            cursor, limit
+        )
+
+        # Serializing Object
+        dumped = AsyncStudentController._dump_many(students)
+        return dumped, next_cursor
+
+    @staticmethod
+    async def iter_all(page_size: int = 100) -> AsyncIterator[Any]:
+        """
+        Endpoint handler for streamed get API, serializes students lazily.
+
+        Parameters:
+            page_size (int): number of students per upstream call
+
+        Yields:
+            (StudentSchema): serialized student
+        """
+        async for student in AsyncStudentService.iter_all(page_size):
+            # Serializing Object
+            yield AsyncStudentController._dump(student)
+
+    @staticmethod
+    async def get_many(ids: Sequence[Any]) -> Any:
+        """
+        Endpoint handler for batch get API, returns students by ids.
+
+        Parameters:
+            ids (Sequence[Any]): student ids
+
+        Returns:
+            (StudentSchema): API response
+        """
+        # Serializing Object
+        students = await AsyncStudentService.get_many(ids)
+        return AsyncStudentController._dump_many(students)
+
+    @staticmethod
+    async def post(request: Any) -> Any:
+        """
+        Endpoint handler for post API, create student.
+
+        Parameters:
+            request (Any) : validated student request, wire record of
+                `PersonSchema`
+
+        Returns:
+            (StudentIdSchema): API response
+        """
+        # Serializing Object
+        person = AsyncStudentController._person(request)
+        return await AsyncStudentService.post(person)
+
+    @staticmethod
+    async def patch(_id: str, request: PersonSchema) -> Any:
+        """
+        Endpoint handler for get API, returns all students.
+
+        Parameters:
+            _id (str): student id
+            request (PersonSchema): student object
+
+        Returns:
+            (StudentSchema): API response
+        """
+        # Serializing Object
+        student = await AsyncStudentService.patch(_id, request)
+        return AsyncStudentController._dump(student)
+
+    @staticmethod
+    async def delete(_id: str = None) -> Any:
+        """
+        Endpoint handler for delete API, returns exception if fail.
+
+        Parameters:
+            _id (str) : student id
+
+        Returns:
+            Error if fail
+        """
+        return await AsyncStudentService.delete(_id)
@@ -0,0 +1,83 @@
+"""Base Student Controller."""
+from typing import Any
+from typing import Iterable
+
+from ..schemas import compile_schema
+from ..schemas import PersonSchema
+from ..schemas import StudentIdSchema
+from ..schemas import StudentIdsSchema
+from ..schemas import StudentPageParamsSchema
+from ..schemas import StudentParamsSchema
+from ..schemas import StudentSchema
+
+
+class BaseStudentController:
+    """
+    Request and response serialization shared by the student controllers.
+
+    The controllers only call their service, so the blocking and the
+    non-blocking variant send the same responses.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the controller."""
+        self._schemas = (
+            PersonSchema,
+            StudentSchema,
+            StudentIdSchema,
+            StudentParamsSchema,
+            StudentIdsSchema,
+            StudentPageParamsSchema,
+        )
+
+    @staticmethod
+    def _dump(student: Any) -> Any:
+        """
+        Serialize student for the API response.
+
+        Parameters:
+            student (Any): student returned by the service
+
+        Returns:
+            (StudentSchema): API response
+        """
+        return compile_schema(StudentSchema).dump(student)
+
+    @staticmethod
+    def _dump_many(students: Iterable[Any]) -> Any:
+        """
+        Serialize students for the API response.
+
+        Parameters:
+            students (Iterable[Any]): students returned by the service
+
+        Returns:
+            (StudentSchema): API response
+        """
+        return compile_schema(StudentSchema).dump(students, many=True)
+
+    @staticmethod
+    def _person(request: Any) -> Any:
+        """
+        Serialize student request for the service.
+
+        Requests validated to wire records, see `CompiledSchema.validate`,
+        are passed on as is.
+
+        Parameters:
+            request (Any): validated student request
+
+        Returns:
+            student request data
+        """
+        return compile_schema(PersonSchema).dump(request)
+
+    @property
+    def schemas(self) -> Any:
+        """
+        Getter for response schemas of API.
+
+        Returns:
+            response schemas
+        """
+        return self._schemas
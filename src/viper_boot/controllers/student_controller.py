@@ -1,25 +1,20 @@
 """Student Controller."""
 from typing import Any
+from typing import Iterator
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
 
 from ..schemas import PersonSchema
-from ..schemas import StudentIdSchema
-from ..schemas import StudentParamsSchema
-from ..schemas import StudentSchema
 from ..services import StudentService
+from ..utils.decorators import traced
+from .base_student_controller import BaseStudentController
 
 
-class StudentController:
+@traced
+class StudentController(BaseStudentController):
     """API controller for student."""
 
-    def __init__(self) -> None:
-        """Initialise the controller."""
-        self._schemas = (
-            PersonSchema,
-            StudentSchema,
-            StudentIdSchema,
-            StudentParamsSchema,
-        )
-
     @staticmethod
     def get(_id: str = None) -> Any:
         """
@@ -32,7 +27,7 @@ def get(_id: str = None) -> Any:
             (StudentSchema): API response
         """
         # Serializing Object
-        return StudentSchema().dump(StudentService.get(_id))
+        return StudentController._dump(StudentService.get(_id))
 
     @staticmethod
     def get_all() -> Any:
@@ -43,21 +38,73 @@ def get_all() -> Any:
             (StudentSchema): API response
         """
         # Serializing Object
-        return StudentSchema(many=True).dump(StudentService.get_all())
+        students = StudentService.get_all()
+        return StudentController._dump_many(students)
 
     @staticmethod
-    def post(request: PersonSchema) -> Any:
+    def get_page(
+        cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Endpoint handler for paginated get API, returns page of students.
+
+        Parameters:
+            cursor (Optional[str]): cursor of the page, None for the first
+            limit (int): number of students per page
+
+        Returns:
+            (StudentSchema): API response and cursor of the next page
+        """
+        students, next_cursor = StudentService.get_page(cursor, limit)
+
+        # Serializing Object
+        dumped = StudentController._dump_many(students)
+        return dumped, next_cursor
+
+    @staticmethod
+    def iter_all(page_size: int = 100) -> Iterator[Any]:
+        """
+        Endpoint handler for streamed get API, serializes students lazily.
+
+        Parameters:
+            page_size (int): number of students per upstream call
+
+        Yields:
+            (StudentSchema): serialized student
+        """
+        for student in StudentService.iter_all(page_size):
+            # Serializing Object
+            yield StudentController._dump(student)
+
+    @staticmethod
+    def get_many(ids: Sequence[Any]) -> Any:
+        """
+        Endpoint handler for batch get API, returns students by ids.
+
+        Parameters:
+            ids (Sequence[Any]): student ids
+
+        Returns:
+            (StudentSchema): API response
+        """
+        # Serializing Object
+        students = StudentService.get_many(ids)
+        return StudentController._dump_many(students)
+
+    @staticmethod
+    def post(request: Any) -> Any:
         """
         Endpoint handler for post API, create student.
 
         Parameters:
-            request (PersonSchema) : student request object
+            request (Any) : validated student request, wire record of
+                `PersonSchema`
 
         Returns:
             (StudentIdSchema): API response
         """
         # Serializing Object
-        return StudentService.post(PersonSchema().dump(request))
+        return StudentService.post(StudentController._person(request))
 
     @staticmethod
     def patch(_id: str, request: PersonSchema) -> Any:
@@ -72,7 +119,8 @@ def patch(_id: str, request: PersonSchema) -> Any:
             (StudentSchema): API response
         """
         # Serializing Object
-        return StudentSchema().dump(StudentService.patch(_id, request))
+        student = StudentService.patch(_id, request)
+        return StudentController._dump(student)
 
     @staticmethod
     def delete(_id: str = None) -> Any:
@@ -86,13 +134,3 @@ def delete(_id: str = None) -> Any:
             Error if fail
         """
         return StudentService.delete(_id)
-
-    @property
-    def schemas(self) -> Any:
-        """
-        Getter for response schemas of API.
-
-        Returns:
-            response schemas
-        """
-        return self._schemas
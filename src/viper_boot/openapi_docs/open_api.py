@@ -1,13 +1,15 @@
 """Open Api Specs."""
 import copy
-import json
-import os
-import subprocess
+import socket
+from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler
 from http.server import HTTPServer
 from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
 
 import yaml
 from apispec import APISpec
@@ -17,18 +19,40 @@
 from jinja2 import Template
 from scalpl import Cut
 
+from .._version import __version__
+from ..config.config import Config
+from ..server.asgi import AsgiApplication
+from ..server.asyncio_server import AsyncioServer
+from ..server.dispatcher import Dispatcher
+from ..server.dispatcher import Response
+from ..server.router import Route
+from ..server.router import Router
+from ..server.static import StaticContent
+from ..server.static import StaticFiles
+from ..server.workers import serve_requests
 from ..utils.decorators.singleton_decorator import singleton
+from ..utils.metrics import CONTENT_TYPE
+from ..utils.metrics import METRICS
 from .security_scheme import apikey_header
 from .security_scheme import jwt_header
 from .utils import get_path_keys
+from .utils import get_path_types
+from .utils import get_query_keys
+from .utils import get_success_status
 
 
+# Spec, API router and encoded documents are served together
 @singleton
-class OpenApi:
+class OpenApi:  # pylint: disable=too-many-instance-attributes
     """Auto generate Open API specification documents."""
 
     _DEFAULT_RESPONSE_LOCATION = "json"
+    _BODY_METHODS = {"post", "put", "patch"}
     _VALID_RESPONSE_FIELDS = {"description", "headers", "examples"}
+    _INDEX_PATH = "/"
+    _SPEC_PATH = "/openapi.json"
+    _STATIC_PATH = "/static"
+    _METRICS_PATH = "/metrics"
     _DOCUMENT_PATH = (
         Path().absolute().joinpath("src/viper_boot/openapi_docs")
     )
@@ -39,15 +63,8 @@ def __init__(self) -> None:
             yaml_settings = yaml.safe_load(file_)
             self._settings = Cut(yaml_settings)
 
-        try:
-            curr_api_ver = subprocess.check_output(
-                ["git", "describe", "--tags", "--abbrev=0"]
-            ).strip().decode()
-        except BaseException:
-            curr_api_ver = "0.0.1"
-
         title = self._settings["info.title"]
-        api_version = curr_api_ver
+        api_version = self.api_version(Config().get.get("OPENAPI"))
         openapi_version = self._settings["openapi"]
 
         self._marshmallow_plugin = MarshmallowPlugin(
@@ -65,10 +82,34 @@ def __init__(self) -> None:
         # Add security scheme
         self.security_scheme()
 
-        # Initialise document server
+        # Initialise API router, shares registration with the spec
+        self._router = Router()
+        self._dispatcher = Dispatcher(self._router, fallback=self._index)
+
+        # Initialise document server, documents are encoded once
         self._index_page: str = ""
+        self._index_content: Optional[StaticContent] = None
+        self._spec_content: Optional[StaticContent] = None
+        self._static_files: Optional[StaticFiles] = None
         self._server = _OpenApiServer
 
+    @staticmethod
+    def api_version(settings: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Get API version of the spec.
+
+        The version is stamped into the package when it is released, so
+        no `git` process is run on startup.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.openapi]` settings
+                block, a non-empty `version` overrides the stamped version
+
+        Returns:
+            API version
+        """
+        return str((settings or {}).get("version") or __version__)
+
     def security_scheme(self) -> None:
         """Add Open API security scheme."""
         api_key_scheme: Dict[Any, Any] = apikey_header.security_header
@@ -86,39 +127,122 @@ def generate_spec(self) -> Dict[str, Any]:
         return self._spec.to_dict()
 
     def generate_doc(self) -> None:
-        """Write Open API spec as JSON file."""
-        try:
-            os.remove("openapi_spec.json")
-        except FileNotFoundError:
-            pass
+        """Write Open API spec as JSON file, unless it is up to date."""
+        document = Response.encoder.encode(self.generate_spec(), True)
+        path = Path("openapi_spec.json")
+        if path.is_file() and path.read_bytes() == document:
+            return
+
+        path.write_bytes(document)
 
-        with open("openapi_spec.json", "w", encoding="utf8") as outfile:
-            json.dump(self.generate_spec(), outfile, indent=2)
+    def render_index(self) -> None:
+        """Render Open API index page, loading the spec from its own path.
 
-    def serve_doc(self) -> None:
-        """Serve Open API documents."""
+        Swagger UI assets are loaded from the fingerprinted URLs of the
+        bundled files, so the documents load without network access.
+        """
         with open(
             self._DOCUMENT_PATH / "site" / "index.html", encoding="utf8"
         ) as template_index_html:
             self._index_page = Template(template_index_html.read()).render(
-                path="openapi_spec.json",
-                static=self._DOCUMENT_PATH / "site",
-                spec=json.dumps(self.generate_spec(), indent=2),
+                path=self._SPEC_PATH,
+                static=self.static_files.url,
             )
+        self._index_content = StaticContent(
+            self._index_page.encode("utf-8"), "text/html; charset=utf-8"
+        )
+
+    def serve_doc(
+        self, sock: Optional[socket.socket] = None, max_requests: int = 0
+    ) -> None:
+        """Serve Open API documents and the registered API routes.
 
-        host = self._settings["servers[0].variables.host.default"]
-        port = self._settings["servers[0].variables.port.default"]
+        Parameters:
+            sock (Optional[socket.socket]): listening socket inherited from
+                the pre-fork arbiter, binds the spec server address if None
+            max_requests (int): requests to serve before returning, 0 for
+                no limit
+        """
+        self.render_index()
+
+        host, port = self.address
 
-        open_api_server = HTTPServer((host, port), _OpenApiServer)
+        open_api_server = HTTPServer(
+            (host, port), _OpenApiServer, bind_and_activate=sock is None
+        )
+        if sock is not None:
+            open_api_server.socket.close()
+            open_api_server.socket = sock
 
         try:
-            print(f"OpenAPI server started http://{host}:{port}")
-            open_api_server.serve_forever()
+            if sock is None:
+                print(f"OpenAPI server started http://{host}:{port}")
+                open_api_server.serve_forever()
+            else:
+                serve_requests(open_api_server, max_requests)
         except KeyboardInterrupt:
             print("\nKeyboard interrupt received, exiting.")
         finally:
             open_api_server.server_close()
 
+    def serve_asgi(
+        self, sock: Optional[socket.socket] = None, max_requests: int = 0
+    ) -> None:
+        """Serve Open API documents and API routes on asyncio server.
+
+        Parameters:
+            sock (Optional[socket.socket]): listening socket inherited from
+                the pre-fork arbiter, binds the spec server address if None
+            max_requests (int): requests to serve before returning, 0 for
+                no limit
+        """
+        self.render_index()
+
+        host, port = self.address
+
+        AsyncioServer(
+            AsgiApplication(self._dispatcher),
+            host,
+            port,
+            sock=sock,
+            max_requests=max_requests,
+        ).run()
+
+    def _index(
+        self, method: str, path: str, headers: Mapping[str, str]
+    ) -> Optional[Response]:
+        """Serve spec, Swagger UI files, metrics and index page.
+
+        Parameters:
+            method (str): HTTP method
+            path (str): request path
+            headers (Mapping[str, str]): request headers, `If-None-Match`
+                and `Accept-Encoding` select the response
+
+        Returns:
+            document response, None if the method is not GET, the path is
+            not a document, the static file does not exist or metrics are
+            disabled
+        """
+        if method != "GET":
+            return None
+
+        if path.startswith(self._STATIC_PATH + "/"):
+            return self.static_files.response(path, headers)
+        if path == self._SPEC_PATH:
+            return self.spec_content.response(headers)
+        if path == self._METRICS_PATH:
+            if not METRICS.enabled:
+                return None
+            return Response(
+                HTTPStatus.OK, METRICS.render().encode(), CONTENT_TYPE
+            )
+        if path != self._INDEX_PATH:
+            return None
+        if self._index_content is None:
+            self.render_index()
+        return self._index_content.response(headers)
+
     @staticmethod
     def _resolver(schema: Any) -> Any:
         """Marshmallow plugin schema resolver.
@@ -140,7 +264,7 @@ def _resolver(schema: Any) -> Any:
         return name
 
     def register(self, path: str, handler: Any) -> None:
-        """Register handler with OpenApi spec.
+        """Register handler with OpenApi spec and API router.
 
         Parameters:
             path (str): API path
@@ -152,6 +276,8 @@ def register(self, path: str, handler: Any) -> None:
         if not hasattr(handler, "__apispec__"):
             return None
 
+        self._spec_content = None  # Encoded again with the new path
+
         data: Any = handler.__apispec__
 
         http_method = data.pop("method") or "get"
@@ -160,6 +286,9 @@ def register(self, path: str, handler: Any) -> None:
         if http_method not in VALID_METHODS_OPENAPI_V2:
             return None
 
+        # Handler name unless given, labels the request metrics
+        operation_id = data.setdefault("operationId", handler.__name__)
+
         for schema in data.pop("schemas", []):
             parameters = self._marshmallow_plugin.converter.schema2parameters(
                 schema["schema"],
@@ -169,6 +298,7 @@ def register(self, path: str, handler: Any) -> None:
             self._add_examples(schema["schema"], parameters, schema["example"])
             data["parameters"].extend(parameters)
 
+        path_types = get_path_types(data["parameters"])
         existing = [p["name"] for p in data["parameters"] if p["in"] == "path"]
 
         data["parameters"].extend(
@@ -183,37 +313,59 @@ def register(self, path: str, handler: Any) -> None:
         )
 
         if "responses" in data:
-            responses = {}
-            for code, actual_params in data["responses"].items():
-                if "schema" in actual_params:
-                    raw_parameters = (
-                        self._marshmallow_plugin.converter.schema2parameters(
-                            actual_params["schema"],
-                            location=self._DEFAULT_RESPONSE_LOCATION,
-                            required=actual_params.get("required", False),
-                        )[0]
-                    )
-
-                    updated_params = {
-                        k: v
-                        for k, v in raw_parameters.items()
-                        if k in self._VALID_RESPONSE_FIELDS
-                    }
-                    updated_params["schema"] = actual_params["schema"]
-                    for extra_info in self._VALID_RESPONSE_FIELDS:
-                        if extra_info in actual_params:
-                            updated_params[extra_info] = actual_params[
-                                extra_info
-                            ]
-                    responses[code] = updated_params
-                else:
-                    responses[code] = actual_params
-            data["responses"] = responses
+            data["responses"] = self._responses(data["responses"])
 
         operations = copy.deepcopy(data)
 
         self._spec.path(path=path, operations={http_method: operations})
 
+        self._router.add(
+            Route(
+                method=http_method.upper(),
+                path=path,
+                handler=handler,
+                status=get_success_status(data.get("responses", {})),
+                has_body=http_method in self._BODY_METHODS,
+                param_types=path_types,
+                query=get_query_keys(data["parameters"]),
+                operation_id=operation_id,
+            )
+        )
+
+    def _responses(self, responses: Dict[Any, Any]) -> Dict[Any, Any]:
+        """Convert response schemas of a handler to spec responses.
+
+        Parameters:
+            responses (Dict[Any, Any]): responses by status code
+
+        Returns:
+            spec responses by status code
+        """
+        converted = {}
+        for code, actual_params in responses.items():
+            if "schema" in actual_params:
+                raw_parameters = (
+                    self._marshmallow_plugin.converter.schema2parameters(
+                        actual_params["schema"],
+                        location=self._DEFAULT_RESPONSE_LOCATION,
+                        required=actual_params.get("required", False),
+                    )[0]
+                )
+
+                updated_params = {
+                    k: v
+                    for k, v in raw_parameters.items()
+                    if k in self._VALID_RESPONSE_FIELDS
+                }
+                updated_params["schema"] = actual_params["schema"]
+                for extra_info in self._VALID_RESPONSE_FIELDS:
+                    if extra_info in actual_params:
+                        updated_params[extra_info] = actual_params[extra_info]
+                converted[code] = updated_params
+            else:
+                converted[code] = actual_params
+        return converted
+
     def _add_examples(
         self, ref_schema: Any, endpoint_schema: Any, example: Any
     ) -> None:
@@ -259,6 +411,67 @@ def spec(self) -> Any:
         """
         return self._spec
 
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Getter method for API server address.
+
+        Returns:
+            host and port of the first server in the spec settings
+        """
+        return (
+            self._settings["servers[0].variables.host.default"],
+            self._settings["servers[0].variables.port.default"],
+        )
+
+    @property
+    def router(self) -> Router:
+        """Getter method for API router.
+
+        Returns:
+            API router with the registered handlers
+        """
+        return self._router
+
+    @property
+    def dispatcher(self) -> Dispatcher:
+        """Getter method for API dispatcher.
+
+        Returns:
+            API dispatcher
+        """
+        return self._dispatcher
+
+    @property
+    def spec_content(self) -> StaticContent:
+        """Getter method for Open Api spec, encoded once.
+
+        Returns:
+            compact JSON spec with entity tag and compressed variants
+        """
+        content = self._spec_content
+        if content is None:
+            content = self._spec_content = StaticContent(
+                Response.encoder.encode(self.generate_spec()),
+                "application/json",
+            )
+        return content
+
+    @property
+    def static_files(self) -> StaticFiles:
+        """Getter method for Swagger UI files, hashed on first use.
+
+        Returns:
+            bundled Swagger UI files, without the index page template
+        """
+        files = self._static_files
+        if files is None:
+            files = self._static_files = StaticFiles(
+                self._DOCUMENT_PATH / "site",
+                self._STATIC_PATH,
+                exclude=("index.html",),
+            )
+        return files
+
     @property
     def index_page(self) -> Any:
         """Getter method for Open Api index html file.
@@ -270,12 +483,83 @@ def index_page(self) -> Any:
 
 
 class _OpenApiServer(BaseHTTPRequestHandler):
-    """OpenAPI document server."""
+    """OpenAPI document and API server."""
+
+    _MAX_BODY = 1024 * 1024
 
     def do_GET(self) -> None:  # noqa # pylint: disable=C0103
         """Get request handler."""
-        index_page = OpenApi().index_page
-        self.send_response(200)
-        self.send_header("Content-type", "text/html")
+        self._dispatch()
+
+    def do_POST(self) -> None:  # noqa # pylint: disable=C0103
+        """Post request handler."""
+        self._dispatch()
+
+    def do_PUT(self) -> None:  # noqa # pylint: disable=C0103
+        """Put request handler."""
+        self._dispatch()
+
+    def do_PATCH(self) -> None:  # noqa # pylint: disable=C0103
+        """Patch request handler."""
+        self._dispatch()
+
+    def do_DELETE(self) -> None:  # noqa # pylint: disable=C0103
+        """Delete request handler."""
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Dispatch request to the registered API handler."""
+        length = self._content_length()
+        if length is None:
+            response = Response.error(HTTPStatus.BAD_REQUEST, "Bad request")
+        elif length > self._MAX_BODY:
+            response = Response.error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large"
+            )
+        else:
+            response = OpenApi().dispatcher.dispatch(
+                self.command,
+                self.path,
+                self.rfile.read(length) if length else b"",
+                {name.lower(): value for name, value in self.headers.items()},
+            )
+        if length is None or length > self._MAX_BODY:
+            # The body is not read, the connection can not be reused
+            self.close_connection = True
+
+        self.send_response(response.status)
+        for name, value in response.headers:
+            self.send_header(name, value)
         self.end_headers()
-        self.wfile.write(bytes(index_page, "utf-8"))
+        if response.file is not None:
+            self.wfile.flush()
+            with open(response.file, "rb") as file_:
+                self.connection.sendfile(file_)
+            return
+        if response.chunks is None:
+            self.wfile.write(response.body)
+            return
+
+        # HTTP/1.0 response without length, closing the connection ends it
+        self.close_connection = True
+        chunks = iter(response.chunks)
+        try:
+            for chunk in chunks:
+                self.wfile.write(chunk)
+        finally:
+            # Ends the request observation when the client disconnects
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    def _content_length(self) -> Optional[int]:
+        """Get request body length from the `Content-Length` header.
+
+        Returns:
+            body length, 0 without header, None if the header is malformed
+            or negative
+        """
+        value = self.headers.get("Content-Length", "0").strip()
+        if not (value.isascii() and value.isdigit()):
+            return None
+        return int(value)
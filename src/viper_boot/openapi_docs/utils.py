@@ -1,6 +1,13 @@
 """OpenAPI spec utilities."""
 from string import Formatter
 from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from apispec.ext.marshmallow import common
+from marshmallow import fields
+from marshmallow import Schema
 
 
 def get_path_keys(path: str) -> Any:
@@ -14,3 +21,75 @@ def get_path_keys(path: str) -> Any:
         keys in the path
     """
     return [i[1] for i in Formatter().parse(path) if i[1]]
+
+
+def get_success_status(responses: Dict[Any, Any]) -> int:
+    """
+    Get status code of the successful response.
+
+    Parameters:
+        responses (Dict[Any, Any]): OpenAPI responses keyed by status code
+
+    Returns:
+        lowest 2xx status code, 200 if none declared
+    """
+    codes = [
+        int(code)
+        for code in responses
+        if str(code).isdigit() and 200 <= int(code) < 300
+    ]
+    return min(codes, default=200)
+
+
+def get_query_keys(parameters: List[Dict[str, Any]]) -> Tuple[str, ...]:
+    """
+    Get names of the query parameters.
+
+    Parameters:
+        parameters (List[Dict[str, Any]]): OpenAPI operation parameters
+
+    Returns:
+        query parameter names
+    """
+    return tuple(
+        parameter["name"]
+        for parameter in parameters
+        if parameter.get("in") == "query" and "name" in parameter
+    )
+
+
+def get_path_types(parameters: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Get router converter names of the path parameters.
+
+    Parameters:
+        parameters (List[Dict[str, Any]]): OpenAPI operation parameters,
+            schema can be a marshmallow schema or OpenAPI schema object
+
+    Returns:
+        converter name (`uuid`, `int` or `str`) keyed by parameter name
+    """
+    types = {}
+    for parameter in parameters:
+        if parameter.get("in") != "path" or "schema" not in parameter:
+            continue
+
+        name = parameter["name"]
+        schema = parameter["schema"]
+        if isinstance(schema, dict):
+            if schema.get("format") == "uuid":
+                types[name] = "uuid"
+            elif schema.get("type") == "integer":
+                types[name] = "int"
+            continue
+
+        if isinstance(schema, Schema) or (
+            isinstance(schema, type) and issubclass(schema, Schema)
+        ):
+            field = common.resolve_schema_instance(schema).fields.get(name)
+            if isinstance(field, fields.UUID):
+                types[name] = "uuid"
+            elif isinstance(field, fields.Integer):
+                types[name] = "int"
+
+    return types
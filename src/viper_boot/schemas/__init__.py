@@ -1,5 +1,11 @@
 """Schemas Package."""
+from .compiled_schema import compile_schema
+from .compiled_schema import CompiledSchema
+from .compiled_schema import WireRecord
 from .person_schema import PersonSchema
+from .schema_pool import get_schema
 from .student_id_schema import StudentIdSchema
+from .student_ids_schema import StudentIdsSchema
+from .student_page_params_schema import StudentPageParamsSchema
 from .student_params_schema import StudentParamsSchema
 from .student_schema import StudentSchema
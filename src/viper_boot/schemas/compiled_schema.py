@@ -0,0 +1,489 @@
+"""Compiled Schema Serializers."""
+import threading
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Type
+from typing import cast
+
+from marshmallow import EXCLUDE
+from marshmallow import fields
+from marshmallow import INCLUDE
+from marshmallow import missing
+from marshmallow import Schema
+from marshmallow import ValidationError
+from marshmallow.utils import get_value
+from marshmallow.utils import is_collection
+
+from ..utils.metrics import METRICS
+from ..utils.tracing import TRACER
+from .schema_pool import get_schema
+
+# Exceptions of marshmallow's key lookup, before falling back to attributes
+_LOOKUP_ERRORS = (KeyError, IndexError, TypeError, AttributeError)
+
+
+class _FallbackError(Exception):
+    """Raised by compiled loaders for input marshmallow must handle."""
+
+
+class WireRecord(dict):  # type: ignore
+    """
+    Validated record, serialized by a schema and ready to be sent.
+
+    Records are shared, e.g. by the cache, and must not be modified.
+    """
+
+    __slots__ = ("schema_cls",)
+
+    def __init__(self, schema_cls: Type[Schema], data: Dict[str, Any]) -> None:
+        """
+        Initialise the record.
+
+        Parameters:
+            schema_cls (Type[Schema]): schema class serializing the data
+            data (Dict[str, Any]): serialized data
+        """
+        super().__init__(data)
+        self.schema_cls = schema_cls
+
+    def __reduce__(self) -> Any:
+        """
+        Pickle schema class and data, e.g. for shared caches.
+
+        Returns:
+            callable and its arguments
+        """
+        return WireRecord, (self.schema_cls, dict(self))
+
+
+class CompiledSchema:
+    """
+    Schema with specialised dump and load functions.
+
+    The functions are generated once from the fields of a default schema
+    instance, so fields and options are not resolved again per call.
+    Schemas with hooks or overridden schema methods are not compiled and
+    use marshmallow. Invalid input is loaded again by marshmallow, so
+    validation errors are the same.
+    """
+
+    def __init__(self, schema: Schema) -> None:
+        """
+        Compile the schema.
+
+        Parameters:
+            schema (Schema): schema instance to compile
+        """
+        self._schema = schema
+        self._schema_cls = type(schema)
+        self._dump: Optional[Callable[[Any], Any]] = None
+        self._load: Optional[Callable[[Any], Any]] = None
+        if self._is_compilable(schema):
+            self._dump = _compile_dump(schema)
+            self._load = _compile_load(schema)
+
+    def dump(self, obj: Any, many: bool = False) -> Any:
+        """
+        Serialize object(s), same as `Schema.dump`.
+
+        Wire records of the same schema class are already serialized and
+        returned as is.
+
+        Parameters:
+            obj (Any): object or collection of objects to serialize
+            many (bool): whether `obj` is a collection
+
+        Returns:
+            serialized data
+        """
+        with METRICS.stage("dump"), TRACER.span(
+            "schema.dump", schema=self._schema_cls.__name__
+        ):
+            if many and obj is not None:
+                if self._dump is not None:
+                    return [
+                        item if self._is_record(item) else self._dump(item)
+                        for item in obj
+                    ]
+                obj = list(obj)
+                if all(self._is_record(item) for item in obj):
+                    return obj
+            elif self._is_record(obj):
+                return obj
+            elif self._dump is not None:
+                return self._dump(obj)
+
+            return self._schema.dump(obj, many=many)
+
+    def load(self, data: Any, many: bool = False) -> Any:
+        """
+        Deserialize and validate data, same as `Schema.load`.
+
+        Parameters:
+            data (Any): data or collection of data to deserialize
+            many (bool): whether `data` is a collection
+
+        Raises:
+            ValidationError: if data is invalid
+
+        Returns:
+            deserialized data
+        """
+        with METRICS.stage("load"), TRACER.span(
+            "schema.load", schema=self._schema_cls.__name__
+        ):
+            if self._load is not None:
+                try:
+                    if not many:
+                        return self._load(data)
+                    if is_collection(data):
+                        return [self._load(item) for item in data]
+                except (ValidationError, _FallbackError):
+                    pass  # marshmallow collects and raises the exact errors
+
+            return self._schema.load(data, many=many)
+
+    def validate(self, data: Any, many: bool = False) -> Any:
+        """
+        Validate data, get wire-ready record(s) serialized once.
+
+        The records are returned by `dump` as is, so data validated by
+        the services is not serialized again per response.
+
+        Parameters:
+            data (Any): data or collection of data to validate
+            many (bool): whether `data` is a collection
+
+        Raises:
+            ValidationError: if data is invalid
+
+        Returns:
+            wire record or list of wire records
+        """
+        loaded = self.load(data, many=many)
+        with METRICS.stage("dump"), TRACER.span(
+            "schema.dump", schema=self._schema_cls.__name__
+        ):
+            if many:
+                return [self._record(item) for item in loaded]
+            return self._record(loaded)
+
+    @property
+    def schema(self) -> Schema:
+        """
+        Getter method for the compiled schema instance.
+
+        Returns:
+            schema instance
+        """
+        return self._schema
+
+    def _is_record(self, obj: Any) -> bool:
+        """
+        Check whether the object is a wire record of this schema class.
+
+        Parameters:
+            obj (Any): object to serialize
+
+        Returns:
+            True when `obj` is serialized already
+        """
+        return (
+            type(obj) is WireRecord  # pylint: disable=C0123
+            and obj.schema_cls is self._schema_cls
+        )
+
+    def _record(self, loaded: Any) -> "WireRecord":
+        """
+        Serialize loaded data to a wire record.
+
+        Parameters:
+            loaded (Any): validated data
+
+        Returns:
+            wire record
+        """
+        if self._dump is not None:
+            return WireRecord(self._schema_cls, self._dump(loaded))
+        dumped = self._schema.dump(loaded, many=False)
+        return WireRecord(self._schema_cls, dumped)
+
+    @staticmethod
+    def _is_compilable(schema: Schema) -> bool:
+        """
+        Check whether the schema has no features the compiler skips.
+
+        Parameters:
+            schema (Schema): schema instance
+
+        Returns:
+            True when dump and load can be compiled
+        """
+        schema_cls = type(schema)
+        return (
+            not any(schema._hooks.values())  # pylint: disable=W0212
+            and schema_cls.get_attribute is Schema.get_attribute
+            and not schema.partial
+        )
+
+
+# Compiled schemas by schema class
+_COMPILED: Dict[Type[Schema], CompiledSchema] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def compile_schema(schema_cls: Type[Schema]) -> CompiledSchema:
+    """
+    Get compiled schema of the class, compiling it on first use.
+
+    The pooled schema instance of the class is compiled, see `get_schema`.
+
+    Parameters:
+        schema_cls (Type[Schema]): schema class
+
+    Returns:
+        compiled schema, shared by all callers
+    """
+    compiled = _COMPILED.get(schema_cls)
+    if compiled is None:
+        with _COMPILED_LOCK:
+            compiled = _COMPILED.get(schema_cls)
+            if compiled is None:
+                compiled = _COMPILED[schema_cls] = CompiledSchema(
+                    get_schema(schema_cls)
+                )
+
+    return compiled
+
+
+def _is_plain(
+    field: fields.Field,
+    method: str,
+    base: Type[fields.Field] = fields.Field,
+) -> bool:
+    """
+    Check whether the field uses the base implementation of a method.
+
+    Parameters:
+        field (fields.Field): schema field
+        method (str): method name
+        base (Type[fields.Field]): field class implementing the method
+
+    Returns:
+        True when the method is not overridden
+    """
+    return getattr(type(field), method) is getattr(base, method)
+
+
+def _nested(field: fields.Field) -> Optional[CompiledSchema]:
+    """
+    Compile schema of a single nested object.
+
+    Parameters:
+        field (fields.Field): schema field
+
+    Returns:
+        compiled nested schema, None if the field is not a plain `Nested`
+    """
+    if (
+        type(field) is not fields.Nested  # pylint: disable=C0123
+        or field.many
+        or field.schema.many
+    ):
+        return None
+
+    return CompiledSchema(field.schema)
+
+
+def _compile(
+    name: str, lines: List[str], namespace: Dict[str, Any]
+) -> Callable[[Any], Any]:
+    """
+    Compile generated function.
+
+    Parameters:
+        name (str): function name
+        lines (List[str]): function source lines
+        namespace (Dict[str, Any]): globals of the function
+
+    Returns:
+        compiled function
+    """
+    exec(  # nosec  # pylint: disable=exec-used
+        compile("\n".join(lines), f"<compiled {name}>", "exec"), namespace
+    )
+    return cast(Callable[[Any], Any], namespace[name])
+
+
+def _compile_dump(schema: Schema) -> Callable[[Any], Any]:
+    """
+    Generate dump function of one object.
+
+    Parameters:
+        schema (Schema): schema instance
+
+    Returns:
+        dump function
+    """
+    namespace: Dict[str, Any] = {
+        "MISSING": missing,
+        "LOOKUP_ERRORS": _LOOKUP_ERRORS,
+        "get_value": get_value,
+        "get_attribute": schema.get_attribute,
+        "dict_class": schema.dict_class,
+    }
+    lines = ["def dump(obj):", "    ret = dict_class()"]
+    for index, (attr_name, field) in enumerate(schema.dump_fields.items()):
+        name = f"f{index}"
+        namespace[name] = field
+        key = repr(field.data_key or attr_name)
+        check_key = field.attribute or attr_name
+        if (
+            not field._CHECK_ATTRIBUTE  # pylint: disable=W0212
+            or not _is_plain(field, "serialize")
+            or not _is_plain(field, "get_value")
+        ):
+            lines += [
+                f"    v = {name}.serialize({attr_name!r}, obj, "
+                "accessor=get_attribute)",
+                "    if v is not MISSING:",
+                f"        ret[{key}] = v",
+            ]
+            continue
+
+        # Value lookup, same as `marshmallow.utils.get_value`
+        if "." in check_key:
+            lines.append(f"    v = get_value(obj, {check_key!r}, MISSING)")
+        else:
+            lines += [
+                "    try:",
+                f"        v = obj[{check_key!r}]",
+                "    except LOOKUP_ERRORS:",
+                f"        v = getattr(obj, {check_key!r}, MISSING)",
+            ]
+        indent = "    "
+        if field.dump_default is not missing:
+            default = f"d{index}"
+            namespace[default] = field.dump_default
+            call = "()" if callable(field.dump_default) else ""
+            lines += ["    if v is MISSING:", f"        v = {default}{call}"]
+        else:
+            lines.append("    if v is not MISSING:")
+            indent = "        "
+
+        value = _dump_value(field, index, attr_name, namespace)
+        lines.append(f"{indent}ret[{key}] = {value}")
+
+    lines.append("    return ret")
+    return _compile("dump", lines, namespace)
+
+
+def _dump_value(
+    field: fields.Field, index: int, attr_name: str, namespace: Dict[str, Any]
+) -> str:
+    """
+    Generate expression serializing the looked up value `v` of a field.
+
+    Parameters:
+        field (fields.Field): schema field, `f{index}` in the namespace
+        index (int): position of the field
+        attr_name (str): field name
+        namespace (Dict[str, Any]): globals of the function, nested dump
+            functions are added
+
+    Returns:
+        expression source
+    """
+    nested = _nested(field)
+    dump = nested and nested._dump  # pylint: disable=W0212
+    serialize = f"f{index}._serialize(v, {attr_name!r}, obj)"
+    if dump is not None:
+        namespace[f"n{index}"] = dump
+        return f"None if v is None else n{index}(v)"
+    if isinstance(field, fields.String) and _is_plain(
+        field, "_serialize", fields.String
+    ):
+        return f"v if type(v) is str else {serialize}"
+    return serialize
+
+
+def _compile_load(schema: Schema) -> Optional[Callable[[Any], Any]]:
+    """
+    Generate load function of one object.
+
+    The function raises `ValidationError` or `_FallbackError` for input
+    marshmallow must load, e.g. invalid or unknown fields.
+
+    Parameters:
+        schema (Schema): schema instance
+
+    Returns:
+        load function, None if fields can not be compiled
+    """
+    namespace: Dict[str, Any] = {
+        "MISSING": missing,
+        "Mapping": Mapping,
+        "FallbackError": _FallbackError,
+        "dict_class": schema.dict_class,
+    }
+    lines = [
+        "def load(data):",
+        "    if not isinstance(data, Mapping):",
+        "        raise FallbackError()",
+        "    ret = dict_class()",
+    ]
+    data_keys = set()
+    for index, (attr_name, field) in enumerate(schema.load_fields.items()):
+        name = f"f{index}"
+        namespace[name] = field
+        data_key = field.data_key or attr_name
+        data_keys.add(data_key)
+        key = field.attribute or attr_name
+        if "." in key:
+            return None  # Nested output keys are set by marshmallow
+
+        deserialize = f"{name}.deserialize(raw, {data_key!r}, data)"
+        lines.append(f"    raw = data.get({data_key!r}, MISSING)")
+        nested = _nested(field)
+        load = nested and nested._load  # pylint: disable=W0212
+        if (
+            load is not None
+            and isinstance(field, fields.Nested)
+            and field.unknown is None
+        ):
+            namespace[f"n{index}"] = load
+            lines += [
+                "    if raw is MISSING or raw is None:",
+                f"        v = {deserialize}",
+                "    else:",
+                f"        v = n{index}(raw)",
+                f"        {name}._validate(v)",
+            ]
+        elif (
+            type(field) is fields.String  # pylint: disable=C0123
+            and not field.validators
+        ):
+            lines += [
+                "    if type(raw) is str:",
+                "        v = raw",
+                "    else:",
+                f"        v = {deserialize}",
+            ]
+        else:
+            lines.append(f"    v = {deserialize}")
+        lines += ["    if v is not MISSING:", f"        ret[{key!r}] = v"]
+
+    if schema.unknown != EXCLUDE:
+        namespace["data_keys"] = frozenset(data_keys)
+        lines += ["    for key in data:", "        if key not in data_keys:"]
+        if schema.unknown == INCLUDE:
+            lines.append("            ret[key] = data[key]")
+        else:
+            lines.append("            raise FallbackError()")
+
+    lines.append("    return ret")
+    return _compile("load", lines, namespace)
@@ -0,0 +1,105 @@
+"""Schema Instance Pool."""
+import threading
+from typing import Dict
+from typing import FrozenSet
+from typing import Hashable
+from typing import Iterable
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from marshmallow import fields
+from marshmallow import Schema
+
+Partial = Union[bool, Iterable[str], None]
+
+# Pooled schema instances by class and options
+_POOL: Dict[Tuple[Hashable, ...], Schema] = {}
+_POOL_LOCK = threading.Lock()
+
+
+def get_schema(
+    schema_cls: Type[Schema],
+    many: bool = False,
+    partial: Partial = None,
+    only: Optional[Iterable[str]] = None,
+    exclude: Iterable[str] = (),
+) -> Schema:
+    """
+    Get pre-built schema instance, building it on first use.
+
+    Instances are shared by all callers and threads, so they must be
+    treated as immutable, e.g. pass `many` to `dump` and `load` instead
+    of setting attributes. Nested schemas are bound when the instance is
+    built, not on the first request.
+
+    Parameters:
+        schema_cls (Type[Schema]): schema class
+        many (bool): whether the schema handles collections
+        partial (Partial): fields allowed to be missing on load, True for
+            all fields
+        only (Optional[Iterable[str]]): fields to include, None for all
+        exclude (Iterable[str]): fields to exclude
+
+    Returns:
+        pooled schema instance
+    """
+    key = (
+        schema_cls,
+        bool(many),
+        _freeze(partial),
+        None if only is None else frozenset(only),
+        frozenset(exclude),
+    )
+    schema = _POOL.get(key)
+    if schema is None:
+        with _POOL_LOCK:
+            schema = _POOL.get(key)
+            if schema is None:
+                schema = schema_cls(
+                    many=key[1],
+                    partial=key[2],  # type: ignore
+                    only=key[3],
+                    exclude=key[4],
+                )
+                _bind_nested(schema)
+                _POOL[key] = schema
+
+    return schema
+
+
+def _freeze(partial: Partial) -> Hashable:
+    """
+    Get hashable value of the `partial` option.
+
+    Parameters:
+        partial (Partial): `partial` schema option
+
+    Returns:
+        bool or None as is, field names as frozenset
+    """
+    if partial is None or isinstance(partial, bool):
+        return partial
+    return frozenset(partial)
+
+
+def _bind_nested(
+    schema: Schema, parents: FrozenSet[type] = frozenset()
+) -> None:
+    """
+    Build nested schemas, marshmallow builds them lazily on first use.
+
+    Parameters:
+        schema (Schema): schema instance
+        parents (FrozenSet[type]): classes of the enclosing schemas, self
+            referencing schemas are left to marshmallow
+    """
+    parents = parents | {type(schema)}
+    for field in schema.fields.values():
+        if isinstance(field, fields.List):
+            field = field.inner
+        if isinstance(field, fields.Nested) and field.nested != "self":
+            nested = field.schema
+            if type(nested) not in parents:
+                _bind_nested(nested, parents)
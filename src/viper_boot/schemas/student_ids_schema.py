@@ -0,0 +1,22 @@
+"""Student Ids Schema."""
+from marshmallow import fields
+from marshmallow import Schema
+from marshmallow import validate
+
+
+class StudentIdsSchema(Schema):
+    """
+    Schema to represent batch of Student ids.
+
+    Properties:
+        ids (List[uuid]): student ids
+    """
+
+    MAX_IDS = 1000
+
+    ids = fields.List(
+        fields.UUID(),
+        required=True,
+        validate=validate.Length(min=1, max=MAX_IDS),
+        metadata={"description": "Student Ids."},
+    )
@@ -0,0 +1,38 @@
+"""Student Page Params Schema."""
+from marshmallow import fields
+from marshmallow import Schema
+from marshmallow import validate
+
+
+class StudentPageParamsSchema(Schema):
+    """
+    Schema to represent Students page query parameters.
+
+    Properties:
+        cursor (str): cursor of the page, returned by the previous page
+        limit (int): number of students per page
+        stream (str): stream all students as `json` array or `ndjson`
+        pretty (bool): indent the JSON response, `?pretty` without value
+            included
+    """
+
+    MAX_LIMIT = 1000
+
+    cursor = fields.String(
+        metadata={"description": "Cursor of the next page."},
+    )
+    limit = fields.Integer(
+        validate=validate.Range(min=1, max=MAX_LIMIT),
+        metadata={"description": "Number of students per page."},
+    )
+    stream = fields.String(
+        validate=validate.OneOf(["json", "ndjson"]),
+        metadata={
+            "description": "Stream all students as JSON array or "
+            "newline delimited JSON, `limit` students per chunk."
+        },
+    )
+    pretty = fields.Boolean(
+        truthy=fields.Boolean.truthy | {""},
+        metadata={"description": "Indent the JSON response."},
+    )
@@ -25,7 +25,7 @@ class Meta:
         metadata={"description": "Student Id."},
     )
     student = fields.Nested(
-        PersonSchema(),
+        PersonSchema,
         metadata={
             "description": "Student object."
         },
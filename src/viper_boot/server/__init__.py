@@ -0,0 +1,35 @@
+"""Server Package."""
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .asgi import AsgiApplication
+    from .asyncio_server import AsyncioServer
+    from .dispatcher import Dispatcher
+    from .dispatcher import Response
+    from .router import MethodNotAllowedError
+    from .router import Route
+    from .router import RouteNotFoundError
+    from .router import Router
+    from .static import StaticContent
+    from .static import StaticFile
+    from .static import StaticFiles
+
+# Submodules are imported on first use, see `lazy_exports`
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsgiApplication": ".asgi",
+        "AsyncioServer": ".asyncio_server",
+        "Dispatcher": ".dispatcher",
+        "Response": ".dispatcher",
+        "MethodNotAllowedError": ".router",
+        "Route": ".router",
+        "RouteNotFoundError": ".router",
+        "Router": ".router",
+        "StaticContent": ".static",
+        "StaticFile": ".static",
+        "StaticFiles": ".static",
+    },
+)
@@ -0,0 +1,219 @@
+"""ASGI Application."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+from .dispatcher import Dispatcher
+from .dispatcher import Response
+
+# Bytes read at a time from files sent without zero-copy support
+_FILE_CHUNK_SIZE = 256 * 1024
+
+# ASGI extension sending files with `sendfile`
+_ZEROCOPYSEND = "http.response.zerocopysend"
+
+Scope = Dict[str, Any]
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+class AsgiApplication:
+    """
+    ASGI 3.0 application serving the dispatcher routes.
+
+    Coroutine handlers are awaited on the event loop. Plain handlers do
+    blocking I/O, they run on a thread pool so the event loop keeps
+    accepting and reading other connections meanwhile.
+    """
+
+    def __init__(
+        self, dispatcher: Dispatcher, max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Initialise the application.
+
+        Parameters:
+            dispatcher (Dispatcher): request dispatcher
+            max_workers (Optional[int]): handler threads, defaults to the
+                `ThreadPoolExecutor` default
+        """
+        self._dispatcher = dispatcher
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """
+        Handle ASGI connection.
+
+        Parameters:
+            scope (Scope): connection scope
+            receive (Receive): awaitable returning next event
+            send (Send): awaitable sending an event
+        """
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _http(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Handle HTTP request.
+
+        Parameters:
+            scope (Scope): connection scope
+            receive (Receive): awaitable returning next event
+            send (Send): awaitable sending an event
+        """
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        target = scope["path"]
+        if scope.get("query_string"):
+            target += "?" + scope["query_string"].decode("latin-1")
+
+        headers: Dict[str, str] = {}
+        for raw_name, raw_value in scope.get("headers", ()):
+            name = raw_name.decode("latin-1").lower()
+            value = raw_value.decode("latin-1")
+            headers[name] = (
+                f"{headers[name]}, {value}" if name in headers else value
+            )
+
+        response = await self._dispatcher.dispatch_async(
+            scope["method"], target, body, headers, executor=self.executor
+        )
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": int(response.status),
+                "headers": [
+                    (name.lower().encode("latin-1"), value.encode("latin-1"))
+                    for name, value in response.headers
+                ],
+            }
+        )
+        if response.file is not None:
+            await self._send_file(scope, send, response)
+            return
+        if response.chunks is None:
+            await send({"type": "http.response.body", "body": response.body})
+            return
+
+        await self._send_chunks(send, response.chunks)
+
+    async def _send_chunks(self, send: Send, chunks: Iterable[bytes]) -> None:
+        """
+        Send streamed body, one body event per chunk.
+
+        Parameters:
+            send (Send): awaitable sending an event
+            chunks (Iterable[bytes]): encoded body chunks
+        """
+        # Chunks may be produced by blocking handler code
+        loop = asyncio.get_running_loop()
+        iterator = iter(chunks)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(
+                    self.executor, next, iterator, None
+                )
+                if chunk is None:
+                    break
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": True,
+                    }
+                )
+        finally:
+            # Ends the request observation when the client disconnects
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _send_file(
+        self, scope: Scope, send: Send, response: Response
+    ) -> None:
+        """
+        Send file body, with `sendfile` if the server supports zero-copy.
+
+        Parameters:
+            scope (Scope): connection scope
+            send (Send): awaitable sending an event
+            response (Response): response with a file body
+        """
+        loop = asyncio.get_running_loop()
+        with open(response.file, "rb") as file_:
+            if _ZEROCOPYSEND in scope.get("extensions", {}):
+                await send({"type": _ZEROCOPYSEND, "file": file_})
+                return
+
+            while True:
+                chunk = await loop.run_in_executor(
+                    self.executor, file_.read, _FILE_CHUNK_SIZE
+                )
+                if not chunk:
+                    break
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": True,
+                    }
+                )
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        """
+        Handle lifespan events, release the thread pool on shutdown.
+
+        Parameters:
+            receive (Receive): awaitable returning next event
+            send (Send): awaitable sending an event
+        """
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def close(self) -> None:
+        """Shut down the handler thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Getter method for handler thread pool, created on first use.
+
+        Returns:
+            handler thread pool
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="viper-boot-handler",
+            )
+        return self._executor
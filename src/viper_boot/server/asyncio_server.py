@@ -0,0 +1,628 @@
+"""Asyncio HTTP/1.1 Server for ASGI applications."""
+import asyncio
+import signal
+import socket
+from http import HTTPStatus
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from urllib.parse import unquote
+
+from .asgi import Message
+from .asgi import Scope
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+class _BadRequestError(ValueError):
+    """Raised when the request can not be parsed or is not supported."""
+
+    def __init__(
+        self, message: str, status: HTTPStatus = HTTPStatus.BAD_REQUEST
+    ) -> None:
+        """
+        Keep the status of the error response.
+
+        Parameters:
+            message (str): error description
+            status (HTTPStatus): error response status
+        """
+        super().__init__(message)
+        self.status = status
+
+
+# Server settings and the running connections are kept together
+class AsyncioServer:  # pylint: disable=too-many-instance-attributes
+    """
+    Minimal HTTP/1.1 server running an ASGI application on asyncio.
+
+    Connections are kept alive between requests, every connection is a
+    coroutine so idle or slow clients do not block the others. Request
+    bodies must have `Content-Length`, chunked request bodies are refused
+    with `411 Length Required`. `Expect: 100-continue` is answered before
+    the body is read, other expectations with `417 Expectation Failed`.
+    Responses without `Content-Length` are sent with chunked transfer
+    encoding, to HTTP/1.0 clients as is and the connection is closed after
+    the body.
+    """
+
+    _MAX_HEADERS = 100
+    _MAX_LINE = 8192
+    _MAX_BODY = 1024 * 1024
+
+    # Every server setting is a keyword with a default
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        app: Any,
+        host: str = "127.0.0.1",
+        port: int = 3000,
+        keep_alive_timeout: float = 5.0,
+        body_timeout: float = 30.0,
+        backlog: int = 2048,
+        sock: Optional[socket.socket] = None,
+        max_requests: int = 0,
+    ) -> None:
+        """
+        Initialise the server.
+
+        Parameters:
+            app (Any): ASGI application
+            host (str): interface to bind
+            port (int): port to bind
+            keep_alive_timeout (float): seconds to wait for next request
+                on an idle connection
+            body_timeout (float): seconds to wait for the request body once
+                its headers are read
+            backlog (int): listen queue size
+            sock (Optional[socket.socket]): listening socket to serve on
+                instead of binding host and port, e.g. inherited from the
+                pre-fork arbiter
+            max_requests (int): stop gracefully after serving this many
+                requests, 0 for no limit
+        """
+        self._app = app
+        self._host = host
+        self._port = port
+        self._keep_alive_timeout = keep_alive_timeout
+        self._body_timeout = body_timeout
+        self._backlog = backlog
+        self._sock = sock
+        if sock is not None:
+            self._host, self._port = sock.getsockname()[:2]
+        self._max_requests = max_requests
+        self._handled = 0
+        self._connections: Set["asyncio.Task[Any]"] = set()
+        self._stopping: Optional[asyncio.Event] = None
+
+    def run(self) -> None:
+        """Serve until interrupted or terminated."""
+        try:
+            print(f"Asyncio server started http://{self._host}:{self._port}")
+            asyncio.run(self._run())
+        except KeyboardInterrupt:
+            print("\nKeyboard interrupt received, exiting.")
+
+    async def _run(self) -> None:
+        """Stop gracefully on `SIGTERM`, then serve."""
+        try:
+            asyncio.get_running_loop().add_signal_handler(
+                signal.SIGTERM, self.stop
+            )
+        except NotImplementedError:  # pragma: no cover
+            pass  # Windows event loops do not support signal handlers
+        await self.serve()
+
+    async def serve(self) -> None:
+        """Run lifespan startup, accept connections, run lifespan shutdown."""
+        self._stopping = asyncio.Event()
+        lifespan = _Lifespan(self._app)
+        await lifespan.startup()
+        if self._sock is not None:
+            address: Dict[str, Any] = {"sock": self._sock}
+        else:
+            address = {"host": self._host, "port": self._port}
+        server = await asyncio.start_server(
+            self._handle,
+            backlog=self._backlog,
+            limit=self._MAX_LINE,
+            **address,
+        )
+        try:
+            async with server:
+                await self._stopping.wait()
+                server.close()
+                # Let open connections finish their current request
+                if self._connections:
+                    _, pending = await asyncio.wait(
+                        self._connections, timeout=self._keep_alive_timeout
+                    )
+                    for task in pending:
+                        task.cancel()
+        finally:
+            await lifespan.shutdown()
+
+    def stop(self) -> None:
+        """Stop accepting connections and shut down gracefully."""
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Serve requests on one connection until it is closed.
+
+        Parameters:
+            reader (asyncio.StreamReader): connection reader
+            writer (asyncio.StreamWriter): connection writer
+        """
+        task = asyncio.current_task()
+        self._connections.add(task)
+        _set_nodelay(writer.get_extra_info("socket"))
+        try:
+            keep_alive = True
+            while keep_alive and not self._stopping.is_set():
+                try:
+                    request = await self._read_request(reader, writer)
+                except _BadRequestError as error:
+                    self._write_error(writer, error.status)
+                    break
+                if request is None:
+                    break
+
+                scope, body, keep_alive = request
+                scope["client"] = writer.get_extra_info("peername")
+                scope["server"] = writer.get_extra_info("sockname")
+                self._handled += 1
+                if self._max_requests and self._handled >= self._max_requests:
+                    self.stop()
+                keep_alive = keep_alive and not self._stopping.is_set()
+
+                cycle = _Cycle(self._app, scope, body, writer, keep_alive)
+                await cycle.run()
+                await writer.drain()
+                keep_alive = cycle.keep_alive
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+            pass
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            self._connections.discard(task)
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> Optional[Tuple[Scope, bytes, bool]]:
+        """
+        Read request head within the keep-alive timeout, then its body.
+
+        Parameters:
+            reader (asyncio.StreamReader): connection reader
+            writer (asyncio.StreamWriter): connection writer, answers
+                `Expect: 100-continue`
+
+        Raises:
+            _BadRequestError: if the request is malformed or not supported
+
+        Returns:
+            scope, body and keep-alive flag, None when connection closed
+        """
+        head = await asyncio.wait_for(
+            self._read_head(reader), self._keep_alive_timeout
+        )
+        if head is None:
+            return None
+
+        scope, keep_alive = head
+        body = await asyncio.wait_for(
+            self._read_body(reader, writer, dict(scope["headers"])),
+            self._body_timeout,
+        )
+        return scope, body, keep_alive
+
+    async def _read_head(
+        self, reader: asyncio.StreamReader
+    ) -> Optional[Tuple[Scope, bool]]:
+        """
+        Read request line and headers.
+
+        Parameters:
+            reader (asyncio.StreamReader): connection reader
+
+        Raises:
+            _BadRequestError: if the request line or headers are malformed
+
+        Returns:
+            scope and keep-alive flag, None when connection closed
+        """
+        try:
+            line = await reader.readline()
+        except ValueError as error:
+            raise _BadRequestError("Request line too long") from error
+        if not line:
+            return None
+
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError as error:
+            raise _BadRequestError("Invalid request line") from error
+
+        headers = await self._read_headers(reader)
+        connection = dict(headers).get(b"connection", b"").lower()
+        http_version = version.split("/", 1)[-1]
+        if http_version == "1.0":
+            keep_alive = connection == b"keep-alive"
+        else:
+            keep_alive = connection != b"close"
+
+        raw_path, _, query = target.partition("?")
+        scope: Scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": http_version,
+            "method": method.upper(),
+            "scheme": "http",
+            "path": unquote(raw_path),
+            "raw_path": raw_path.encode("latin-1"),
+            "query_string": query.encode("latin-1"),
+            "root_path": "",
+            "headers": headers,
+            "extensions": {"http.response.zerocopysend": {}},
+        }
+        return scope, keep_alive
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> Headers:
+        """
+        Read headers up to the empty line ending them.
+
+        Parameters:
+            reader (asyncio.StreamReader): connection reader
+
+        Raises:
+            _BadRequestError: if a header is malformed, too long or there
+                are too many
+
+        Returns:
+            headers with lower case names
+        """
+        headers: Headers = []
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError as error:
+                raise _BadRequestError(
+                    "Header line too long",
+                    HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                ) from error
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            if len(headers) >= self._MAX_HEADERS:
+                raise _BadRequestError(
+                    "Too many headers",
+                    HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                )
+            if b":" not in line:
+                raise _BadRequestError("Invalid headers")
+            name, value = line.split(b":", 1)
+            headers.append((name.strip().lower(), value.strip()))
+
+    async def _read_body(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        fields: Dict[bytes, bytes],
+    ) -> bytes:
+        """
+        Read request body of `Content-Length` bytes.
+
+        Parameters:
+            reader (asyncio.StreamReader): connection reader
+            writer (asyncio.StreamWriter): connection writer, answers
+                `Expect: 100-continue`
+            fields (Dict[bytes, bytes]): request headers by lower case name
+
+        Raises:
+            _BadRequestError: if the body is chunked, too large, its length
+                is malformed or the expectation is not supported
+
+        Returns:
+            raw request body
+        """
+        if b"chunked" in fields.get(b"transfer-encoding", b"").lower():
+            raise _BadRequestError(
+                "Chunked request body not supported",
+                HTTPStatus.LENGTH_REQUIRED,
+            )
+        value = fields.get(b"content-length", b"0")
+        if not value.isdigit():
+            raise _BadRequestError("Invalid content length")
+        length = int(value)
+        if length > self._MAX_BODY:
+            raise _BadRequestError(
+                "Request body too large", HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            )
+
+        expect = fields.get(b"expect")
+        if expect is not None:
+            if expect.lower() != b"100-continue":
+                raise _BadRequestError(
+                    "Expectation not supported",
+                    HTTPStatus.EXPECTATION_FAILED,
+                )
+            if length:
+                writer.write(b"HTTP/1.1 100 Continue\r\n\r\n")
+                await writer.drain()
+
+        return await reader.readexactly(length) if length else b""
+
+    @staticmethod
+    def _write_error(writer: asyncio.StreamWriter, status: HTTPStatus) -> None:
+        """
+        Write error response and ask the client to close the connection.
+
+        Parameters:
+            writer (asyncio.StreamWriter): connection writer
+            status (HTTPStatus): error status
+        """
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Length: 0\r\nConnection: close\r\n\r\n".encode("latin-1")
+        )
+
+
+# Request and response state of the cycle are kept together
+class _Cycle:  # pylint: disable=too-many-instance-attributes
+    """Single request/response cycle between the connection and the app."""
+
+    def __init__(
+        self,
+        app: Any,
+        scope: Scope,
+        body: bytes,
+        writer: asyncio.StreamWriter,
+        keep_alive: bool,
+    ) -> None:
+        """
+        Initialise the cycle.
+
+        Parameters:
+            app (Any): ASGI application
+            scope (Scope): request scope
+            body (bytes): request body
+            writer (asyncio.StreamWriter): connection writer
+            keep_alive (bool): keep connection open after the response
+        """
+        self._app = app
+        self._scope = scope
+        self._body: Optional[bytes] = body
+        self._writer = writer
+        self._keep_alive = keep_alive
+        self._started = False
+        self._chunked = False
+        self._complete = asyncio.Event()
+
+    async def run(self) -> None:
+        """Run the application and make sure a response is sent."""
+        try:
+            await self._app(self._scope, self._receive, self._send)
+        except Exception:  # pylint: disable=broad-except
+            if self._started:
+                raise
+            await self._send(
+                {"type": "http.response.start", "status": 500, "headers": []}
+            )
+            await self._send({"type": "http.response.body", "body": b""})
+
+    @property
+    def keep_alive(self) -> bool:
+        """
+        Getter method for keep-alive flag.
+
+        Returns:
+            True when the connection can serve the next request, False
+            after an HTTP/1.0 response ended by closing the connection
+        """
+        return self._keep_alive
+
+    async def _receive(self) -> Message:
+        """
+        Return the request body, then wait for the response to complete.
+
+        Returns:
+            ASGI receive event
+        """
+        if self._body is not None:
+            body, self._body = self._body, None
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self._complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def _send(self, message: Message) -> None:
+        """
+        Write ASGI send event to the connection.
+
+        Parameters:
+            message (Message): ASGI send event
+        """
+        if message["type"] == "http.response.start":
+            self._start(message["status"], message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if self._chunked:
+                if body:
+                    self._writer.write(b"%x\r\n%b\r\n" % (len(body), body))
+                if not more_body:
+                    self._writer.write(b"0\r\n\r\n")
+            else:
+                self._writer.write(body)
+            if more_body:
+                await self._writer.drain()
+            else:
+                self._complete.set()
+        elif message["type"] == "http.response.zerocopysend":
+            await self._sendfile(message)
+
+    async def _sendfile(self, message: Message) -> None:
+        """
+        Write file body with `sendfile`, copied by the kernel.
+
+        Parameters:
+            message (Message): ASGI zero-copy send event
+        """
+        more_body = message.get("more_body", False)
+        if self._chunked:
+            # Chunk sizes are unknown, fall back to copying the file
+            file_ = message["file"]
+            file_.seek(message.get("offset") or 0)
+            body = file_.read(message.get("count"))
+            await self._send(
+                {
+                    "type": "http.response.body",
+                    "body": body,
+                    "more_body": more_body,
+                }
+            )
+            return
+
+        await self._writer.drain()
+        await asyncio.get_running_loop().sendfile(
+            self._writer.transport,
+            message["file"],
+            message.get("offset") or 0,
+            message.get("count"),
+        )
+        if not more_body:
+            self._complete.set()
+
+    def _start(self, status: int, headers: Headers) -> None:
+        """
+        Write status line and headers.
+
+        Parameters:
+            status (int): HTTP status code
+            headers (Headers): response headers
+        """
+        self._started = True
+        names = {name.lower() for name, _ in headers}
+        unframed = b"content-length" not in names and status not in (
+            HTTPStatus.NO_CONTENT,
+            HTTPStatus.NOT_MODIFIED,
+        )
+        if self._scope.get("http_version") == "1.0":
+            # HTTP/1.0 clients read an unframed body until the connection
+            # is closed, they do not know chunked transfer encoding
+            self._keep_alive = self._keep_alive and not unframed
+        else:
+            self._chunked = unframed
+
+        lines = [
+            b"HTTP/1.1 %d %b"
+            % (status, _reason(status).encode("latin-1"))
+        ]
+        lines.extend(b"%b: %b" % (name, value) for name, value in headers)
+        if self._chunked:
+            lines.append(b"transfer-encoding: chunked")
+        if not self._keep_alive:
+            lines.append(b"connection: close")
+        self._writer.write(b"\r\n".join(lines) + b"\r\n\r\n")
+
+
+class _Lifespan:
+    """Drive the ASGI lifespan protocol of the application."""
+
+    def __init__(self, app: Any) -> None:
+        """
+        Initialise the lifespan.
+
+        Parameters:
+            app (Any): ASGI application
+        """
+        self._app = app
+        self._events: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._complete = asyncio.Event()
+
+    async def startup(self) -> None:
+        """Send startup event and wait for the application to complete."""
+        self._task = asyncio.create_task(self._run())
+        await self._send_and_wait({"type": "lifespan.startup"})
+
+    async def shutdown(self) -> None:
+        """Send shutdown event and wait for the application to complete."""
+        if self._task is not None and not self._task.done():
+            await self._send_and_wait({"type": "lifespan.shutdown"})
+
+    async def _run(self) -> None:
+        """Run the application lifespan scope."""
+        try:
+            await self._app(
+                {"type": "lifespan", "asgi": {"version": "3.0"}},
+                self._events.get,
+                self._sent,
+            )
+        except Exception:  # pylint: disable=broad-except
+            # Lifespan is optional for ASGI applications
+            pass
+        finally:
+            self._complete.set()
+
+    async def _sent(self, _message: Message) -> None:
+        """
+        Receive completion event from the application.
+
+        Parameters:
+            _message (Message): ASGI lifespan event
+        """
+        self._complete.set()
+
+    async def _send_and_wait(self, message: Message) -> None:
+        """
+        Send lifespan event and wait for its completion.
+
+        Parameters:
+            message (Message): ASGI lifespan event
+        """
+        self._complete.clear()
+        await self._events.put(message)
+        await self._complete.wait()
+
+
+def _reason(status: int) -> str:
+    """
+    Get reason phrase of the status code.
+
+    Parameters:
+        status (int): HTTP status code
+
+    Returns:
+        reason phrase
+    """
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+
+def _set_nodelay(sock: Optional[Any]) -> None:
+    """
+    Disable Nagle's algorithm on a TCP connection.
+
+    Status line and headers are written before the body, without it the
+    body waits for the delayed ACK of the client. asyncio only disables it
+    when the listening socket was created with `IPPROTO_TCP`, not for the
+    socket inherited from the pre-fork arbiter.
+
+    Parameters:
+        sock (Optional[Any]): connection socket, None for other transports
+    """
+    if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except OSError:
+        pass  # Connection already closed by the client
@@ -0,0 +1,679 @@
+"""API Request Dispatcher."""
+import asyncio
+import contextvars
+import inspect
+import itertools
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextlib import ExitStack
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+from marshmallow import ValidationError
+from requests import RequestException
+
+from ..utils.json_encoder import create_json_encoder
+from ..utils.json_encoder import JsonEncoder
+from ..utils.lazy_import import lazy_import
+from ..utils.metrics import METRICS
+from ..utils.profiling import PROFILER
+from ..utils.tracing import TRACER
+from .router import MethodNotAllowedError
+from .router import Route
+from .router import RouteNotFoundError
+from .router import Router
+
+# Serves requests no route matches, with method, path and request headers
+Fallback = Callable[[str, str, Mapping[str, str]], Optional["Response"]]
+
+# Only loaded by the async HTTP client, or to match upstream failures
+httpx = lazy_import("httpx")
+
+
+class Response:
+    """
+    HTTP response produced by the dispatcher.
+
+    Properties:
+        status (int): HTTP status code
+        headers (List[Tuple[str, str]]): HTTP response headers
+        body (bytes): encoded response body
+        chunks (Optional[Iterable[bytes]]): encoded body chunks, written
+            as they are produced instead of `body`
+        file (Optional[Path]): file sent as body instead of `body`, with
+            `sendfile` where the server supports it
+        encoder (JsonEncoder): encoder of JSON bodies, see
+            `create_json_encoder`
+    """
+
+    encoder: JsonEncoder = create_json_encoder()
+
+    def __init__(
+        self,
+        status: int,
+        body: bytes = b"",
+        content_type: str = "application/json",
+        chunks: Optional[Iterable[bytes]] = None,
+        file: Optional[Path] = None,
+    ) -> None:
+        """
+        Set response status, body and headers.
+
+        Parameters:
+            status (int): HTTP status code
+            body (bytes): encoded response body
+            content_type (str): media type of the body
+            chunks (Optional[Iterable[bytes]]): streamed body, the length
+                is not known upfront
+            file (Optional[Path]): file to send as body
+        """
+        self.status = status
+        self.body = body
+        self.chunks = chunks
+        self.file = file
+        self.headers: List[Tuple[str, str]] = []
+        if file is not None:
+            self.headers.append(("Content-Length", str(file.stat().st_size)))
+        elif chunks is None:
+            self.headers.append(("Content-Length", str(len(body))))
+        if body or chunks is not None or file is not None:
+            self.headers.append(("Content-Type", content_type))
+
+    @classmethod
+    def json(cls, status: int, data: Any, pretty: bool = False) -> "Response":
+        """
+        Create JSON response.
+
+        Parameters:
+            status (int): HTTP status code
+            data (Any): JSON serializable data
+            pretty (bool): indent the body instead of compact output
+
+        Returns:
+            response object
+        """
+        if status == HTTPStatus.NO_CONTENT or data is None:
+            return cls(status)
+
+        return cls(status, cls.encoder.encode(data, pretty))
+
+    @classmethod
+    def json_stream(
+        cls,
+        status: int,
+        records: Iterable[Any],
+        ndjson: bool = False,
+        batch_size: int = 100,
+        pretty: bool = False,
+    ) -> "Response":
+        """
+        Create streamed JSON array or newline delimited JSON response.
+
+        Records are encoded lazily, `batch_size` records per chunk, so only
+        one batch is held in memory at a time.
+
+        Parameters:
+            status (int): HTTP status code
+            records (Iterable[Any]): JSON serializable records
+            ndjson (bool): one record per line instead of JSON array
+            batch_size (int): records per chunk
+            pretty (bool): indent records of the JSON array, newline
+                delimited records stay on one line
+
+        Returns:
+            response object
+        """
+        return cls(
+            status,
+            content_type=(
+                "application/x-ndjson" if ndjson else "application/json"
+            ),
+            chunks=_json_chunks(
+                cls.encoder, records, ndjson, batch_size, pretty
+            ),
+        )
+
+    @classmethod
+    def error(
+        cls, status: int, message: Any, pretty: bool = False
+    ) -> "Response":
+        """
+        Create JSON error response.
+
+        Parameters:
+            status (int): HTTP status code
+            message (Any): error message or validation errors
+            pretty (bool): indent the body instead of compact output
+
+        Returns:
+            response object
+        """
+        return cls.json(status, {"code": status, "message": message}, pretty)
+
+
+class Dispatcher:
+    """
+    Dispatch requests to the handlers registered with the router.
+
+    Handlers may be plain functions or coroutine functions. `dispatch`
+    runs coroutines on an event loop kept per calling thread, so their
+    pooled upstream connections are reused between requests.
+    `dispatch_async` awaits them on the running loop instead.
+    """
+
+    def __init__(
+        self,
+        router: Router,
+        fallback: Optional[Fallback] = None,
+    ) -> None:
+        """
+        Initialise the dispatcher.
+
+        Parameters:
+            router (Router): router with the registered API routes
+            fallback (Optional[Fallback]): called with method, path and
+                request headers when no route matches, returns response or
+                None for `404 Not found`, e.g. to serve documents
+        """
+        self._router = router
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def dispatch(
+        self,
+        method: str,
+        target: str,
+        body: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        """
+        Route the request to its handler and build the response.
+
+        Handlers return JSON serializable data, or a `Response` which is
+        passed through, e.g. to stream the body or add headers. JSON bodies
+        are compact unless the query has a `pretty` parameter.
+
+        Parameters:
+            method (str): HTTP method
+            target (str): request target, path with optional query string
+            body (bytes): raw request body
+            headers (Optional[Mapping[str, str]]): request headers, lower
+                case names
+
+        Returns:
+            (Response): HTTP response
+        """
+        start = time.perf_counter()
+        path = urlsplit(target).path
+
+        try:
+            route, params = self._router.match(method, path)
+        except RouteNotFoundError:
+            response = (
+                self._fallback(method, path, headers or {})
+                if self._fallback
+                else None
+            )
+            return response or Response.error(
+                HTTPStatus.NOT_FOUND, "Not found"
+            )
+        except MethodNotAllowedError as error:
+            response = Response.error(
+                HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed"
+            )
+            response.headers.append(("Allow", ", ".join(error.allowed)))
+            return response
+
+        routed = time.perf_counter()
+        context = contextvars.copy_context()
+
+        def observed() -> Response:
+            with ExitStack() as stack:
+                stack.enter_context(
+                    self._observe(route, target, headers, start, routed)
+                )
+                if PROFILER.requested(target, headers):
+                    return self._profile(route, params, target, body)
+                response = self._handle(route, params, target, body)
+                if response.chunks is not None:
+                    # Streamed body is produced within the observation
+                    response.chunks = _ObservedChunks(
+                        response.chunks, context, stack.pop_all()
+                    )
+                return response
+
+        return context.run(observed)
+
+    async def dispatch_async(
+        self,
+        method: str,
+        target: str,
+        body: bytes = b"",
+        headers: Optional[Mapping[str, str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> Response:
+        """
+        Route the request, awaiting coroutine handlers on the running loop.
+
+        Plain handlers, the fallback, error responses and profiled requests
+        are dispatched on the executor, so blocking I/O does not block the
+        loop. A body streamed by a coroutine handler is produced after its
+        request is timed and traced, stream from plain handlers instead.
+
+        Parameters:
+            method (str): HTTP method
+            target (str): request target, path with optional query string
+            body (bytes): raw request body
+            headers (Optional[Mapping[str, str]]): request headers, lower
+                case names
+            executor (Optional[Executor]): executor for blocking handlers,
+                defaults to the loop default executor
+
+        Returns:
+            (Response): HTTP response
+        """
+        start = time.perf_counter()
+        try:
+            route, params = self._router.match(method, urlsplit(target).path)
+            routed = time.perf_counter()
+            args = self._arguments(route, params, body)
+        except (RouteNotFoundError, MethodNotAllowedError, ValueError):
+            route = None
+
+        if (
+            route is None
+            or not inspect.iscoroutinefunction(route.handler)
+            or PROFILER.requested(target, headers)
+        ):
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, self.dispatch, method, target, body, headers
+            )
+
+        with self._observe(route, target, headers, start, routed):
+            pretty = self._pretty(target)
+            try:
+                data = await route.handler(
+                    *args, **self._query(route, target)
+                )
+            except ValidationError as error:
+                return Response.error(
+                    HTTPStatus.UNPROCESSABLE_ENTITY, error.messages, pretty
+                )
+            except (RequestException, httpx.HTTPError):
+                return Response.error(
+                    HTTPStatus.INTERNAL_SERVER_ERROR, "Server error", pretty
+                )
+            except Exception:  # pylint: disable=broad-except
+                traceback.print_exc()
+                return Response.error(
+                    HTTPStatus.INTERNAL_SERVER_ERROR, "Server error", pretty
+                )
+
+            if isinstance(data, Response):
+                return data
+            with METRICS.stage("dump"):
+                return Response.json(route.status, data, pretty)
+
+    def close(self) -> None:
+        """Close the coroutine handler event loop of the calling thread."""
+        loop = getattr(self._local, "loop", None)
+        if loop is not None:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+            self._local.loop = None
+
+    @staticmethod
+    @contextmanager
+    def _observe(
+        route: Route,
+        target: str,
+        headers: Optional[Mapping[str, str]],
+        start: float,
+        routed: float,
+    ) -> Iterator[None]:
+        """
+        Time the request for its metrics and trace it.
+
+        Parameters:
+            route (Route): matched route, its operationId labels both
+            target (str): request target, path with optional query string
+            headers (Optional[Mapping[str, str]]): request headers, the
+                `traceparent` header continues the trace of the caller
+            start (float): `time.perf_counter` when the request started
+            routed (float): `time.perf_counter` when the route matched
+
+        Yields:
+            None
+        """
+        with METRICS.request(route.operation_id, start) as timings:
+            if timings is not None:
+                timings.add("routing", routed - start)
+            with TRACER.trace(
+                route.operation_id,
+                (headers or {}).get("traceparent", ""),
+                path=urlsplit(target).path,
+            ):
+                yield
+
+    def _handle(
+        self,
+        route: Route,
+        params: Dict[str, Any],
+        target: str,
+        body: bytes,
+    ) -> Response:
+        """
+        Call the handler of the matched route and build the response.
+
+        Parameters:
+            route (Route): matched route
+            params (Dict[str, Any]): converted path parameters
+            target (str): request target, path with optional query string
+            body (bytes): raw request body
+
+        Returns:
+            (Response): HTTP response
+        """
+        try:
+            args = self._arguments(route, params, body)
+        except ValueError:
+            return Response.error(HTTPStatus.BAD_REQUEST, "Bad request")
+
+        pretty = self._pretty(target)
+        try:
+            data = route.handler(*args, **self._query(route, target))
+            if inspect.isawaitable(data):
+                data = self._loop.run_until_complete(data)
+        except ValidationError as error:
+            return Response.error(
+                HTTPStatus.UNPROCESSABLE_ENTITY, error.messages, pretty
+            )
+        except (RequestException, httpx.HTTPError):
+            return Response.error(
+                HTTPStatus.INTERNAL_SERVER_ERROR, "Server error", pretty
+            )
+        except Exception:  # pylint: disable=broad-except
+            # Unexpected handler errors are answered, not left to the server
+            traceback.print_exc()
+            return Response.error(
+                HTTPStatus.INTERNAL_SERVER_ERROR, "Server error", pretty
+            )
+
+        if isinstance(data, Response):
+            return data
+        with METRICS.stage("dump"):
+            return Response.json(route.status, data, pretty)
+
+    def _profile(
+        self,
+        route: Route,
+        params: Dict[str, Any],
+        target: str,
+        body: bytes,
+    ) -> Response:
+        """
+        Handle the request under `cProfile`, respond with the statistics.
+
+        Streamed bodies are produced in the profile too. The status of the
+        profiled response is sent in the `X-Profile-Status` header.
+
+        Parameters:
+            route (Route): matched route
+            params (Dict[str, Any]): converted path parameters
+            target (str): request target, path with optional query string
+            body (bytes): raw request body
+
+        Returns:
+            (Response): profile statistics as plain text
+        """
+
+        def handle() -> Response:
+            response = self._handle(route, params, target, body)
+            if response.chunks is not None:
+                response.body = b"".join(response.chunks)
+                response.chunks = None
+            return response
+
+        response, stats = PROFILER.profile(handle)
+        profiled = Response(
+            HTTPStatus.OK, stats.encode("utf-8"), "text/plain; charset=utf-8"
+        )
+        profiled.headers.append(
+            ("X-Profile-Status", str(int(response.status)))
+        )
+        return profiled
+
+    def _arguments(
+        self, route: Route, params: Dict[str, Any], body: bytes
+    ) -> List[Any]:
+        """
+        Build handler arguments, path parameters followed by the body.
+
+        Parameters:
+            route (Route): matched route
+            params (Dict[str, Any]): converted path parameters
+            body (bytes): raw request body
+
+        Raises:
+            ValueError: if the route takes a body which is not a JSON object
+
+        Returns:
+            positional handler arguments
+        """
+        args: List[Any] = list(params.values())
+        if route.has_body:
+            args.append(self._load_body(body))
+
+        return args
+
+    @staticmethod
+    def _query(route: Route, target: str) -> Dict[str, str]:
+        """
+        Get query parameters declared by the route.
+
+        Parameters:
+            route (Route): matched route
+            target (str): request target, path with optional query string
+
+        Returns:
+            last value of every declared parameter present in the query,
+            empty for parameters without value, e.g. `?pretty`
+        """
+        if not route.query:
+            return {}
+
+        query = parse_qs(urlsplit(target).query, keep_blank_values=True)
+        return {name: query[name][-1] for name in route.query if name in query}
+
+    @staticmethod
+    def _pretty(target: str) -> bool:
+        """
+        Check whether the query asks for pretty JSON, e.g. `?pretty`.
+
+        Parameters:
+            target (str): request target, path with optional query string
+
+        Returns:
+            True unless `pretty` is missing, `0` or `false`
+        """
+        query = urlsplit(target).query
+        if "pretty" not in query:
+            return False
+
+        values = parse_qs(query, keep_blank_values=True).get("pretty")
+        return bool(values) and values[-1].lower() not in ("0", "false")
+
+    @property
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Getter method for the event loop of the calling thread.
+
+        Returns:
+            event loop running coroutine handlers of `dispatch`
+        """
+        loop: Optional[asyncio.AbstractEventLoop] = getattr(
+            self._local, "loop", None
+        )
+        if loop is None or loop.is_closed():
+            loop = self._local.loop = asyncio.new_event_loop()
+
+        return loop
+
+    @staticmethod
+    def _load_body(body: bytes) -> Dict[str, Any]:
+        """
+        Decode JSON request body.
+
+        Parameters:
+            body (bytes): raw request body
+
+        Raises:
+            ValueError: if body is not a JSON object
+
+        Returns:
+            decoded request body
+        """
+        data = Response.encoder.decode(body or b"null")
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+
+        return data
+
+    @property
+    def router(self) -> Router:
+        """
+        Getter method for router.
+
+        Returns:
+            API router
+        """
+        return self._router
+
+
+def _json_chunks(
+    encoder: JsonEncoder,
+    records: Iterable[Any],
+    ndjson: bool,
+    batch_size: int,
+    pretty: bool = False,
+) -> Iterator[bytes]:
+    """
+    Encode records to JSON array or newline delimited JSON chunks.
+
+    Parameters:
+        encoder (JsonEncoder): JSON encoder
+        records (Iterable[Any]): JSON serializable records
+        ndjson (bool): one record per line instead of JSON array
+        batch_size (int): records per chunk
+        pretty (bool): indent records of the JSON array
+
+    Yields:
+        encoded chunk
+    """
+    iterator = iter(records)
+    pretty = pretty and not ndjson
+    separator = b"\n" if ndjson else b",\n" if pretty else b","
+    prefix = b"" if ndjson else b"["
+    suffix = b"\n" if ndjson else b""
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            break
+        chunk = separator.join(
+            encoder.encode(record, pretty) for record in batch
+        )
+        yield prefix + chunk + suffix
+        prefix = b"" if ndjson else separator
+
+    if not ndjson:
+        yield b"[]" if prefix == b"[" else b"]"
+
+
+class _ObservedChunks:
+    """
+    Streamed body produced within the observation of its request.
+
+    Chunks are produced in the context of the request, so their spans and
+    stage timings belong to it. The request is timed and its trace ends
+    after the last chunk, on error, or when the body is closed early.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        context: contextvars.Context,
+        stack: ExitStack,
+    ) -> None:
+        """
+        Take over the observation of the request.
+
+        Parameters:
+            chunks (Iterable[bytes]): encoded body chunks
+            context (contextvars.Context): context of the request
+            stack (ExitStack): open observation of the request
+        """
+        self._chunks = iter(chunks)
+        self._context = context
+        self._stack: Optional[ExitStack] = stack
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Get iterator of the chunks.
+
+        Returns:
+            itself
+        """
+        return self
+
+    def __next__(self) -> bytes:
+        """
+        Produce the next chunk.
+
+        Raises:
+            StopIteration: after the last chunk
+
+        Returns:
+            encoded chunk
+        """
+        try:
+            chunk: bytes = self._context.run(next, self._chunks)
+        except StopIteration:
+            self.close()
+            raise
+        except BaseException:
+            self._end(*sys.exc_info())
+            raise
+        return chunk
+
+    def close(self) -> None:
+        """End the observation, e.g. when the client disconnected."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None and self._stack is not None:
+            self._context.run(close)
+        self._end(None, None, None)
+
+    def _end(self, *exc_info: Any) -> None:
+        """
+        End the observation once, in the context of the request.
+
+        Parameters:
+            *exc_info (Any): error ending the body, None for no error
+        """  # noqa: RST210
+        stack, self._stack = self._stack, None
+        if stack is not None:
+            self._context.run(stack.__exit__, *exc_info)
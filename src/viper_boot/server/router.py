@@ -0,0 +1,248 @@
+"""API Router."""
+import uuid
+from types import MappingProxyType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+
+class RouteNotFoundError(LookupError):
+    """Raised when no registered path template matches the request path."""
+
+
+class MethodNotAllowedError(LookupError):
+    """Raised when the path matches but not for the requested method."""
+
+    def __init__(self, path: str, allowed: List[str]) -> None:
+        """
+        Keep the methods allowed on the matched path.
+
+        Parameters:
+            path (str): request path
+            allowed (List[str]): HTTP methods registered for the path
+        """
+        super().__init__(path)
+        self.allowed = allowed
+
+
+class Route(NamedTuple):
+    """
+    Route registered for a path template and HTTP method.
+
+    Properties:
+        method (str): HTTP method in upper case
+        path (str): path template, e.g. `/api/v1/student/{id}`
+        handler (Any): endpoint handler
+        status (int): HTTP status code of successful response
+        has_body (bool): pass the request body to the handler or not
+        param_types (Mapping[str, str]): converter name of path parameters,
+            parameters not listed are matched as `str`
+        query (Tuple[str, ...]): query parameters passed to the handler as
+            keyword arguments when present in the request
+        operation_id (str): OpenAPI operationId, labels request metrics
+    """
+
+    method: str
+    path: str
+    handler: Any
+    status: int
+    has_body: bool
+    param_types: Mapping[str, str] = MappingProxyType({})
+    query: Tuple[str, ...] = ()
+    operation_id: str = ""
+
+
+class _Node:
+    """
+    Node of the routing tree, one per path segment.
+
+    Properties:
+        static (Dict[str, _Node]): children for literal segments
+        params (List[Tuple[str, _Node]]): children for parameter segments
+            as (converter name, node), typed converters first
+        methods (Dict[str, Tuple[Route, List[str]]]): routes ending at
+            this node with their parameter names, by method
+    """
+
+    __slots__ = ("static", "params", "methods")
+
+    def __init__(self) -> None:
+        """Initialise an empty node."""
+        self.static: Dict[str, _Node] = {}
+        self.params: List[Tuple[str, _Node]] = []
+        self.methods: Dict[str, Tuple[Route, List[str]]] = {}
+
+
+class Router:
+    """
+    Match request paths against registered path templates.
+
+    Templates are compiled into a tree keyed by path segment, so lookup
+    walks one node per segment regardless of the number of routes.
+    Parameter segments are tried only when no literal segment matches,
+    typed parameters before `str` ones.
+    """
+
+    CONVERTERS: Dict[str, Callable[[str], Any]] = {
+        "str": str,
+        "int": int,
+        "uuid": uuid.UUID,
+    }
+
+    def __init__(self) -> None:
+        """Initialise the router with no routes."""
+        self._root = _Node()
+        self._routes: List[Route] = []
+
+    def add(self, route: Route) -> None:
+        """
+        Add route to the router.
+
+        Parameters:
+            route (Route): route to add
+
+        Raises:
+            ValueError: if the template mixes literal text and parameter
+                in one segment or uses an unknown converter
+        """
+        node = self._root
+        names: List[str] = []
+        for segment in self._split(route.path):
+            if not (segment.startswith("{") and segment.endswith("}")):
+                if "{" in segment or "}" in segment:
+                    raise ValueError(f"Invalid path segment: {segment}")
+                node = node.static.setdefault(segment, _Node())
+                continue
+
+            name = segment[1:-1]
+            converter = route.param_types.get(name, "str")
+            if converter not in self.CONVERTERS:
+                raise ValueError(f"Unknown path converter: {converter}")
+            node = self._param_child(node, converter)
+            names.append(name)
+
+        node.methods[route.method] = (route, names)
+        self._routes.append(route)
+
+    def match(self, method: str, path: str) -> Tuple[Route, Dict[str, Any]]:
+        """
+        Find route for the request.
+
+        Parameters:
+            method (str): HTTP method
+            path (str): request path
+
+        Raises:
+            RouteNotFoundError: if no template matches the path
+            MethodNotAllowedError: if the method is not registered for path
+
+        Returns:
+            matched route and converted path parameters
+        """
+        values: List[Any] = []
+        node = self._find(self._root, self._split(path), 0, values)
+        if node is None:
+            raise RouteNotFoundError(path)
+
+        matched = node.methods.get(method.upper())
+        if matched is None:
+            raise MethodNotAllowedError(path, sorted(node.methods))
+
+        route, names = matched
+        return route, dict(zip(names, values))
+
+    @property
+    def routes(self) -> List[Route]:
+        """
+        Getter method for registered routes.
+
+        Returns:
+            registered routes
+        """
+        return list(self._routes)
+
+    def _find(
+        self,
+        node: _Node,
+        segments: List[str],
+        index: int,
+        values: List[Any],
+    ) -> Optional[_Node]:
+        """
+        Walk the tree for the segments from index onwards.
+
+        Parameters:
+            node (_Node): current node
+            segments (List[str]): request path segments
+            index (int): position of the segment to match
+            values (List[Any]): converted path parameters, in path order
+
+        Returns:
+            node of the matched template, None if nothing matched
+        """
+        while index < len(segments):
+            child = node.static.get(segments[index])
+            if child is None:
+                break
+            if not node.params:
+                node, index = child, index + 1
+                continue
+            # Literal segment wins, backtrack to parameters on dead end
+            found = self._find(child, segments, index + 1, values)
+            if found is not None:
+                return found
+            break
+        else:
+            return node if node.methods else None
+
+        for converter, child in node.params:
+            try:
+                values.append(self.CONVERTERS[converter](segments[index]))
+            except ValueError:
+                continue
+            found = self._find(child, segments, index + 1, values)
+            if found is not None:
+                return found
+            values.pop()
+
+        return None
+
+    @staticmethod
+    def _param_child(node: _Node, converter: str) -> _Node:
+        """
+        Get or create parameter child node.
+
+        Parameters:
+            node (_Node): parent node
+            converter (str): converter name
+
+        Returns:
+            parameter child node
+        """
+        for param_converter, child in node.params:
+            if param_converter == converter:
+                return child
+
+        child = _Node()
+        node.params.append((converter, child))
+        # Keep `str` parameters last, they match any segment
+        node.params.sort(key=lambda param: param[0] == "str")
+        return child
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        """
+        Split path into segments.
+
+        Parameters:
+            path (str): path or path template
+
+        Returns:
+            path segments
+        """
+        return path.strip("/").split("/")
@@ -0,0 +1,521 @@
+"""Precomputed Static Content."""
+import gzip
+import hashlib
+import mimetypes
+import threading
+from abc import ABC
+from abc import abstractmethod
+from http import HTTPStatus
+from pathlib import Path
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from .dispatcher import Response
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None  # Optional `br` encoding, `pip install brotli`
+
+# Smallest body worth compressing, smaller bodies are sent as is
+_MIN_COMPRESS_SIZE = 256
+
+# Content codings by preference, with the suffix of precompressed files
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Media types of the bundled assets, others are guessed by `mimetypes`
+_CONTENT_TYPES = {
+    ".css": "text/css; charset=utf-8",
+    ".html": "text/html; charset=utf-8",
+    ".js": "text/javascript; charset=utf-8",
+    ".json": "application/json",
+    ".map": "application/json",
+    ".png": "image/png",
+    ".svg": "image/svg+xml",
+}
+
+# Text files worth compressing
+_COMPRESSIBLE = {".css", ".html", ".js", ".json", ".map", ".svg"}
+
+# Fingerprinted URLs never change content
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+class _BaseContent(ABC):
+    """
+    Entity tag and content negotiation of a response body.
+
+    `Accept-Encoding` selects `br`, `gzip` or the identity body, each
+    variant has its own entity tag. `If-None-Match` requests with the
+    entity tag of a current variant get `304 Not Modified`.
+    """
+
+    def __init__(
+        self, digest: str, content_type: str, cache_control: str
+    ) -> None:
+        """
+        Initialise the content.
+
+        Parameters:
+            digest (str): hash of the identity body, the entity tag
+            content_type (str): media type of the body
+            cache_control (str): `Cache-Control` header
+        """
+        self._hash = digest
+        self._content_type = content_type
+        self._cache_control = cache_control
+        self._variants: Dict[str, bytes] = {}
+
+    def response(
+        self,
+        headers: Optional[Mapping[str, str]] = None,
+        cache_control: Optional[str] = None,
+    ) -> Response:
+        """
+        Create response for the request headers.
+
+        Parameters:
+            headers (Optional[Mapping[str, str]]): request headers, lower
+                case names
+            cache_control (Optional[str]): `Cache-Control` header, defaults
+                to the one of the content
+
+        Returns:
+            response object
+        """
+        headers = headers or {}
+        cache_control = cache_control or self._cache_control
+        encoding = self.select(headers.get("accept-encoding", ""))
+        if self._matches(headers.get("if-none-match", "")):
+            response = Response(HTTPStatus.NOT_MODIFIED)
+            response.headers = self._headers(encoding, cache_control)
+            return response
+
+        response = self._response(encoding)
+        response.headers.extend(self._headers(encoding, cache_control))
+        if encoding != "identity":
+            response.headers.append(("Content-Encoding", encoding))
+        return response
+
+    def select(self, accept_encoding: str) -> str:
+        """
+        Select the preferred variant accepted by the client.
+
+        Parameters:
+            accept_encoding (str): `Accept-Encoding` request header
+
+        Returns:
+            content coding, `identity` for the uncompressed body
+        """
+        accepted = _accepted_encodings(accept_encoding)
+        for encoding in self._encodings():
+            if accepted.get(encoding, accepted.get("*", 0)):
+                return encoding
+        return "identity"
+
+    def etag(self, encoding: str = "identity") -> str:
+        """
+        Get entity tag of a variant.
+
+        Parameters:
+            encoding (str): content coding of the variant
+
+        Returns:
+            strong entity tag, quoted
+        """
+        if encoding == "identity":
+            return f'"{self._hash}"'
+        return f'"{self._hash}-{encoding}"'
+
+    @property
+    @abstractmethod
+    def body(self) -> bytes:
+        """
+        Getter method for identity body.
+
+        Returns:
+            uncompressed body
+        """
+
+    @abstractmethod
+    def _encodings(self) -> List[str]:
+        """
+        Get content codings of the variants.
+
+        Returns:
+            content codings, by preference
+        """
+
+    @abstractmethod
+    def _response(self, encoding: str) -> Response:
+        """
+        Create `200 OK` response with the body of a variant.
+
+        Parameters:
+            encoding (str): content coding of the variant
+
+        Returns:
+            response object
+        """
+
+    def _matches(self, if_none_match: str) -> bool:
+        """
+        Check `If-None-Match` with weak comparison, as RFC 9110 requires.
+
+        Parameters:
+            if_none_match (str): `If-None-Match` request header
+
+        Returns:
+            True when the client has a current variant
+        """
+        tags = {
+            tag[2:] if tag.startswith("W/") else tag
+            for tag in (item.strip() for item in if_none_match.split(","))
+        }
+        current = {self.etag()} | {
+            self.etag(name) for name in self._encodings()
+        }
+        return "*" in tags or not tags.isdisjoint(current)
+
+    def _headers(
+        self, encoding: str, cache_control: str
+    ) -> List[Tuple[str, str]]:
+        """
+        Get validator and caching headers, sent with 200 and 304.
+
+        Parameters:
+            encoding (str): content coding of the selected variant
+            cache_control (str): `Cache-Control` header
+
+        Returns:
+            response headers
+        """
+        headers = [
+            ("ETag", self.etag(encoding)),
+            ("Cache-Control", cache_control),
+        ]
+        if self._encodings():
+            headers.append(("Vary", "Accept-Encoding"))
+        return headers
+
+
+class StaticContent(_BaseContent):
+    """
+    Response body encoded once and served to every request.
+
+    The entity tag and the compressed variants are computed when the
+    content is created, requests only pick a variant.
+    """
+
+    def __init__(
+        self,
+        body: bytes,
+        content_type: str,
+        cache_control: str = "no-cache",
+    ) -> None:
+        """
+        Hash and compress the body.
+
+        Parameters:
+            body (bytes): response body
+            content_type (str): media type of the body
+            cache_control (str): `Cache-Control` header, `no-cache` makes
+                clients revalidate with the entity tag
+        """
+        super().__init__(_digest(body), content_type, cache_control)
+        self._body = body
+        if len(body) >= _MIN_COMPRESS_SIZE:
+            for encoding in _available_encodings():
+                self._add_variant(encoding, _compress(encoding, body))
+
+    @property
+    def body(self) -> bytes:
+        """
+        Getter method for identity body.
+
+        Returns:
+            uncompressed body
+        """
+        return self._body
+
+    def _encodings(self) -> List[str]:
+        """
+        Get content codings of the compressed variants.
+
+        Returns:
+            content codings, by preference
+        """
+        return [name for name, _ in _ENCODINGS if name in self._variants]
+
+    def _response(self, encoding: str) -> Response:
+        """
+        Create `200 OK` response with the body of a variant.
+
+        Parameters:
+            encoding (str): content coding of the variant
+
+        Returns:
+            response object
+        """
+        body = self._variants.get(encoding, self._body)
+        return Response(HTTPStatus.OK, body, self._content_type)
+
+    def _add_variant(self, encoding: str, body: bytes) -> None:
+        """
+        Keep compressed variant when it is smaller than the body.
+
+        Parameters:
+            encoding (str): content coding
+            body (bytes): compressed body
+        """
+        if len(body) < len(self._body):
+            self._variants[encoding] = body
+
+
+class StaticFile(_BaseContent):
+    """
+    File served without reading it into memory.
+
+    The identity body is sent from the file, with `sendfile` where the
+    server supports it. Precompressed `.br` and `.gz` files next to the
+    file are served as its variants, without them text files are
+    compressed once, on the first request accepting the encoding.
+    """
+
+    def __init__(self, path: Path, cache_control: str = "no-cache") -> None:
+        """
+        Hash the file and find its precompressed variants.
+
+        Parameters:
+            path (Path): file path
+            cache_control (str): `Cache-Control` header
+        """
+        super().__init__(
+            _digest(path.read_bytes()),
+            _CONTENT_TYPES.get(path.suffix)
+            or mimetypes.guess_type(path.name)[0]
+            or "application/octet-stream",
+            cache_control,
+        )
+        self._path = path
+        self._lock = threading.Lock()
+        self._files = {
+            encoding: path.with_name(path.name + suffix)
+            for encoding, suffix in _ENCODINGS
+            if path.with_name(path.name + suffix).is_file()
+        }
+        self._compressed: List[str] = []
+        if (
+            path.suffix in _COMPRESSIBLE
+            and path.stat().st_size >= _MIN_COMPRESS_SIZE
+        ):
+            self._compressed = _available_encodings()
+
+    @property
+    def body(self) -> bytes:
+        """
+        Getter method for identity body.
+
+        Returns:
+            file content
+        """
+        return self._path.read_bytes()
+
+    def _encodings(self) -> List[str]:
+        """
+        Get content codings of the precompressed or compressible variants.
+
+        Returns:
+            content codings, by preference
+        """
+        if self._files:
+            return [name for name, _ in _ENCODINGS if name in self._files]
+        return self._compressed
+
+    def _response(self, encoding: str) -> Response:
+        """
+        Create `200 OK` response with the body of a variant.
+
+        Parameters:
+            encoding (str): content coding of the variant
+
+        Returns:
+            response object, with the file to send if not compressed in
+            memory
+        """
+        if encoding == "identity" or encoding in self._files:
+            file = self._files.get(encoding, self._path)
+            return Response(
+                HTTPStatus.OK, content_type=self._content_type, file=file
+            )
+
+        with self._lock:
+            if encoding not in self._variants:
+                self._variants[encoding] = _compress(
+                    encoding, self._path.read_bytes()
+                )
+        return Response(
+            HTTPStatus.OK, self._variants[encoding], self._content_type
+        )
+
+
+class StaticFiles:
+    """
+    Files of a directory served under a URL path prefix.
+
+    The directory is scanned once and files are looked up by name, so no
+    request path reaches the file system. `url` returns fingerprinted URLs,
+    `{prefix}/{version}/{name}`, the version changes with the content of
+    any file. Responses to those URLs are cached as immutable, unversioned
+    or previous version URLs are revalidated.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        prefix: str = "/static",
+        exclude: Iterable[str] = (),
+    ) -> None:
+        """
+        Scan and hash the files of the directory.
+
+        Parameters:
+            directory (Path): directory of the files, not recursive
+            prefix (str): URL path prefix
+            exclude (Iterable[str]): file names not served, e.g. templates
+        """
+        excluded = set(exclude)
+        suffixes = {suffix for _, suffix in _ENCODINGS}
+        self._prefix = prefix.rstrip("/")
+        self._files: Dict[str, StaticFile] = {
+            path.name: StaticFile(path)
+            for path in sorted(directory.iterdir())
+            if path.is_file()
+            and path.name not in excluded
+            and path.suffix not in suffixes
+        }
+        self._version = hashlib.sha256(
+            "".join(file.etag() for file in self._files.values()).encode()
+        ).hexdigest()[:12]
+
+    def url(self, name: str) -> str:
+        """
+        Get fingerprinted URL of a file.
+
+        Parameters:
+            name (str): file name
+
+        Raises:
+            KeyError: if the file is not served
+
+        Returns:
+            URL path
+        """
+        if name not in self._files:
+            raise KeyError(name)
+        return f"{self._prefix}/{self._version}/{name}"
+
+    def response(
+        self, path: str, headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[Response]:
+        """
+        Create response for a file URL.
+
+        Parameters:
+            path (str): request path
+            headers (Optional[Mapping[str, str]]): request headers, lower
+                case names
+
+        Returns:
+            response object, None if the path is not a served file
+        """
+        if not path.startswith(self._prefix + "/"):
+            return None
+
+        version, _, name = path[len(self._prefix) + 1:].rpartition("/")
+        file = self._files.get(name)
+        if file is None or "/" in version:
+            return None
+
+        cache_control = IMMUTABLE if version == self._version else "no-cache"
+        return file.response(headers, cache_control)
+
+    @property
+    def prefix(self) -> str:
+        """
+        Getter method for URL path prefix.
+
+        Returns:
+            URL path prefix, without trailing slash
+        """
+        return self._prefix
+
+
+def _available_encodings() -> List[str]:
+    """
+    Get content codings that can be compressed in this process.
+
+    Returns:
+        content codings, by preference
+    """
+    return [name for name, _ in _ENCODINGS if name != "br" or brotli]
+
+
+def _digest(body: bytes) -> str:
+    """
+    Hash body for the entity tag.
+
+    Parameters:
+        body (bytes): identity body
+
+    Returns:
+        truncated SHA-256 hex digest
+    """
+    return hashlib.sha256(body).hexdigest()[:32]
+
+
+def _compress(encoding: str, body: bytes) -> bytes:
+    """
+    Compress body with a content coding.
+
+    Parameters:
+        encoding (str): `br` or `gzip`
+        body (bytes): body to compress
+
+    Returns:
+        compressed body
+    """
+    if encoding == "br":
+        return cast(bytes, brotli.compress(body))
+    return gzip.compress(body, 9, mtime=0)
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """
+    Parse `Accept-Encoding` request header.
+
+    Parameters:
+        accept_encoding (str): `Accept-Encoding` request header
+
+    Returns:
+        quality value by content coding
+    """
+    accepted: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        if not coding:
+            continue
+        quality = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+    return accepted
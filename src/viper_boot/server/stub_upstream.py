@@ -0,0 +1,180 @@
+"""Stub Upstream API Server."""
+import json
+import random
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Any
+from typing import Optional
+
+
+class StubUpstream:
+    """
+    Local stand-in for the upstream API, e.g. `http://httpbin.org/get`.
+
+    Every request is answered after `latency` seconds, plus a random
+    `jitter`, with a JSON body of about `payload_size` bytes. A share of
+    requests, `error_rate`, fails with `error_status`. Connections are kept
+    alive and served by a thread each, like a real upstream slow requests
+    do not delay the others.
+    """
+
+    # Every upstream behaviour is a keyword with a default
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8099,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = HTTPStatus.SERVICE_UNAVAILABLE,
+        payload_size: int = 256,
+    ) -> None:
+        """
+        Bind the server.
+
+        Parameters:
+            host (str): interface to bind
+            port (int): port to bind, 0 for any free port
+            latency (float): seconds before every response
+            jitter (float): random extra seconds before every response
+            error_rate (float): share of requests failing, 0 to 1
+            error_status (int): HTTP status of failed requests
+            payload_size (int): approximate response body size in bytes
+
+        Raises:
+            ValueError: if the error rate is not between 0 and 1
+        """
+        if not 0 <= error_rate <= 1:
+            raise ValueError(f"Error rate not between 0 and 1: {error_rate}")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.body = _payload(payload_size)
+        self._server = ThreadingHTTPServer((host, port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self  # type: ignore
+        self._thread: Optional[threading.Thread] = None
+
+    def serve(self) -> None:
+        """Serve until interrupted."""
+        print(f"Stub upstream started {self.url}")
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nKeyboard interrupt received, exiting.")
+        finally:
+            self._server.server_close()
+
+    def start(self) -> None:
+        """Serve in a daemon thread, e.g. in tests and benchmarks."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="stub-upstream",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving started with `start` and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def delay(self) -> float:
+        """
+        Get seconds to wait before the next response.
+
+        Returns:
+            latency with jitter
+        """
+        return self.latency + random.uniform(0, self.jitter)
+
+    def fails(self) -> bool:
+        """
+        Draw whether the next request fails.
+
+        Returns:
+            True for a failed request
+        """
+        return random.random() < self.error_rate
+
+    @property
+    def url(self) -> str:
+        """
+        Getter method for upstream URL.
+
+        Returns:
+            URL of the `/get` path, e.g. the settings `api.url`
+        """
+        host = self._server.server_address[0]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{self._server.server_port}/get"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive request handler of the stub upstream."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes, avoid delayed ACK stalls
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa # pylint: disable=C0103
+        """Get request handler."""
+        self._respond()
+
+    def do_POST(self) -> None:  # noqa # pylint: disable=C0103
+        """Post request handler."""
+        self._respond()
+
+    def _respond(self) -> None:
+        """Wait, then send the payload or an error."""
+        stub: StubUpstream = self.server.stub  # type: ignore
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        delay = stub.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        if stub.fails():
+            status, body = stub.error_status, b'{"error": "stub"}'
+        else:
+            status, body = HTTPStatus.OK, stub.body
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: Any) -> None:
+        """
+        Silence request logging.
+
+        Parameters:
+            *_args (Any): log arguments
+        """  # noqa: RST210
+
+
+def _payload(size: int) -> bytes:
+    """
+    Create JSON body shaped like `httpbin.org/get`, padded to a size.
+
+    Parameters:
+        size (int): approximate body size in bytes
+
+    Returns:
+        JSON body
+    """
+    body = {"args": {}, "headers": {}, "url": "http://127.0.0.1/get"}
+    padding = size - len(json.dumps(body)) - len(', "data": ""')
+    if padding > 0:
+        body["data"] = "x" * padding
+    return json.dumps(body).encode("utf-8")
@@ -0,0 +1,324 @@
+"""Pre-forking Worker Processes."""
+import os
+import random
+import signal
+import socket
+import sys
+import time
+import traceback
+from socketserver import BaseServer
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Set
+
+Target = Callable[[socket.socket, int], None]
+
+# Seconds between supervision and stop flag checks
+_TICK = 0.5
+
+
+# Worker settings and the running workers are kept together
+class Arbiter:  # pylint: disable=too-many-instance-attributes
+    """
+    Pre-fork worker processes sharing one listening socket.
+
+    The arbiter binds the socket once and forks the workers, every worker
+    inherits the socket and accepts on it. Workers that exit, e.g. after
+    serving their request budget, are replaced.
+
+    Signals:
+        SIGTERM, SIGINT: stop workers gracefully and exit
+        SIGHUP: graceful restart, start new workers then stop the old ones
+        SIGTTIN, SIGTTOU: increase or decrease the number of workers
+        SIGUSR2: forwarded to the workers, e.g. to profile them
+    """
+
+    # Every worker setting past the address is a keyword with a default
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        target: Target,
+        host: str,
+        port: int,
+        workers: int,
+        max_requests: int = 0,
+        max_requests_jitter: int = 0,
+        graceful_timeout: float = 30.0,
+        backlog: int = 2048,
+    ) -> None:
+        """
+        Initialise the arbiter.
+
+        Parameters:
+            target (Target): serves on the socket in a worker until asked
+                to stop or its request budget (0 for unlimited) is spent
+            host (str): interface to bind
+            port (int): port to bind
+            workers (int): number of worker processes
+            max_requests (int): requests a worker serves before it is
+                recycled, 0 to never recycle
+            max_requests_jitter (int): random extra requests per worker, so
+                workers are not recycled at the same time
+            graceful_timeout (float): seconds to wait for stopping workers
+                before killing them
+            backlog (int): listen queue size
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Worker processes require os.fork support")
+        if workers < 1:
+            raise ValueError("Number of workers must be at least 1")
+
+        self._target = target
+        self._address = (host, port)
+        self._workers_count = workers
+        self._max_requests = max_requests
+        self._max_requests_jitter = max_requests_jitter
+        self._graceful_timeout = graceful_timeout
+        self._backlog = backlog
+
+        self._socket: Any = None
+        self._workers: Dict[int, float] = {}
+        self._retiring: Set[int] = set()
+        self._stopping = False
+        self._restarting = False
+        self._worker_usr2: Any = signal.SIG_DFL
+
+    def run(self) -> None:
+        """Bind the socket, fork the workers and supervise them."""
+        self._socket = self.bind(*self._address, backlog=self._backlog)
+        self._install_signals()
+        print(
+            f"Arbiter {os.getpid()} started http://{self._address[0]}:"
+            f"{self._address[1]} with {self._workers_count} workers"
+        )
+
+        try:
+            while not self._stopping:
+                if self._restarting:
+                    self._restart()
+                self._reap()
+                self._spawn_missing()
+                time.sleep(_TICK)
+        finally:
+            self._stop_workers()
+            self._socket.close()
+
+    @staticmethod
+    def bind(host: str, port: int, backlog: int = 2048) -> socket.socket:
+        """
+        Create listening socket to be shared with the workers.
+
+        `SO_REUSEPORT` is set where available, so a new arbiter can bind
+        the same port while the old one drains.
+
+        Parameters:
+            host (str): interface to bind
+            port (int): port to bind
+            backlog (int): listen queue size
+
+        Returns:
+            listening socket
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        sock.listen(backlog)
+        return sock
+
+    def _install_signals(self) -> None:
+        """Install arbiter signal handlers."""
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGHUP, self._handle_restart)
+        signal.signal(signal.SIGTTIN, self._handle_increase)
+        signal.signal(signal.SIGTTOU, self._handle_decrease)
+        # Workers keep the handler installed before the arbiter
+        self._worker_usr2 = signal.signal(signal.SIGUSR2, self._handle_usr2)
+
+    def _handle_stop(self, *_args: Any) -> None:
+        """
+        Request shutdown.
+
+        Parameters:
+            *_args (Any): signal number and frame
+        """  # noqa: RST210
+        self._stopping = True
+
+    def _handle_restart(self, *_args: Any) -> None:
+        """
+        Request graceful restart of the workers.
+
+        Parameters:
+            *_args (Any): signal number and frame
+        """  # noqa: RST210
+        self._restarting = True
+
+    def _handle_increase(self, *_args: Any) -> None:
+        """
+        Increase number of workers by one.
+
+        Parameters:
+            *_args (Any): signal number and frame
+        """  # noqa: RST210
+        self._workers_count += 1
+
+    def _handle_decrease(self, *_args: Any) -> None:
+        """
+        Decrease number of workers by one, keeping at least one.
+
+        Parameters:
+            *_args (Any): signal number and frame
+        """  # noqa: RST210
+        self._workers_count = max(1, self._workers_count - 1)
+
+    def _handle_usr2(self, *_args: Any) -> None:
+        """
+        Forward `SIGUSR2` to every worker.
+
+        Parameters:
+            *_args (Any): signal number and frame
+        """  # noqa: RST210
+        for pid in list(self._workers):
+            self._kill(pid, signal.SIGUSR2)
+
+    def _spawn_missing(self) -> None:
+        """Fork workers until the number of active workers is reached."""
+        active = [pid for pid in self._workers if pid not in self._retiring]
+        for _ in range(self._workers_count - len(active)):
+            self._spawn()
+
+        # Retire extra workers, oldest first
+        extra = len(active) - self._workers_count
+        if extra > 0:
+            for pid in sorted(active, key=self._workers.__getitem__)[:extra]:
+                self._retire(pid)
+
+    def _spawn(self) -> None:
+        """Fork one worker process."""
+        max_requests = self._max_requests
+        if max_requests and self._max_requests_jitter:
+            max_requests += random.randint(  # nosec
+                0, self._max_requests_jitter
+            )
+
+        pid = os.fork()
+        if pid:
+            self._workers[pid] = time.monotonic()
+            return
+
+        # Worker process
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            signal.signal(signal.SIGTTIN, signal.SIG_IGN)
+            signal.signal(signal.SIGTTOU, signal.SIG_IGN)
+            signal.signal(signal.SIGUSR2, self._worker_usr2)
+            random.seed()
+            self._target(self._socket, max_requests)
+        except BaseException:  # pylint: disable=broad-except
+            traceback.print_exc()
+            exit_code = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(exit_code)  # pylint: disable=protected-access
+
+    def _restart(self) -> None:
+        """Start a new set of workers, then retire the current ones."""
+        self._restarting = False
+        current = [pid for pid in self._workers if pid not in self._retiring]
+        for _ in range(self._workers_count):
+            self._spawn()
+        for pid in current:
+            self._retire(pid)
+
+    def _retire(self, pid: int) -> None:
+        """
+        Ask worker to stop gracefully.
+
+        Parameters:
+            pid (int): worker process id
+        """
+        self._retiring.add(pid)
+        self._kill(pid, signal.SIGTERM)
+
+    def _reap(self) -> None:
+        """Collect exited workers."""
+        while self._workers:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                pid = 0
+            if not pid:
+                return
+            self._workers.pop(pid, None)
+            self._retiring.discard(pid)
+
+    def _stop_workers(self) -> None:
+        """Stop all workers, kill the ones exceeding graceful timeout."""
+        for pid in list(self._workers):
+            self._retire(pid)
+
+        deadline = time.monotonic() + self._graceful_timeout
+        while self._workers and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(0.1)
+
+        for pid in list(self._workers):
+            self._kill(pid, signal.SIGKILL)
+        while self._workers:
+            self._reap()
+            time.sleep(0.1)
+
+    def _kill(self, pid: int, sig: int) -> None:
+        """
+        Send signal to worker, forget it if it is gone already.
+
+        Parameters:
+            pid (int): worker process id
+            sig (int): signal number
+        """
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            self._workers.pop(pid, None)
+            self._retiring.discard(pid)
+
+
+def serve_requests(server: BaseServer, max_requests: int = 0) -> None:
+    """
+    Serve requests of a blocking server until `SIGTERM` or budget spent.
+
+    The request in progress is completed before returning.
+
+    Parameters:
+        server (BaseServer): socket server, e.g. `http.server.HTTPServer`
+        max_requests (int): requests to serve, 0 for no limit
+    """
+    state = {"stopping": False, "timed_out": False}
+
+    def stop(*_args: Any) -> None:
+        state["stopping"] = True
+
+    def timed_out() -> None:
+        state["timed_out"] = True
+
+    previous = signal.signal(signal.SIGTERM, stop)
+    server.timeout = _TICK
+    server.handle_timeout = timed_out  # type: ignore
+
+    handled = 0
+    try:
+        while not state["stopping"]:
+            if max_requests and handled >= max_requests:
+                break
+            state["timed_out"] = False
+            server.handle_request()
+            if not state["timed_out"]:
+                handled += 1
+    finally:
+        signal.signal(signal.SIGTERM, previous)
@@ -1,2 +1,17 @@
 """Services Package."""
-from .student_service import StudentService
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .async_student_service import AsyncStudentService
+    from .student_service import StudentService
+
+# Submodules are imported on first use, see `lazy_exports`
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncStudentService": ".async_student_service",
+        "StudentService": ".student_service",
+    },
+)
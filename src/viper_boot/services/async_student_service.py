@@ -0,0 +1,252 @@
+"""Async Student Service."""
+from typing import Any
+from typing import AsyncIterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from ..config.config import Config
+from ..utils.decorators import single_flight
+from ..utils.decorators import traced
+from ..utils.http_client import AsyncHttpClient
+from .base_student_service import CACHE
+from .base_student_service import BaseStudentService
+
+HTTP_CLIENT = AsyncHttpClient(Config().get["API"])
+Config().subscribe(  # New URL and pool sizes on config reload
+    lambda settings: HTTP_CLIENT.configure(settings["API"])
+)
+
+
+@traced
+class AsyncStudentService(BaseStudentService):
+    """Non-blocking service for async student controller."""
+
+    def __init__(self) -> None:
+        """Service constructor."""
+        pass  # pylint: disable=unnecessary-pass
+
+    @staticmethod
+    async def get(_id: str = None) -> Any:
+        """
+        Get student by id, cached until patched, deleted or expired.
+
+        Parameters:
+            _id (str) : student id
+
+        Returns:
+            (Any): student
+        """
+        return await CACHE.get_or_load_async(
+            AsyncStudentService._student_key(_id),
+            lambda: AsyncStudentService._get(_id),
+        )
+
+    @staticmethod
+    @single_flight
+    async def _get(_id: str = None) -> Any:  # pylint: disable=unused-argument
+        """
+        Get student by id from upstream API, sharing concurrent calls.
+
+        Parameters:
+            _id (str) : student id
+
+        Returns:
+            (Any): student
+        """
+        # Get API link from settings
+        api_uri = AsyncStudentService._api_uri()
+
+        # Make API call
+        response = await HTTP_CLIENT.get(api_uri)
+        response.raise_for_status()
+
+        return AsyncStudentService._load_student()
+
+    @staticmethod
+    async def get_all() -> Any:
+        """
+        Get all students, cached until changed or expired.
+
+        Returns:
+            (Any): list of all students  # type: ignore
+        """
+        return await CACHE.get_or_load_async(
+            AsyncStudentService._STUDENTS_KEY, AsyncStudentService._get_all
+        )
+
+    @staticmethod
+    @single_flight
+    async def _get_all() -> Any:
+        """
+        Get all students from upstream API, sharing concurrent calls.
+
+        Returns:
+            (Any): list of all students
+        """
+        # Get API link from settings
+        api_uri = AsyncStudentService._api_uri()
+
+        # Make API call
+        response = await HTTP_CLIENT.get(api_uri)
+        response.raise_for_status()
+
+        return AsyncStudentService._load_students()
+
+    @staticmethod
+    async def get_page(
+        cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Get one page of students.
+
+        Parameters:
+            cursor (Optional[str]): cursor returned with the previous page,
+                None for the first page
+            limit (int): number of students per page
+
+        Returns:
+            (Any): list of students and cursor of the next page, None on
+                the last page
+        """
+        offset = AsyncStudentService._decode_cursor(cursor)
+
+        # Get API link from settings
+        api_uri = AsyncStudentService._api_uri()
+
+        # Make API call for the page only
+        response = await HTTP_CLIENT.get(
+            api_uri, params=AsyncStudentService._page_params(offset, limit)
+        )
+        response.raise_for_status()
+
+        return AsyncStudentService._load_students_page(offset, limit)
+
+    @staticmethod
+    async def iter_all(page_size: int = 100) -> AsyncIterator[Any]:
+        """
+        Iterate over all students, fetching one page at a time.
+
+        Parameters:
+            page_size (int): number of students per upstream call
+
+        Yields:
+            (Any): student
+        """
+        cursor = None
+        while True:
+            students, cursor = await AsyncStudentService.get_page(
+                cursor, page_size
+            )
+            for student in students:
+                yield student
+            if cursor is None:
+                return
+
+    @staticmethod
+    async def get_many(ids: Sequence[Any]) -> Any:
+        """
+        Get students by ids, fetching the ones not cached in one call.
+
+        Parameters:
+            ids (Sequence[Any]): student ids
+
+        Returns:
+            (Any): list of found students, in order of the ids
+        """
+        unique, students, missing = AsyncStudentService._lookup_many(ids)
+        if missing:
+            generation = CACHE.generation()
+            loaded = await AsyncStudentService._get_many(tuple(missing))
+            AsyncStudentService._store_many(students, loaded, generation)
+
+        return AsyncStudentService._ordered(unique, students)
+
+    @staticmethod
+    @single_flight
+    async def _get_many(ids: Sequence[Any]) -> List[Any]:
+        """
+        Get students by ids from upstream API, sharing concurrent calls.
+
+        Parameters:
+            ids (Sequence[Any]): student ids
+
+        Returns:
+            (List[Any]): list of found students
+        """
+        # Get API link from settings
+        api_uri = AsyncStudentService._api_uri()
+
+        # Make API call
+        response = await HTTP_CLIENT.get(api_uri)
+        response.raise_for_status()
+
+        return AsyncStudentService._load_students_by_id(ids)
+
+    @staticmethod
+    async def post(request: Any) -> Any:  # pylint: disable=unused-argument
+        """
+        Create new student.
+
+        Parameters:
+            request (Any) : student request object
+
+        Returns:
+            student id
+        """
+        # Get API link from settings
+        api_uri = AsyncStudentService._api_uri()
+
+        # Make API call
+        response = await HTTP_CLIENT.get(api_uri)
+        response.raise_for_status()
+
+        AsyncStudentService._invalidate()
+
+        return AsyncStudentService._load_student_id()
+
+    @staticmethod
+    async def patch(_id: str, request: Any) -> Any:
+        """
+        Update student.
+
+        Parameters:
+            _id (str): student id
+            request (Any): student request object
+
+        Returns:
+            schema (Any): student response object
+        """
+        # Get API link from settings
+        api_uri = AsyncStudentService._api_uri()
+
+        # Make API call
+        response = await HTTP_CLIENT.get(api_uri)
+        response.raise_for_status()
+
+        AsyncStudentService._invalidate(_id)
+
+        return AsyncStudentService._load_updated(_id, request)
+
+    @staticmethod
+    async def delete(_id: str) -> Any:
+        """
+        Delete student by id.
+
+        Parameters:
+            _id (str) : student id
+
+        Returns:
+            data(Dict[str, Any]): exception if fail
+        """
+        # Get API link from settings
+        api_uri = AsyncStudentService._api_uri()
+
+        # Make API call
+        response = await HTTP_CLIENT.get(api_uri)
+        response.raise_for_status()
+
+        AsyncStudentService._invalidate(_id)
+
+        return AsyncStudentService._load_deleted()
@@ -0,0 +1,368 @@
+"""Base Student Service."""
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import cast
+
+from marshmallow import ValidationError
+
+from ..config.config import Config
+from ..enums.gender_enum import GenderEnum
+from ..schemas import compile_schema
+from ..schemas import StudentIdSchema
+from ..schemas import StudentSchema
+from ..utils.cache import create_cache
+
+# Read-through cache of student lookups, shared by the student services
+CACHE = create_cache(Config().get.get("CACHE"))
+
+
+class BaseStudentService:
+    """
+    Upstream response handling shared by the student services.
+
+    Upstream data is validated into wire records, see
+    `CompiledSchema.validate`, which the controllers send as is.
+    """
+
+    # Cache key of all students
+    _STUDENTS_KEY = ("students",)
+
+    @staticmethod
+    def _student_key(_id: str) -> Hashable:
+        """
+        Get cache key of student.
+
+        Parameters:
+            _id (str) : student id
+
+        Returns:
+            cache key
+        """
+        return ("student", str(_id))
+
+    @staticmethod
+    def _api_uri() -> str:
+        """
+        Get upstream API link from settings.
+
+        Returns:
+            upstream API URL
+        """
+        return str(Config().get["API"]["url"])
+
+    @staticmethod
+    def _invalidate(_id: Optional[str] = None) -> None:
+        """
+        Drop cached students changed upstream.
+
+        Parameters:
+            _id (Optional[str]): id of the changed student, None when a
+                student was created
+        """
+        if _id is None:
+            CACHE.delete(BaseStudentService._STUDENTS_KEY)
+        else:
+            CACHE.delete(
+                BaseStudentService._student_key(_id),
+                BaseStudentService._STUDENTS_KEY,
+            )
+
+    @staticmethod
+    def _encode_cursor(offset: int) -> str:
+        """
+        Encode opaque page cursor.
+
+        Parameters:
+            offset (int): position of the first student of the page
+
+        Returns:
+            page cursor
+        """
+        data = json.dumps({"offset": offset}).encode("utf-8")
+        return base64.urlsafe_b64encode(data).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> int:
+        """
+        Decode opaque page cursor.
+
+        Parameters:
+            cursor (Optional[str]): page cursor, None for the first page
+
+        Raises:
+            ValidationError: if the cursor is malformed
+
+        Returns:
+            position of the first student of the page
+        """
+        if not cursor:
+            return 0
+
+        try:
+            offset = json.loads(base64.urlsafe_b64decode(cursor))["offset"]
+        except (binascii.Error, ValueError, TypeError, KeyError) as error:
+            raise ValidationError({"cursor": ["Invalid cursor."]}) from error
+        if not isinstance(offset, int) or offset < 0:
+            raise ValidationError({"cursor": ["Invalid cursor."]})
+
+        return offset
+
+    @staticmethod
+    def _page_params(offset: int, limit: int) -> Dict[str, int]:
+        """
+        Get query parameters of an upstream page request.
+
+        One student more than the page is asked for, it tells whether
+        another page follows.
+
+        Parameters:
+            offset (int): position of the first student of the page
+            limit (int): number of students per page
+
+        Returns:
+            `offset` and `limit` query parameters
+        """
+        return {"offset": offset, "limit": limit + 1}
+
+    @staticmethod
+    def _lookup_many(
+        ids: Sequence[Any],
+    ) -> Tuple[List[Any], Dict[str, Any], List[Any]]:
+        """
+        Look up students in cache.
+
+        Parameters:
+            ids (Sequence[Any]): student ids, may repeat
+
+        Returns:
+            unique ids, cached students by id and ids missing from cache
+        """
+        unique = list(dict.fromkeys(ids))
+        students: Dict[str, Any] = {}
+        for _id in unique:
+            found, student = CACHE.lookup(BaseStudentService._student_key(_id))
+            if found:
+                students[str(_id)] = student
+
+        missing = [_id for _id in unique if str(_id) not in students]
+        return unique, students, missing
+
+    @staticmethod
+    def _store_many(
+        students: Dict[str, Any], loaded: List[Any], generation: int
+    ) -> None:
+        """
+        Cache students loaded from upstream and add them to the result.
+
+        Parameters:
+            students (Dict[str, Any]): students by id
+            loaded (List[Any]): students loaded from upstream
+            generation (int): cache generation read before the load
+        """
+        for student in loaded:
+            students[str(student["id"])] = student
+            CACHE.set(
+                BaseStudentService._student_key(student["id"]),
+                student,
+                generation,
+            )
+
+    @staticmethod
+    def _ordered(unique: List[Any], students: Dict[str, Any]) -> List[Any]:
+        """
+        Get found students in order of the requested ids.
+
+        Parameters:
+            unique (List[Any]): unique ids, see `_lookup_many`
+            students (Dict[str, Any]): students by id
+
+        Returns:
+            list of found students
+        """
+        return [students[str(_id)] for _id in unique if str(_id) in students]
+
+    @staticmethod
+    def _load_student() -> Any:
+        """
+        Load student from upstream response.
+
+        Returns:
+            (Any): student
+        """
+        data = {
+            "id": uuid.uuid4().hex,
+            "student": {
+                "first_name": "James",
+                "last_name": "Smith",
+                "dob": datetime.strptime("10/10/1978", "%d/%m/%Y").date().isoformat(),  # noqa  # pylint: disable=line-too-long
+                "gender": GenderEnum.MALE.name,
+            },
+        }
+
+        # Validating Object, serialized once for the controllers
+        return compile_schema(StudentSchema).validate(data)
+
+    @staticmethod
+    def _load_students() -> Any:
+        """
+        Load all students from upstream response.
+
+        Returns:
+            (Any): list of all students
+        """
+        data = [
+            {
+                "id": uuid.uuid4().hex,
+                "student": {
+                    "first_name": "James",
+                    "last_name": "Smith",
+                    "dob": datetime.strptime("10/10/1978", "%d/%m/%Y").date().isoformat(),  # noqa  # pylint: disable=line-too-long
+                    "gender": GenderEnum.MALE.name,
+                },
+            },
+            {
+                "id": uuid.uuid4().hex,
+                "student": {
+                    "first_name": "Sarah",
+                    "last_name": "Smith",
+                    "dob": datetime.strptime("10/10/1988", "%d/%m/%Y").date().isoformat(),  # noqa  # pylint: disable=line-too-long
+                    "gender": GenderEnum.FEMALE.name,
+                },
+            },
+        ]
+
+        # Validating Object, serialized once for the controllers
+        return compile_schema(StudentSchema).validate(data, many=True)
+
+    @staticmethod
+    def _load_students_page(
+        offset: int, limit: int
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Load page of students from upstream response.
+
+        The upstream returns at most `limit + 1` students from `offset`,
+        see `_page_params`, so memory and validation cost depend on the
+        page size only.
+
+        Parameters:
+            offset (int): position of the first student of the page
+            limit (int): number of students per page
+
+        Returns:
+            (List[Any]): list of students and cursor of the next page,
+                None on the last page
+        """
+        # Stand-in of the upstream, answering the page query parameters
+        people = [
+            ("James", "10/10/1978", GenderEnum.MALE),
+            ("Sarah", "10/10/1988", GenderEnum.FEMALE),
+        ][offset:offset + limit + 1]
+        data = [
+            {
+                "id": uuid.uuid4().hex,
+                "student": {
+                    "first_name": first_name,
+                    "last_name": "Smith",
+                    "dob": datetime.strptime(dob, "%d/%m/%Y").date().isoformat(),  # noqa  # pylint: disable=line-too-long
+                    "gender": gender.name,
+                },
+            }
+            for first_name, dob, gender in people
+        ]
+        next_cursor = (
+            BaseStudentService._encode_cursor(offset + limit)
+            if len(data) > limit
+            else None
+        )
+
+        # Validating Object, serialized once for the controllers
+        students = compile_schema(StudentSchema).validate(
+            data[:limit], many=True
+        )
+        return cast(List[Any], students), next_cursor
+
+    @staticmethod
+    def _load_students_by_id(ids: Sequence[Any]) -> List[Any]:
+        """
+        Load students by id from upstream response.
+
+        Parameters:
+            ids (Sequence[Any]): student ids
+
+        Returns:
+            (List[Any]): list of students
+        """
+        data = [
+            {
+                "id": str(_id),
+                "student": {
+                    "first_name": "James",
+                    "last_name": "Smith",
+                    "dob": datetime.strptime("10/10/1978", "%d/%m/%Y").date().isoformat(),  # noqa  # pylint: disable=line-too-long
+                    "gender": GenderEnum.MALE.name,
+                },
+            }
+            for _id in ids
+        ]
+
+        # Validating Object, serialized once for the controllers
+        return cast(
+            List[Any], compile_schema(StudentSchema).validate(data, many=True)
+        )
+
+    @staticmethod
+    def _load_student_id() -> Any:
+        """
+        Load id of created student from upstream response.
+
+        Returns:
+            student id
+        """
+        data = {"id": uuid.uuid4().hex}
+
+        # Validating Object, serialized once for the controllers
+        return compile_schema(StudentIdSchema).validate(data)
+
+    @staticmethod
+    def _load_updated(_id: str, request: Any) -> Any:
+        """
+        Load updated student from upstream response.
+
+        Parameters:
+            _id (str): student id
+            request (Any): student request object
+
+        Returns:
+            schema (Any): student response object
+        """
+        data = {
+            "id": _id,
+            "student": request,
+        }
+
+        # Validating Object, serialized once for the controllers
+        return compile_schema(StudentSchema).validate(data)
+
+    @staticmethod
+    def _load_deleted() -> Any:
+        """
+        Load delete result from upstream response.
+
+        Returns:
+            data(Dict[str, Any]): exception if fail
+        """
+        # Return exception if fail
+        data: Dict[str, Any] = {}
+
+        return data
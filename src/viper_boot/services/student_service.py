@@ -1,20 +1,26 @@
 """Student Service."""
-import uuid
-from datetime import datetime
 from typing import Any
-from typing import Dict
-
-import requests
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
 
 from ..config.config import Config
-from ..enums.gender_enum import GenderEnum
-from ..schemas import StudentIdSchema
-from ..schemas import StudentSchema
+from ..utils.decorators import single_flight
+from ..utils.decorators import traced
+from ..utils.http_client import HttpClient
+from .base_student_service import CACHE
+from .base_student_service import BaseStudentService
 
-SETTINGS = Config().get
+HTTP_CLIENT = HttpClient(Config().get["API"])
+Config().subscribe(  # New URL and pool sizes on config reload
+    lambda settings: HTTP_CLIENT.configure(settings["API"])
+)
 
 
-class StudentService:
+@traced
+class StudentService(BaseStudentService):
     """Service for student controller."""
 
     def __init__(self) -> None:
@@ -24,7 +30,24 @@ def __init__(self) -> None:
     @staticmethod
     def get(_id: str = None) -> Any:
         """
-        Get student by id.
+        Get student by id, cached until patched, deleted or expired.
+
+        Parameters:
+            _id (str) : student id
+
+        Returns:
+            (Any): student
+        """
+        return CACHE.get_or_load(
+            StudentService._student_key(_id),
+            lambda: StudentService._get(_id),
+        )
+
+    @staticmethod
+    @single_flight
+    def _get(_id: str = None) -> Any:  # pylint: disable=unused-argument
+        """
+        Get student by id from upstream API, sharing concurrent calls.
 
         Parameters:
             _id (str) : student id
@@ -33,63 +56,131 @@ def get(_id: str = None) -> Any:
             (Any): student
         """
         # Get API link from settings
-        api_uri = SETTINGS["API"]["url"]
+        api_uri = StudentService._api_uri()
 
         # Make API call
-        response = requests.get(api_uri, timeout=(3.05, 27))
+        response = HTTP_CLIENT.get(api_uri)
         response.raise_for_status()
 
-        data = {
-            "id": uuid.uuid4().hex,
-            "student": {
-                "first_name": "James",
-                "last_name": "Smith",
-                "dob": datetime.strptime("10/10/1978", "%d/%m/%Y").date().isoformat(),  # noqa  # pylint: disable=line-too-long
-                "gender": GenderEnum.MALE.name,
-            },
-        }
-
-        # Deserializing Object
-        return StudentSchema().load(data)
+        return StudentService._load_student()
 
     @staticmethod
     def get_all() -> Any:
         """
-        Get all students.
+        Get all students, cached until changed or expired.
 
         Returns:
             (Any): list of all students  # type: ignore
         """
+        return CACHE.get_or_load(
+            StudentService._STUDENTS_KEY, StudentService._get_all
+        )
+
+    @staticmethod
+    @single_flight
+    def _get_all() -> Any:
+        """
+        Get all students from upstream API, sharing concurrent calls.
+
+        Returns:
+            (Any): list of all students
+        """
+        # Get API link from settings
+        api_uri = StudentService._api_uri()
+
+        # Make API call
+        response = HTTP_CLIENT.get(api_uri)
+        response.raise_for_status()
+
+        return StudentService._load_students()
+
+    @staticmethod
+    def get_page(
+        cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Get one page of students.
+
+        Parameters:
+            cursor (Optional[str]): cursor returned with the previous page,
+                None for the first page
+            limit (int): number of students per page
+
+        Returns:
+            (Any): list of students and cursor of the next page, None on
+                the last page
+        """
+        offset = StudentService._decode_cursor(cursor)
+
+        # Get API link from settings
+        api_uri = StudentService._api_uri()
+
+        # Make API call for the page only
+        response = HTTP_CLIENT.get(
+            api_uri, params=StudentService._page_params(offset, limit)
+        )
+        response.raise_for_status()
+
+        return StudentService._load_students_page(offset, limit)
+
+    @staticmethod
+    def iter_all(page_size: int = 100) -> Iterator[Any]:
+        """
+        Iterate over all students, fetching one page at a time.
+
+        Parameters:
+            page_size (int): number of students per upstream call
+
+        Yields:
+            (Any): student
+        """
+        cursor = None
+        while True:
+            students, cursor = StudentService.get_page(cursor, page_size)
+            yield from students
+            if cursor is None:
+                return
+
+    @staticmethod
+    def get_many(ids: Sequence[Any]) -> Any:
+        """
+        Get students by ids, fetching the ones not cached in one call.
+
+        Parameters:
+            ids (Sequence[Any]): student ids
+
+        Returns:
+            (Any): list of found students, in order of the ids
+        """
+        unique, students, missing = StudentService._lookup_many(ids)
+        if missing:
+            generation = CACHE.generation()
+            StudentService._store_many(
+                students, StudentService._get_many(tuple(missing)), generation
+            )
+
+        return StudentService._ordered(unique, students)
+
+    @staticmethod
+    @single_flight
+    def _get_many(ids: Sequence[Any]) -> List[Any]:
+        """
+        Get students by ids from upstream API, sharing concurrent calls.
+
+        Parameters:
+            ids (Sequence[Any]): student ids
+
+        Returns:
+            (List[Any]): list of found students
+        """
         # Get API link from settings
-        api_uri = SETTINGS["API"]["url"]
+        api_uri = StudentService._api_uri()
 
         # Make API call
-        response = requests.get(api_uri, timeout=(3.05, 27))
+        response = HTTP_CLIENT.get(api_uri)
         response.raise_for_status()
 
-        data = [
-            {
-                "id": uuid.uuid4().hex,
-                "student": {
-                    "first_name": "James",
-                    "last_name": "Smith",
-                    "dob": datetime.strptime("10/10/1978", "%d/%m/%Y").date().isoformat(),  # noqa  # pylint: disable=line-too-long
-                    "gender": GenderEnum.MALE.name,
-                },
-            },
-            {
-                "id": uuid.uuid4().hex,
-                "student": {
-                    "first_name": "Sarah",
-                    "last_name": "Smith",
-                    "dob": datetime.strptime("10/10/1988", "%d/%m/%Y").date().isoformat(),  # noqa  # pylint: disable=line-too-long
-                    "gender": GenderEnum.FEMALE.name,
-                },
-            },
-        ]
-
-        # Deserializing Object
-        return StudentSchema(many=True).load(data)
+        return StudentService._load_students_by_id(ids)
 
     @staticmethod
     def post(request: Any) -> Any:  # pylint: disable=unused-argument
@@ -103,16 +194,15 @@ def post(request: Any) -> Any:  # pylint: disable=unused-argument
             student id
         """
         # Get API link from settings
-        api_uri = SETTINGS["API"]["url"]
+        api_uri = StudentService._api_uri()
 
         # Make API call
-        response = requests.get(api_uri, timeout=(3.05, 27))
+        response = HTTP_CLIENT.get(api_uri)
         response.raise_for_status()
 
-        data = {"id": uuid.uuid4().hex}
+        StudentService._invalidate()
 
-        # Deserializing Object
-        return StudentIdSchema().load(data)
+        return StudentService._load_student_id()
 
     @staticmethod
     def patch(_id: str, request: Any) -> Any:
@@ -127,19 +217,15 @@ def patch(_id: str, request: Any) -> Any:
             schema (Any): student response object
         """
         # Get API link from settings
-        api_uri = SETTINGS["API"]["url"]
+        api_uri = StudentService._api_uri()
 
         # Make API call
-        response = requests.get(api_uri, timeout=(3.05, 27))
+        response = HTTP_CLIENT.get(api_uri)
         response.raise_for_status()
 
-        data = {
-            "id": _id,
-            "student": request,
-        }
+        StudentService._invalidate(_id)
 
-        # Deserializing Object
-        return StudentSchema().load(data)
+        return StudentService._load_updated(_id, request)
 
     @staticmethod
     def delete(_id: str) -> Any:
@@ -153,13 +239,12 @@ def delete(_id: str) -> Any:
             data(Dict[str, Any]): exception if fail
         """
         # Get API link from settings
-        api_uri = SETTINGS["API"]["url"]
+        api_uri = StudentService._api_uri()
 
         # Make API call
-        response = requests.get(api_uri, timeout=(3.05, 27))
+        response = HTTP_CLIENT.get(api_uri)
         response.raise_for_status()
 
-        # Return exception if fail
-        data: Dict[str, Any] = {}
+        StudentService._invalidate(_id)
 
-        return data
+        return StudentService._load_deleted()
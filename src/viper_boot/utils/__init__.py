@@ -1,2 +1,15 @@
 """Utilities Package."""
-from .banner import Banner
+from typing import TYPE_CHECKING
+
+from .lazy_import import lazy_exports
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .banner import Banner
+
+# Submodules are imported on first use, see `lazy_exports`
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Banner": ".banner",
+    },
+)
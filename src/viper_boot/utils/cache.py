@@ -0,0 +1,608 @@
+"""Read-through Caches."""
+import atexit
+import errno
+import os
+import secrets
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from multiprocessing import AuthenticationError
+from multiprocessing.managers import BaseManager
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import cast
+
+
+class Cache(ABC):
+    """
+    Read-through cache backend.
+
+    Backends only store values, `get_or_load` and `get_or_load_async`
+    call the loader on a miss and store its result. Every invalidation
+    advances the generation of the cache, a value loaded before a key was
+    invalidated is not stored, so it can not overwrite the invalidation.
+    """
+
+    def start(self) -> None:
+        """Start backend services, before worker processes are forked."""
+
+    @abstractmethod
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up fresh value.
+
+        Parameters:
+            key (Hashable): cache key
+
+        Returns:
+            whether the key was found, and its value
+        """
+
+    @abstractmethod
+    def set(
+        self, key: Hashable, value: Any, generation: Optional[int] = None
+    ) -> None:
+        """
+        Store value.
+
+        Parameters:
+            key (Hashable): cache key
+            value (Any): value to store
+            generation (Optional[int]): `generation` read before the value
+                was loaded, the value is discarded if the key was
+                invalidated since, None to store unconditionally
+        """
+
+    @abstractmethod
+    def delete(self, *keys: Hashable) -> None:
+        """
+        Invalidate keys.
+
+        Parameters:
+            *keys (Hashable): cache keys
+        """  # noqa: RST210
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Invalidate all keys."""
+
+    @abstractmethod
+    def generation(self) -> int:
+        """
+        Get generation of the cache, advanced by every invalidation.
+
+        Returns:
+            current generation
+        """
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            hits, misses, evictions, expirations and current size
+        """
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Get cached value, load and store it on a miss.
+
+        Parameters:
+            key (Hashable): cache key
+            loader (Callable[[], Any]): loads the value, e.g. from upstream
+
+        Returns:
+            cached or loaded value
+        """
+        found, value = self.lookup(key)
+        if not found:
+            generation = self.generation()
+            value = loader()
+            self.set(key, value, generation)
+
+        return value
+
+    async def get_or_load_async(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Get cached value, await the loader and store its value on a miss.
+
+        Parameters:
+            key (Hashable): cache key
+            loader (Callable[[], Awaitable[Any]]): loads the value
+
+        Returns:
+            cached or loaded value
+        """
+        found, value = self.lookup(key)
+        if not found:
+            generation = self.generation()
+            value = await loader()
+            self.set(key, value, generation)
+
+        return value
+
+
+class NullCache(Cache):
+    """Cache that stores nothing, every lookup is a miss."""
+
+    def __init__(self, **_options: Any) -> None:
+        """
+        Initialise the counters.
+
+        Parameters:
+            **_options (Any): ignored backend options, e.g. `maxsize`
+        """  # noqa: RST210
+        self._misses = 0
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Count the miss.
+
+        Parameters:
+            key (Hashable): cache key
+
+        Returns:
+            not found
+        """
+        self._misses += 1
+        return False, None
+
+    def set(
+        self, key: Hashable, value: Any, generation: Optional[int] = None
+    ) -> None:
+        """
+        Discard value.
+
+        Parameters:
+            key (Hashable): cache key
+            value (Any): value to store
+            generation (Optional[int]): generation the value was loaded at
+        """
+
+    def delete(self, *keys: Hashable) -> None:
+        """
+        Nothing to invalidate.
+
+        Parameters:
+            *keys (Hashable): cache keys
+        """  # noqa: RST210
+
+    def clear(self) -> None:
+        """Nothing to invalidate."""
+
+    def generation(self) -> int:
+        """
+        Get generation, nothing is ever stored.
+
+        Returns:
+            0
+        """
+        return 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            hits, misses, evictions, expirations and current size
+        """
+        return {
+            "hits": 0,
+            "misses": self._misses,
+            "evictions": 0,
+            "expirations": 0,
+            "size": 0,
+        }
+
+
+# Settings, entries and hit counters of the cache are kept together
+class MemoryCache(Cache):  # pylint: disable=too-many-instance-attributes
+    """
+    In-process LRU cache with time to live.
+
+    Entries expire `ttl` seconds after they are stored. When `maxsize`
+    entries are stored, the least recently used one is evicted. The
+    generation of the last `maxsize` invalidated keys is kept, loads
+    started before an older invalidation are discarded.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0) -> None:
+        """
+        Initialise the cache.
+
+        Parameters:
+            maxsize (int): entries to keep
+            ttl (float): seconds entries stay fresh
+        """
+        if maxsize < 1:
+            raise ValueError("Cache maxsize must be at least 1")
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self._generation = 0
+        # Generation of invalidated keys, older invalidations raise _floor
+        self._invalidated: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._floor = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up fresh value, mark it most recently used.
+
+        Parameters:
+            key (Hashable): cache key
+
+        Returns:
+            whether the key was found, and its value
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry[1]
+
+    def set(
+        self, key: Hashable, value: Any, generation: Optional[int] = None
+    ) -> None:
+        """
+        Store value, evict least recently used entries beyond `maxsize`.
+
+        Parameters:
+            key (Hashable): cache key
+            value (Any): value to store
+            generation (Optional[int]): `generation` read before the value
+                was loaded, the value is discarded if the key was
+                invalidated since, None to store unconditionally
+        """
+        with self._lock:
+            if generation is not None and generation < self._invalidated.get(
+                key, self._floor
+            ):
+                return
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, *keys: Hashable) -> None:
+        """
+        Invalidate keys.
+
+        Parameters:
+            *keys (Hashable): cache keys
+        """  # noqa: RST210
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+                self._invalidated[key] = self._generation
+                self._invalidated.move_to_end(key)
+            while len(self._invalidated) > self._maxsize:
+                _, generation = self._invalidated.popitem(last=False)
+                self._floor = max(self._floor, generation)
+
+    def clear(self) -> None:
+        """Invalidate all keys."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._invalidated.clear()
+            self._floor = self._generation
+
+    def generation(self) -> int:
+        """
+        Get generation of the cache, advanced by every invalidation.
+
+        Returns:
+            current generation
+        """
+        with self._lock:
+            return self._generation
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+
+        Returns:
+            hits, misses, evictions, expirations and current size
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries),
+            }
+
+
+class _CacheManager(BaseManager):
+    """Serves one `MemoryCache` over a local socket."""
+
+
+# Cache of the cache server process
+_SERVED: Dict[str, MemoryCache] = {}
+
+
+def _served_cache(maxsize: int, ttl: float) -> MemoryCache:
+    """
+    Get the cache of the server process, shared by all connections.
+
+    Parameters:
+        maxsize (int): entries to keep
+        ttl (float): seconds entries stay fresh
+
+    Returns:
+        shared cache
+    """
+    if "cache" not in _SERVED:
+        _SERVED["cache"] = MemoryCache(maxsize, ttl)
+    return _SERVED["cache"]
+
+
+_CacheManager.register("cache", callable=_served_cache)
+
+
+# Settings, server and per-process connection are kept together
+class SocketCache(Cache):  # pylint: disable=too-many-instance-attributes
+    """
+    LRU cache with time to live, shared by processes over a local socket.
+
+    `start` runs the cache in a server process listening on `address`,
+    e.g. before pre-forked workers are started. Every process connects
+    lazily. When the server is unreachable, lookups are misses, so
+    requests fall back to the upstream API.
+
+    Connections exchange pickles, so they are authenticated with `authkey`
+    and the socket must be in a directory only the owner can access.
+    Without `address`, `start` creates such a directory for the run.
+    Without `authkey`, a random key is created, known to the processes
+    forked after the cache is created.
+    """
+
+    def __init__(
+        self,
+        address: Optional[str] = None,
+        authkey: Optional[bytes] = None,
+        maxsize: int = 1024,
+        ttl: float = 30.0,
+    ) -> None:
+        """
+        Initialise the cache client.
+
+        Parameters:
+            address (Optional[str]): Unix socket path of the cache server,
+                in a private (0700) directory, None for a new directory
+                created by `start`
+            authkey (Optional[bytes]): key authenticating connections,
+                None for a random key
+            maxsize (int): entries to keep
+            ttl (float): seconds entries stay fresh
+        """
+        self._address = address
+        self._authkey = authkey or secrets.token_bytes(32)
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._manager: Optional[_CacheManager] = None
+        self._lock = threading.Lock()
+        self._proxy: Any = None
+        self._pid = 0
+
+    def start(self) -> None:
+        """
+        Start cache server process listening on the socket.
+
+        Raises:
+            ValueError: if the socket directory is accessible by others
+            OSError: if another cache server listens on the socket
+        """
+        if self._address is None:
+            directory = tempfile.mkdtemp(prefix="viper-boot-cache-")
+            atexit.register(_remove_directory, directory, os.getpid())
+            self._address = os.path.join(directory, "cache.sock")
+
+        directory = os.path.dirname(os.path.abspath(self._address))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if os.stat(directory).st_mode & 0o077:
+            raise ValueError(f"Cache socket directory is shared: {directory}")
+        if os.path.exists(self._address):
+            if _listening(self._address):
+                raise OSError(
+                    errno.EADDRINUSE, "Cache server listening", self._address
+                )
+            os.unlink(self._address)  # Stale socket of a previous run
+
+        self._manager = _CacheManager(self._address, self._authkey)
+        self._manager.start()  # pylint: disable=consider-using-with
+
+    def lookup(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up fresh value on the cache server.
+
+        Parameters:
+            key (Hashable): cache key
+
+        Returns:
+            whether the key was found, and its value
+        """
+        return cast(
+            Tuple[bool, Any], self._call("lookup", (False, None), key)
+        )
+
+    def set(
+        self, key: Hashable, value: Any, generation: Optional[int] = None
+    ) -> None:
+        """
+        Store value on the cache server.
+
+        Parameters:
+            key (Hashable): cache key
+            value (Any): value to store, must be picklable
+            generation (Optional[int]): `generation` read before the value
+                was loaded, the value is discarded if the key was
+                invalidated since, None to store unconditionally
+        """
+        self._call("set", None, key, value, generation)
+
+    def delete(self, *keys: Hashable) -> None:
+        """
+        Invalidate keys on the cache server.
+
+        Parameters:
+            *keys (Hashable): cache keys
+        """  # noqa: RST210
+        self._call("delete", None, *keys)
+
+    def clear(self) -> None:
+        """Invalidate all keys on the cache server."""
+        self._call("clear", None)
+
+    def generation(self) -> int:
+        """
+        Get generation of the cache server.
+
+        Returns:
+            current generation, 0 when the server is unreachable
+        """
+        return cast(int, self._call("generation", 0))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters of the cache server.
+
+        Returns:
+            hits, misses, evictions, expirations and current size
+        """
+        return cast(Dict[str, int], self._call("stats", {}))
+
+    def _call(self, method: str, default: Any, *args: Any) -> Any:
+        """
+        Call cache server method, reconnect on the next call on failure.
+
+        Parameters:
+            method (str): cache method name
+            default (Any): result when the server is unreachable
+            *args (Any): method arguments
+
+        Returns:
+            method result
+        """  # noqa: RST210
+        try:
+            return getattr(self._connect(), method)(*args)
+        except (OSError, EOFError, AuthenticationError):
+            self._proxy = None
+            return default
+
+    def _connect(self) -> Any:
+        """
+        Connect to the cache server once per process.
+
+        Returns:
+            proxy of the shared cache
+        """
+        with self._lock:
+            if self._address is None:
+                raise ConnectionRefusedError("Cache server not started")
+            if self._proxy is None or self._pid != os.getpid():
+                manager = _CacheManager(self._address, self._authkey)
+                manager.connect()
+                # `cache` is registered on the manager class at runtime
+                self._proxy = getattr(manager, "cache")(
+                    self._maxsize, self._ttl
+                )
+                self._pid = os.getpid()
+            return self._proxy
+
+
+def _listening(address: str) -> bool:
+    """
+    Check whether a server accepts connections on a Unix socket.
+
+    Parameters:
+        address (str): Unix socket path
+
+    Returns:
+        True if a connection was accepted
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(address)
+        except OSError:
+            return False
+        return True
+
+
+def _remove_directory(directory: str, pid: int) -> None:
+    """
+    Remove socket directory at exit of the process which created it.
+
+    Parameters:
+        directory (str): private socket directory
+        pid (int): process id of the creator, forked workers keep it
+    """
+    if os.getpid() == pid:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+CACHE_BACKENDS: Dict[str, Type[Cache]] = {
+    "none": NullCache,
+    "memory": MemoryCache,
+    "socket": SocketCache,
+}
+
+
+def create_cache(settings: Optional[Dict[str, Any]] = None) -> Cache:
+    """
+    Create cache backend from settings.
+
+    Settings (`[*.cache]` block):
+        backend (str): key of `CACHE_BACKENDS`, defaults to `memory`
+        other keys are passed to the backend, e.g. `maxsize` and `ttl`
+
+    Parameters:
+        settings (Optional[Dict[str, Any]]): `[*.cache]` settings block
+
+    Raises:
+        ValueError: if the backend is not registered
+
+    Returns:
+        cache backend
+    """
+    options = {key.lower(): value for key, value in (settings or {}).items()}
+    backend = options.pop("backend", "memory")
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown cache backend: {backend}")
+    if "authkey" in options:
+        options["authkey"] = str(options["authkey"]).encode("utf-8")
+
+    return CACHE_BACKENDS[backend](**options)
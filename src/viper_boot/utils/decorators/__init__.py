@@ -1,2 +1,4 @@
 """Decorators Package."""
+from .single_flight_decorator import single_flight
 from .singleton_decorator import singleton
+from .traced_decorator import traced
@@ -0,0 +1,142 @@
+"""Single-flight Function Decorator."""
+import asyncio
+import inspect
+import threading
+import weakref
+from functools import wraps
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import MutableMapping
+from typing import Optional
+from typing import Tuple
+
+
+class _Call:
+    """In-flight call shared by the concurrent callers."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        """Initialise pending call."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+def single_flight(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Single-flight Function Decorator.
+
+    Concurrent calls with equal arguments share one call of the function,
+    the first caller runs it and the others wait for its result or error.
+    Works for functions called from threads and coroutine functions
+    awaited on an event loop. Arguments must be hashable.
+
+    Parameters:
+        func (Callable[..., Any]): function or coroutine function
+
+    Returns:
+        decorated function
+    """
+    if inspect.iscoroutinefunction(func):
+        return _async_single_flight(func)
+
+    lock = threading.Lock()
+    calls: Dict[Hashable, _Call] = {}
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = _key(args, kwargs)
+        with lock:
+            call = calls.get(key)
+            leader = call is None
+            if call is None:
+                call = calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with lock:
+                del calls[key]
+            call.done.set()
+
+        return call.result
+
+    return wrapper
+
+
+def _async_single_flight(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Single-flight decorator of coroutine functions, per event loop.
+
+    When the leading caller is cancelled, its waiting callers are not, the
+    first of them calls the function again for the others.
+
+    Parameters:
+        func (Callable[..., Any]): coroutine function
+
+    Returns:
+        decorated coroutine function
+    """
+    loops: MutableMapping[
+        asyncio.AbstractEventLoop, Dict[Hashable, "asyncio.Future[Any]"]
+    ] = weakref.WeakKeyDictionary()
+
+    @wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = _key(args, kwargs)
+        loop = asyncio.get_running_loop()
+        calls = loops.setdefault(loop, {})
+        future = calls.get(key)
+        while future is not None:
+            try:
+                # Waiting callers must not cancel the shared call
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # This caller is cancelled
+            # The leading caller is cancelled, the first waiter leads next
+            future = calls.get(key)
+
+        future = calls[key] = loop.create_future()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            future.exception()  # Retrieved, even without waiting callers
+            raise
+        finally:
+            del calls[key]
+
+        future.set_result(result)
+        return result
+
+    return wrapper
+
+
+def _key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Get key of call arguments.
+
+    Parameters:
+        args (Tuple[Any, ...]): positional arguments
+        kwargs (Dict[str, Any]): keyword arguments
+
+    Returns:
+        hashable key
+    """
+    return (args, tuple(sorted(kwargs.items()))) if kwargs else args
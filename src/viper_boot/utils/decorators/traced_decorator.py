@@ -0,0 +1,68 @@
+"""Traced Class and Function Decorator."""
+import inspect
+from functools import wraps
+from typing import Any
+from typing import Callable
+
+from ..tracing import TRACER
+
+
+def traced(target: Any) -> Any:
+    """
+    Traced Class and Function Decorator.
+
+    Calls made in a traced request open a span named after the function,
+    see `Tracer.span`. Decorated classes trace their public methods,
+    static and class methods included. Generator functions are not traced,
+    their body runs after the call returns.
+
+    Parameters:
+        target (Any): class, function or coroutine function
+
+    Returns:
+        class with traced methods, or traced function
+    """
+    if not inspect.isclass(target):
+        return _traced(target, target.__qualname__)
+
+    for name, member in list(vars(target).items()):
+        if name.startswith("_"):
+            continue
+        span_name = f"{target.__name__}.{name}"
+        if isinstance(member, (staticmethod, classmethod)):
+            func = _traced(member.__func__, span_name)
+            setattr(target, name, type(member)(func))
+        elif inspect.isfunction(member):
+            setattr(target, name, _traced(member, span_name))
+    return target
+
+
+def _traced(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+    """
+    Wrap function in a span.
+
+    Parameters:
+        func (Callable[..., Any]): function or coroutine function
+        name (str): span name
+
+    Returns:
+        traced function, generator functions as they are
+    """
+    if inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func):
+        return func
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with TRACER.span(name):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with TRACER.span(name):
+            return func(*args, **kwargs)
+
+    return wrapper
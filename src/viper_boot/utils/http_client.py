@@ -0,0 +1,362 @@
+"""Pooled HTTP Clients."""
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import MutableMapping
+from typing import Optional
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .lazy_import import lazy_import
+from .metrics import METRICS
+from .tracing import Span
+from .tracing import TRACER
+
+if TYPE_CHECKING:  # pragma: no cover
+    import httpx
+else:
+    # Only needed by the async client
+    httpx = lazy_import("httpx")
+
+
+# Upstream URL, timeouts and pool limits are read from one config
+class _BaseHttpClient:  # pylint: disable=too-many-instance-attributes
+    """
+    Upstream API client settings.
+
+    Settings (`[*.api]` block):
+        url (str): default upstream URL
+        timeout (List[float]): connect and read timeout in seconds
+        pool_connections (int): number of per-host pools to cache
+        pool_maxsize (int): connections kept alive per host
+        pool_block (bool): wait for a free connection when pool is full
+        keep_alive (bool): keep connections open between calls
+        retries (int): retries on connection errors and 502, 503, 504
+        backoff_factor (float): exponential backoff factor between retries
+    """
+
+    _DEFAULT_TIMEOUT = (3.05, 27)
+    _RETRY_STATUSES = (502, 503, 504)
+    _RETRY_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+    def __init__(
+        self, settings: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """
+        Initialise the client from upstream API settings.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.api]` settings block
+        """
+        self._configure(settings)
+
+    def _configure(self, settings: Optional[Mapping[str, Any]]) -> None:
+        """
+        Read upstream API settings.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.api]` settings block
+        """
+        settings = settings or {}
+        self._url: str = settings.get("url", "")
+        connect, read = settings.get("timeout", self._DEFAULT_TIMEOUT)
+        self._timeout: Tuple[float, float] = (float(connect), float(read))
+        self._pool_connections = int(settings.get("pool_connections", 10))
+        self._pool_maxsize = int(settings.get("pool_maxsize", 10))
+        self._pool_block = bool(settings.get("pool_block", False))
+        self._keep_alive = bool(settings.get("keep_alive", True))
+        self._retries = int(settings.get("retries", 0))
+        self._backoff_factor = float(settings.get("backoff_factor", 0))
+
+    @property
+    def url(self) -> str:
+        """
+        Getter method for default upstream URL.
+
+        Returns:
+            upstream URL
+        """
+        return self._url
+
+
+class HttpClient(_BaseHttpClient):
+    """
+    Connection pooled, keep-alive HTTP client for upstream APIs.
+
+    Connections are reused across calls and threads. The session is
+    created lazily per process, so pre-forked workers never share sockets.
+    """
+
+    def __init__(
+        self, settings: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """
+        Initialise the client from upstream API settings.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.api]` settings block
+        """
+        super().__init__(settings)
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._pid = 0
+
+    def get(self, url: str = "", **kwargs: Any) -> requests.Response:
+        """
+        Send GET request on a pooled connection.
+
+        Parameters:
+            url (str): request URL, defaults to the settings `url`
+            **kwargs (Any): extra `requests` arguments
+
+        Returns:
+            upstream response
+        """  # noqa: RST210
+        kwargs.setdefault("timeout", self._timeout)
+        url = url or self._url
+        with METRICS.stage("upstream"), TRACER.span(
+            "upstream.get", url=url
+        ) as span:
+            _propagate(span, kwargs)
+            return self.session.get(url, **kwargs)
+
+    def configure(self, settings: Optional[Mapping[str, Any]]) -> None:
+        """
+        Apply new upstream API settings, e.g. after a config reload.
+
+        The pooled session is closed, the next request creates a new one
+        with the new URL, pool sizes and retry policy. Requests in flight
+        complete on the old connections.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.api]` settings block
+        """
+        with self._lock:
+            self._configure(settings)
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Getter method for the pooled session of the current process.
+
+        Returns:
+            pooled session
+        """
+        session = self._session
+        if session is not None and self._pid == os.getpid():
+            return session
+
+        with self._lock:
+            if self._session is None or self._pid != os.getpid():
+                # Inherited session sockets belong to the parent process
+                self._session = self._create_session()
+                self._pid = os.getpid()
+            return self._session
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create session with pooled adapters and retry policy.
+
+        Returns:
+            new session
+        """
+        retry = Retry(
+            total=self._retries,
+            backoff_factor=self._backoff_factor,
+            status_forcelist=self._RETRY_STATUSES,
+            allowed_methods=self._RETRY_METHODS,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            pool_block=self._pool_block,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """
+    Non-blocking, connection pooled HTTP client for upstream APIs.
+
+    Connections belong to an event loop, so one `httpx.AsyncClient` is
+    kept per running loop (and process). `pool_maxsize` connections are
+    kept alive per cached host pool, `pool_block` caps the total number of
+    connections to the same amount. Clients replaced by `configure` are
+    closed by their loop, once their requests in flight complete.
+    """
+
+    def __init__(
+        self, settings: Optional[Mapping[str, Any]] = None
+    ) -> None:
+        """
+        Initialise the client from upstream API settings.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.api]` settings block
+        """
+        super().__init__(settings)
+        self._generation = 0
+        self._clients: MutableMapping[
+            asyncio.AbstractEventLoop, Tuple[int, int, "httpx.AsyncClient"]
+        ] = weakref.WeakKeyDictionary()
+        self._retired: MutableMapping[
+            asyncio.AbstractEventLoop, List["httpx.AsyncClient"]
+        ] = weakref.WeakKeyDictionary()
+        self._in_flight: Dict["httpx.AsyncClient", int] = {}
+
+    async def get(self, url: str = "", **kwargs: Any) -> "httpx.Response":
+        """
+        Send GET request on a pooled connection.
+
+        Connection errors are retried by the transport, 502, 503 and 504
+        responses are retried here with exponential backoff.
+
+        Parameters:
+            url (str): request URL, defaults to the settings `url`
+            **kwargs (Any): extra `httpx` arguments
+
+        Returns:
+            upstream response
+        """  # noqa: RST210
+        client = self.client
+        attempt = 0
+        url = url or self._url
+        self._in_flight[client] = self._in_flight.get(client, 0) + 1
+        try:
+            with METRICS.stage("upstream"), TRACER.span(
+                "upstream.get", url=url
+            ) as span:
+                _propagate(span, kwargs)
+                while True:
+                    response = await client.get(url, **kwargs)
+                    if (
+                        response.status_code not in self._RETRY_STATUSES
+                        or attempt >= self._retries
+                    ):
+                        return response
+
+                    await response.aclose()
+                    await asyncio.sleep(self._backoff_factor * 2**attempt)
+                    attempt += 1
+        finally:
+            self._in_flight[client] -= 1
+            if not self._in_flight[client]:
+                del self._in_flight[client]
+            await self._close_retired()
+
+    def configure(self, settings: Optional[Mapping[str, Any]]) -> None:
+        """
+        Apply new upstream API settings, e.g. after a config reload.
+
+        Each loop replaces its client on its next request, with the new
+        URL and pool limits. Requests in flight complete on the old client,
+        which the loop closes when they are done.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.api]` settings block
+        """
+        self._configure(settings)
+        self._generation += 1
+
+    async def aclose(self) -> None:
+        """Close pooled connections of the running loop."""
+        loop = asyncio.get_running_loop()
+        entry = self._clients.pop(loop, None)
+        clients = self._retired.pop(loop, [])
+        if entry is not None:
+            clients.append(entry[2])
+        for client in clients:
+            await client.aclose()
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """
+        Getter method for the pooled client of the running loop.
+
+        Returns:
+            pooled client
+        """
+        loop = asyncio.get_running_loop()
+        pid = os.getpid()
+        entry = self._clients.get(loop)
+        if entry is None or entry[:2] != (pid, self._generation):
+            if entry is not None and entry[0] == pid:
+                # Closed by `_close_retired`, inherited clients belong to
+                # the parent process
+                self._retired.setdefault(loop, []).append(entry[2])
+            entry = (pid, self._generation, self._create_client())
+            self._clients[loop] = entry
+        return entry[2]
+
+    async def _close_retired(self) -> None:
+        """Close clients replaced by `configure` without requests."""
+        retired = self._retired.get(asyncio.get_running_loop(), [])
+        for client in list(retired):
+            if client not in self._in_flight:
+                retired.remove(client)
+                await client.aclose()
+
+    def _create_client(self) -> "httpx.AsyncClient":
+        """
+        Create client with pool limits, timeouts and connect retries.
+
+        Returns:
+            new client
+        """
+        connect, read = self._timeout
+        max_keepalive = self._pool_connections * self._pool_maxsize
+        limits = httpx.Limits(
+            max_connections=max_keepalive if self._pool_block else None,
+            max_keepalive_connections=max_keepalive if self._keep_alive else 0,
+        )
+
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=httpx.Timeout(read, connect=connect),
+            transport=httpx.AsyncHTTPTransport(
+                limits=limits, retries=self._retries
+            ),
+        )
+
+
+def _propagate(span: Optional[Span], kwargs: Dict[str, Any]) -> None:
+    """
+    Send the current span as parent of the upstream request.
+
+    Parameters:
+        span (Optional[Span]): span of the upstream call, None outside
+            traces
+        kwargs (Dict[str, Any]): request arguments, `headers` is updated
+    """
+    if span is not None:
+        headers = dict(kwargs.get("headers") or {})
+        headers["traceparent"] = span.traceparent
+        kwargs["headers"] = headers
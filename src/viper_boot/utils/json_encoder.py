@@ -0,0 +1,171 @@
+"""Pluggable JSON Encoders."""
+import json
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Type
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # Optional accelerated backend, `pip install orjson`
+
+
+class JsonEncoder(ABC):
+    """
+    JSON encoder backend.
+
+    Data is encoded straight to compact UTF-8 bytes, indented only when
+    pretty output is asked for.
+    """
+
+    @abstractmethod
+    def encode(self, data: Any, pretty: bool = False) -> bytes:
+        """
+        Encode data to JSON.
+
+        Parameters:
+            data (Any): JSON serializable data
+            pretty (bool): indent by two spaces instead of compact output
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode JSON.
+
+        Parameters:
+            data (bytes): UTF-8 encoded JSON
+
+        Raises:
+            ValueError: if data is not valid JSON
+
+        Returns:
+            decoded data
+        """
+
+
+class StdlibJsonEncoder(JsonEncoder):
+    """JSON encoder of the standard library `json` module."""
+
+    def __init__(self) -> None:
+        """Initialise compact and pretty encoders."""
+        self._compact = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":")
+        )
+        self._pretty = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+    def encode(self, data: Any, pretty: bool = False) -> bytes:
+        """
+        Encode data to JSON.
+
+        Parameters:
+            data (Any): JSON serializable data
+            pretty (bool): indent by two spaces instead of compact output
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        encoder = self._pretty if pretty else self._compact
+        return encoder.encode(data).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode JSON.
+
+        Parameters:
+            data (bytes): UTF-8 encoded JSON
+
+        Raises:
+            ValueError: if data is not valid JSON
+
+        Returns:
+            decoded data
+        """
+        return json.loads(data)
+
+
+class OrjsonEncoder(JsonEncoder):
+    """JSON encoder of the optional `orjson` package."""
+
+    def __init__(self) -> None:
+        """
+        Check that `orjson` is installed.
+
+        Raises:
+            ValueError: if `orjson` is not installed
+        """
+        if orjson is None:
+            raise ValueError("JSON encoder orjson is not installed")
+
+    def encode(self, data: Any, pretty: bool = False) -> bytes:
+        """
+        Encode data to JSON.
+
+        Parameters:
+            data (Any): JSON serializable data
+            pretty (bool): indent by two spaces instead of compact output
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        # Non-string keys, e.g. indexes of validation errors, as stdlib
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode JSON.
+
+        Parameters:
+            data (bytes): UTF-8 encoded JSON
+
+        Raises:
+            ValueError: if data is not valid JSON
+
+        Returns:
+            decoded data
+        """
+        return orjson.loads(data)
+
+
+JSON_ENCODERS: Dict[str, Type[JsonEncoder]] = {
+    "stdlib": StdlibJsonEncoder,
+    "orjson": OrjsonEncoder,
+}
+
+
+def create_json_encoder(
+    settings: Optional[Dict[str, Any]] = None
+) -> JsonEncoder:
+    """
+    Create JSON encoder from settings.
+
+    Settings (`[*.json]` block):
+        encoder (str): key of `JSON_ENCODERS`, defaults to `auto`, which
+            is `orjson` if installed, else `stdlib`
+
+    Parameters:
+        settings (Optional[Dict[str, Any]]): `[*.json]` settings block
+
+    Raises:
+        ValueError: if the encoder is not registered or not installed
+
+    Returns:
+        JSON encoder
+    """
+    options = {key.lower(): value for key, value in (settings or {}).items()}
+    name = options.get("encoder", "auto")
+    if name == "auto":
+        name = "stdlib" if orjson is None else "orjson"
+    if name not in JSON_ENCODERS:
+        raise ValueError(f"Unknown JSON encoder: {name}")
+
+    return JSON_ENCODERS[name]()
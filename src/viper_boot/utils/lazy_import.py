@@ -0,0 +1,248 @@
+"""Lazy Imports and Import Profiling."""
+import importlib
+import importlib.abc
+import importlib.util
+import sys
+import time
+from types import ModuleType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import TextIO
+from typing import Tuple
+from typing import cast
+
+
+class _LazyModule(ModuleType):
+    """Module proxy importing the module on first attribute access."""
+
+    def __getattr__(self, attr: str) -> Any:
+        """
+        Import the module and get its attribute.
+
+        Parameters:
+            attr (str): attribute name
+
+        Returns:
+            attribute of the imported module
+        """
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(vars(module))
+        return getattr(module, attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    Import module on first attribute access.
+
+    The proxy is not added to `sys.modules`, so code scanning modules,
+    e.g. `inspect.stack`, does not import it.
+
+    Parameters:
+        name (str): absolute module name
+
+    Raises:
+        ModuleNotFoundError: if the module is not installed
+
+    Returns:
+        module, or proxy importing it when one of its attributes is used
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    if importlib.util.find_spec(name) is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return _LazyModule(name)
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Create module `__getattr__` and `__dir__` importing exports on use.
+
+    Package `__init__` modules re-export names without importing all
+    submodules, e.g. the sync services do not import `httpx`.
+
+    Parameters:
+        package (str): package name, `__name__` of the `__init__` module
+        exports (Dict[str, str]): relative submodule by exported name
+
+    Returns:
+        module `__getattr__` and `__dir__` functions
+    """
+    module = sys.modules[package]
+
+    def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+        if name not in exports:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(exports[name], package), name)
+        setattr(module, name, value)  # Next lookups skip `__getattr__`
+        return value
+
+    def __dir__() -> List[str]:  # pylint: disable=invalid-name
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__
+
+
+class ImportProfiler(importlib.abc.MetaPathFinder):
+    """
+    Measure the time spent importing every module, like `-X importtime`.
+
+    Install it with `with ImportProfiler() as profiler:`, modules imported
+    in the block are timed, cumulative time includes nested imports.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the profiler."""
+        # Module name, cumulative and self time in seconds
+        self._timings: List[Tuple[str, float, float]] = []
+        self._nested: List[float] = []
+
+    def __enter__(self) -> "ImportProfiler":
+        """
+        Start timing imports.
+
+        Returns:
+            the profiler
+        """
+        sys.meta_path.insert(0, self)
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        """
+        Stop timing imports.
+
+        Parameters:
+            *_args (Any): exception type, value and traceback
+        """  # noqa: RST210
+        sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Optional[Sequence[str]],
+        target: Optional[ModuleType] = None,
+    ) -> Any:
+        """
+        Find module spec with the other finders and time its loader.
+
+        Parameters:
+            fullname (str): module name
+            path (Optional[Sequence[str]]): parent package `__path__`
+            target (Optional[ModuleType]): module being reloaded
+
+        Returns:
+            module spec with a timed loader, None if not found
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(
+                    spec.loader, "exec_module"
+                ):
+                    spec.loader = _TimedLoader(self, spec.loader)
+                return spec
+        return None
+
+    def timed(self, name: str, exec_module: Callable[[], None]) -> None:
+        """
+        Execute module and record its import time.
+
+        Parameters:
+            name (str): module name
+            exec_module (Callable[[], None]): executes the module
+        """
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module()
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            self._timings.append((name, elapsed, elapsed - nested))
+
+    def report(self, file: TextIO = sys.stderr, limit: int = 25) -> None:
+        """
+        Print slowest imports by cumulative time.
+
+        Parameters:
+            file (TextIO): output stream
+            limit (int): number of modules to print
+        """
+        total = sum(own for _, _, own in self._timings)
+        print(
+            f"Imported {len(self._timings)} modules in "
+            f"{total * 1000:.1f} ms",
+            file=file,
+        )
+        print(f"{'cumulative ms':>13} | {'self ms':>8} | module", file=file)
+        timings = sorted(self._timings, key=lambda item: -item[1])
+        for name, elapsed, own in timings[:limit]:
+            print(
+                f"{elapsed * 1000:13.1f} | {own * 1000:8.1f} | {name}",
+                file=file,
+            )
+
+    @property
+    def timings(self) -> List[Tuple[str, float, float]]:
+        """
+        Getter method for import timings, in completion order.
+
+        Returns:
+            module name, cumulative and self time in seconds
+        """
+        return list(self._timings)
+
+
+class _TimedLoader(importlib.abc.Loader):
+    """Loader executing modules through `ImportProfiler.timed`."""
+
+    def __init__(self, profiler: ImportProfiler, loader: Any) -> None:
+        """
+        Wrap the loader.
+
+        Parameters:
+            profiler (ImportProfiler): records import times
+            loader (Any): loader found by the other finders
+        """
+        self._profiler = profiler
+        self._loader = loader
+
+    def create_module(self, spec: Any) -> Optional[ModuleType]:
+        """
+        Create module with the wrapped loader.
+
+        Parameters:
+            spec (Any): module spec
+
+        Returns:
+            module, None for the default module creation
+        """
+        return cast(Optional[ModuleType], self._loader.create_module(spec))
+
+    def exec_module(self, module: ModuleType) -> None:
+        """
+        Execute module with the wrapped loader, timed.
+
+        Parameters:
+            module (ModuleType): module to execute
+        """
+        # Resources and source lookups are served by the wrapped loader
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        self._profiler.timed(
+            module.__name__, lambda: self._loader.exec_module(module)
+        )
@@ -0,0 +1,307 @@
+"""Load Generation."""
+import http.client
+import itertools
+import json
+import threading
+import time
+import uuid
+from typing import Any
+from typing import Counter
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import TextIO
+from typing import Tuple
+from urllib.parse import urlsplit
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LoadRequest(NamedTuple):
+    """
+    Request sent by the load generator.
+
+    Properties:
+        method (str): HTTP method
+        path (str): request path, `{id}` is replaced by a new student id
+        body (Optional[Any]): JSON request body, None for no body
+    """
+
+    method: str
+    path: str
+    body: Optional[Any] = None
+
+
+_PERSON = {
+    "first_name": "James",
+    "last_name": "Smith",
+    "dob": "1978-10-10",
+    "gender": "MALE",
+}
+
+# One request per registered student API operation
+STUDENT_REQUESTS = (
+    LoadRequest("GET", "/api/v1/students?limit=100"),
+    LoadRequest("POST", "/api/v1/students:batchGet", {"ids": ["{id}"]}),
+    LoadRequest("GET", "/api/v1/student/{id}"),
+    LoadRequest("POST", "/api/v1/student", _PERSON),
+    LoadRequest("PATCH", "/api/v1/student/{id}", _PERSON),
+    LoadRequest("DELETE", "/api/v1/student/{id}"),
+)
+
+
+class LoadReport:
+    """Outcome of a load run, throughput and latency percentiles."""
+
+    def __init__(
+        self, latencies: List[float], statuses: Counter[int], elapsed: float
+    ) -> None:
+        """
+        Summarise the run.
+
+        Parameters:
+            latencies (List[float]): seconds per completed request
+            statuses (Counter[int]): requests by HTTP status, 0 for connection
+                errors
+            elapsed (float): seconds the run took
+        """
+        self.latencies = sorted(latencies)
+        self.statuses = statuses
+        self.elapsed = elapsed
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get latency percentile, nearest rank.
+
+        Parameters:
+            percent (float): percentile, e.g. 99
+
+        Returns:
+            latency in seconds, 0 without requests
+        """
+        if not self.latencies:
+            return 0.0
+        rank = max(int(len(self.latencies) * percent / 100 + 0.5), 1)
+        return self.latencies[min(rank, len(self.latencies)) - 1]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get report as JSON compatible dictionary.
+
+        Returns:
+            requests, errors, throughput and latencies in milliseconds
+        """
+        count = len(self.latencies)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "statuses": {
+                str(status): requests
+                for status, requests in self.statuses.items()
+            },
+            "elapsed": self.elapsed,
+            "throughput": count / self.elapsed if self.elapsed else 0.0,
+            "latency_ms": {
+                "mean": sum(self.latencies) / count * 1000 if count else 0.0,
+                **{
+                    f"p{percent:g}": self.percentile(percent) * 1000
+                    for percent in PERCENTILES
+                },
+                "max": self.latencies[-1] * 1000 if count else 0.0,
+            },
+        }
+
+    def write(self, stream: TextIO) -> None:
+        """
+        Write report as text.
+
+        Parameters:
+            stream (TextIO): output stream, e.g. `sys.stdout`
+        """
+        report = self.as_dict()
+        stream.write(
+            f"Requests    {report['requests']} in {report['elapsed']:.2f}s, "
+            f"{report['errors']} errors\n"
+            f"Throughput  {report['throughput']:.1f} requests/s\n"
+            f"Statuses    "
+            + ", ".join(
+                f"{status}: {count}"
+                for status, count in sorted(self.statuses.items())
+            )
+            + "\nLatency ms  "
+            + "  ".join(
+                f"{name} {value:.2f}"
+                for name, value in report["latency_ms"].items()
+            )
+            + "\n"
+        )
+
+    @property
+    def errors(self) -> int:
+        """
+        Getter method for failed requests.
+
+        Returns:
+            requests with connection errors or status 400 and above
+        """
+        return sum(
+            count
+            for status, count in self.statuses.items()
+            if status == 0 or status >= 400
+        )
+
+
+# Load settings and the collected measurements are kept together
+class LoadGenerator:  # pylint: disable=too-many-instance-attributes
+    """
+    Drive an HTTP server with a request mix, closed-loop or at fixed rate.
+
+    Closed-loop, `concurrency` clients send their next request when the
+    previous one completes, throughput adapts to the server. At a fixed
+    `rate`, requests are scheduled every `1 / rate` seconds and sent by up
+    to `concurrency` clients, latency is measured from the scheduled time,
+    so time queued behind slow responses is included.
+    """
+
+    # Every load setting past the URL is a keyword with a default
+    def __init__(  # pylint: disable=R0913,R0917
+        self,
+        url: str,
+        requests: Sequence[LoadRequest] = STUDENT_REQUESTS,
+        concurrency: int = 10,
+        rate: float = 0.0,
+        duration: float = 10.0,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialise the generator.
+
+        Parameters:
+            url (str): server URL, e.g. `http://127.0.0.1:3000`
+            requests (Sequence[LoadRequest]): request mix, sent in turn
+            concurrency (int): clients with a keep-alive connection each
+            rate (float): requests per second, 0 for closed-loop
+            duration (float): seconds to send requests
+            timeout (float): seconds to wait for a response
+
+        Raises:
+            ValueError: if the URL is not an HTTP URL or nothing is sent
+        """
+        parts = urlsplit(url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+        if not requests or concurrency < 1:
+            raise ValueError("Requests and concurrency are required")
+        self._host = parts.hostname
+        self._port = parts.port or 80
+        self._prefix = parts.path.rstrip("/")
+        self._requests = requests
+        self._concurrency = concurrency
+        self._rate = rate
+        self._duration = duration
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._sequence: Iterator[int] = itertools.count()
+        self._start = 0.0
+        self._latencies: List[float] = []
+        self._statuses: Counter[int] = Counter()
+
+    def run(self) -> LoadReport:
+        """
+        Send requests until the duration is over.
+
+        Returns:
+            report of the run
+        """
+        self._sequence = itertools.count()
+        self._latencies = []
+        self._statuses = Counter()
+        self._start = time.perf_counter()
+        clients = [
+            threading.Thread(target=self._client, daemon=True)
+            for _ in range(self._concurrency)
+        ]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+
+        return LoadReport(
+            self._latencies,
+            self._statuses,
+            time.perf_counter() - self._start,
+        )
+
+    def _next(self) -> Optional[Tuple[LoadRequest, float]]:
+        """
+        Claim the next request of the mix.
+
+        Returns:
+            request and `time.perf_counter` when it is due, None when the
+            duration is over
+        """
+        with self._lock:
+            index = next(self._sequence)
+        if self._rate:
+            offset = index / self._rate
+        else:
+            offset = time.perf_counter() - self._start
+        if offset >= self._duration:
+            return None
+        request = self._requests[index % len(self._requests)]
+        return request, self._start + offset
+
+    def _client(self) -> None:
+        """Send requests on one keep-alive connection until done."""
+        connection = http.client.HTTPConnection(
+            self._host, self._port, timeout=self._timeout
+        )
+        try:
+            while True:
+                claimed = self._next()
+                if claimed is None:
+                    return
+                request, due = claimed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                status = self._send(connection, request)
+                latency = time.perf_counter() - due
+                with self._lock:
+                    self._latencies.append(latency)
+                    self._statuses[status] += 1
+        finally:
+            connection.close()
+
+    def _send(
+        self, connection: http.client.HTTPConnection, request: LoadRequest
+    ) -> int:
+        """
+        Send request and read the response.
+
+        Parameters:
+            connection (http.client.HTTPConnection): client connection
+            request (LoadRequest): request to send
+
+        Returns:
+            HTTP status, 0 for connection errors
+        """
+        student_id = str(uuid.uuid4())
+        path = self._prefix + request.path.replace("{id}", student_id)
+        body = None
+        headers: Dict[str, str] = {}
+        if request.body is not None:
+            body = json.dumps(request.body).replace("{id}", student_id)
+            headers["Content-Type"] = "application/json"
+        try:
+            connection.request(request.method, path, body, headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()  # Reconnects on the next request
+            return 0
+        return response.status
@@ -0,0 +1,391 @@
+"""Request Metrics."""
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Set
+from typing import Tuple
+
+# Upper bounds in seconds, from sub millisecond routing to slow upstreams
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Stages timed per request, `total` spans the whole dispatch
+STAGES = ("routing", "load", "dump", "upstream", "total")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Cumulative histogram of observed values, safe across threads."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialise empty buckets.
+
+        Parameters:
+            buckets (Sequence[float]): bucket upper bounds, `+Inf` is added
+        """
+        self._bounds = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Count value in its bucket.
+
+        Parameters:
+            value (float): observed value, e.g. seconds
+        """
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Tuple[List[Tuple[float, int]], float, int]:
+        """
+        Get cumulative bucket counts.
+
+        Returns:
+            (upper bound, count) per bucket ending with `inf`, sum and count
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative: List[Tuple[float, int]] = []
+        count = 0
+        for bound, bucket in zip(self._bounds + (float("inf"),), counts):
+            count += bucket
+            cumulative.append((bound, count))
+        return cumulative, total, count
+
+
+class RequestTimings:
+    """Seconds spent per stage by the request being dispatched."""
+
+    __slots__ = ("operation", "start", "seconds", "_active")
+
+    def __init__(self, operation: str, start: float) -> None:
+        """
+        Start timing a request.
+
+        Parameters:
+            operation (str): OpenAPI operationId of the matched route
+            start (float): `time.perf_counter` when the request started
+        """
+        self.operation = operation
+        self.start = start
+        self.seconds: Dict[str, float] = {}
+        self._active: Set[str] = set()
+
+    def add(self, stage: str, seconds: float) -> None:
+        """
+        Add time spent in a stage, stages may run more than once.
+
+        Parameters:
+            stage (str): stage name
+            seconds (float): elapsed seconds
+        """
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """
+        Time the block, nested blocks of the same stage count once.
+
+        Parameters:
+            stage (str): stage name
+
+        Yields:
+            None
+        """
+        if stage in self._active:
+            yield
+            return
+
+        self._active.add(stage)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._active.discard(stage)
+            self.add(stage, time.perf_counter() - start)
+
+
+# Timings of the request dispatched by the current thread or task
+_timings: contextvars.ContextVar[Optional[RequestTimings]] = (
+    contextvars.ContextVar("viper_boot_request_timings", default=None)
+)
+
+
+class Metrics:
+    """
+    Request latency histograms per operation and stage.
+
+    The dispatcher times every routed request with `request`, code it
+    calls times its stages with `stage`, e.g. schema load and dump or
+    upstream calls. Stage times of a request are summed and observed once
+    when the request completes. `render` writes the histograms and the
+    registered collectors in Prometheus text exposition format.
+
+    Metrics are kept per process, pre-forked workers are scraped one at a
+    time.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialise the registry.
+
+        Parameters:
+            buckets (Sequence[float]): histogram bucket upper bounds
+        """
+        self._enabled = True
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._collectors: Dict[
+            str, Tuple[Callable[[], Mapping[str, float]], Tuple[str, ...]]
+        ] = {}
+
+    def configure(self, settings: Optional[Mapping[str, Any]]) -> None:
+        """
+        Apply metrics settings, histograms restart when buckets change.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.metrics]` settings
+                block, `enabled` and `buckets`
+        """
+        settings = settings or {}
+        buckets = tuple(settings.get("buckets") or DEFAULT_BUCKETS)
+        with self._lock:
+            self._enabled = bool(settings.get("enabled", True))
+            if buckets != self._buckets:
+                self._buckets = buckets
+                self._histograms = {}
+
+    @contextmanager
+    def request(
+        self, operation: str, start: Optional[float] = None
+    ) -> Iterator[Optional[RequestTimings]]:
+        """
+        Time a request of an operation and observe its stages at the end.
+
+        Parameters:
+            operation (str): OpenAPI operationId of the matched route
+            start (Optional[float]): `time.perf_counter` when the request
+                was received, defaults to now
+
+        Yields:
+            timings of the request, None when metrics are disabled
+        """
+        if not self._enabled:
+            yield None
+            return
+
+        timings = RequestTimings(operation, start or time.perf_counter())
+        token = _timings.set(timings)
+        try:
+            yield timings
+        finally:
+            _timings.reset(token)
+            timings.add("total", time.perf_counter() - timings.start)
+            for stage, seconds in timings.seconds.items():
+                self.observe(operation, stage, seconds)
+
+    @staticmethod
+    def stage(stage: str) -> Any:
+        """
+        Time a stage of the current request, no-op outside requests.
+
+        Parameters:
+            stage (str): stage name, e.g. `load`, `dump` or `upstream`
+
+        Returns:
+            context manager timing the block
+        """
+        timings = _timings.get()
+        if timings is None:
+            return _NO_TIMING
+        return timings.stage(stage)
+
+    def observe(self, operation: str, stage: str, seconds: float) -> None:
+        """
+        Observe stage duration of an operation.
+
+        Parameters:
+            operation (str): OpenAPI operationId
+            stage (str): stage name
+            seconds (float): elapsed seconds
+        """
+        key = (operation, stage)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(
+                    key, Histogram(self._buckets)
+                )
+        histogram.observe(seconds)
+
+    def add_collector(
+        self,
+        name: str,
+        collect: Callable[[], Mapping[str, float]],
+        counters: Iterable[str] = (),
+    ) -> None:
+        """
+        Render values collected on every scrape, e.g. cache statistics.
+
+        Parameters:
+            name (str): metric name prefix, e.g. `viper_boot_cache`
+            collect (Callable[[], Mapping[str, float]]): returns values by
+                name
+            counters (Iterable[str]): names of monotonic counters, rendered
+                with a `_total` suffix, other values are gauges
+        """
+        self._collectors[name] = (collect, tuple(counters))
+
+    def histogram(self, operation: str, stage: str) -> Optional[Histogram]:
+        """
+        Get histogram of an operation stage.
+
+        Parameters:
+            operation (str): OpenAPI operationId
+            stage (str): stage name
+
+        Returns:
+            histogram, None if nothing was observed
+        """
+        return self._histograms.get((operation, stage))
+
+    def render(self) -> str:
+        """
+        Write metrics in Prometheus text exposition format.
+
+        Returns:
+            exposition text
+        """
+        name = "viper_boot_request_duration_seconds"
+        lines = [
+            f"# HELP {name} Request time by operation and stage.",
+            f"# TYPE {name} histogram",
+        ]
+        for (operation, stage), histogram in sorted(
+            self._histograms.items()
+        ):
+            labels = f'operation="{_escape(operation)}",stage="{stage}"'
+            buckets, total, count = histogram.snapshot()
+            for bound, cumulative in buckets:
+                lines.append(
+                    f'{name}_bucket{{{labels},le="{_format(bound)}"}} '
+                    f"{cumulative}"
+                )
+            lines.append(f"{name}_sum{{{labels}}} {total!r}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+
+        lines.extend(self._render_collectors())
+        return "\n".join(lines) + "\n"
+
+    def _render_collectors(self) -> List[str]:
+        """
+        Write values of the added collectors, counters and gauges.
+
+        Returns:
+            exposition lines
+        """
+        lines: List[str] = []
+        for prefix, (collect, counters) in sorted(self._collectors.items()):
+            for key, value in sorted(collect().items()):
+                if key in counters:
+                    metric, kind = f"{prefix}_{key}_total", "counter"
+                else:
+                    metric, kind = f"{prefix}_{key}", "gauge"
+                lines.append(f"# TYPE {metric} {kind}")
+                lines.append(f"{metric} {value}")
+        return lines
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Getter method for enabled flag.
+
+        Returns:
+            True when requests are timed
+        """
+        return self._enabled
+
+
+class _NoTiming:
+    """Context manager doing nothing, for stages outside requests."""
+
+    def __enter__(self) -> None:
+        """Enter the block."""
+
+    def __exit__(self, *_args: Any) -> None:
+        """
+        Exit the block.
+
+        Parameters:
+            *_args (Any): exception type, value and traceback
+        """  # noqa: RST210
+
+
+_NO_TIMING = _NoTiming()
+
+
+def _format(bound: float) -> str:
+    """
+    Format bucket bound as Prometheus `le` label value.
+
+    Parameters:
+        bound (float): upper bound
+
+    Returns:
+        label value, `+Inf` for the last bucket
+    """
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+
+def _escape(value: str) -> str:
+    """
+    Escape label value.
+
+    Parameters:
+        value (str): label value
+
+    Returns:
+        escaped label value
+    """
+    return (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+# Registry of this process, configured from the `[*.metrics]` settings
+METRICS = Metrics()
@@ -0,0 +1,295 @@
+"""Request and Process Profiling."""
+import collections
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import signal
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from types import FrameType
+from typing import Any
+from typing import Callable
+from typing import Counter
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+# Header and query parameter asking to profile a request
+HEADER = "x-profile"
+QUERY = "profile"
+
+
+class Profiler:
+    """
+    Opt-in profiling of single requests and of the whole process.
+
+    Requests with the `X-Profile` header or the `profile` query parameter
+    run under `cProfile` when `request` is enabled by the settings, and
+    the value matches `token` if one is set. `install_signal` starts a
+    `SamplingProfiler` of the process on `SIGUSR2`.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the profiler, disabled until configured."""
+        self._request = False
+        self._token = ""
+        self._limit = 50
+        self._duration = 30.0
+        self._interval = 0.005
+        self._output = Path("profiles")
+        self._sampler: Optional[SamplingProfiler] = None
+
+    def configure(self, settings: Optional[Mapping[str, Any]]) -> None:
+        """
+        Apply profiling settings.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.profiling]` settings
+                block, `request`, `token`, `limit`, `duration`, `interval`
+                and `output`
+        """
+        settings = settings or {}
+        self._request = bool(settings.get("request", False))
+        self._token = str(settings.get("token", ""))
+        self._limit = int(settings.get("limit", 50))
+        self._duration = float(settings.get("duration", 30.0))
+        self._interval = float(settings.get("interval", 0.005))
+        self._output = Path(settings.get("output", "profiles"))
+
+    def requested(
+        self, target: str, headers: Optional[Mapping[str, str]]
+    ) -> bool:
+        """
+        Check whether the request asks to be profiled and may be.
+
+        Parameters:
+            target (str): request target, path with optional query string
+            headers (Optional[Mapping[str, str]]): request headers, lower
+                case names
+
+        Returns:
+            True when the request is profiled
+        """
+        if not self._request:
+            return False
+
+        value = (headers or {}).get(HEADER)
+        if value is None:
+            query = urlsplit(target).query
+            if QUERY not in query:
+                return False
+            values = parse_qs(query, keep_blank_values=True).get(QUERY)
+            if not values:
+                return False
+            value = values[-1]
+
+        if not self._token:
+            return True
+        return hmac.compare_digest(value.encode(), self._token.encode())
+
+    def profile(self, call: Callable[[], Any]) -> Tuple[Any, str]:
+        """
+        Run call under `cProfile`.
+
+        Parameters:
+            call (Callable[[], Any]): work to profile, e.g. a request
+
+        Returns:
+            result of the call and statistics by cumulative time
+        """
+        profile = cProfile.Profile()
+        result = profile.runcall(call)
+        stream = io.StringIO()
+        stats = pstats.Stats(profile, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self._limit)
+        return result, stream.getvalue()
+
+    def install_signal(self, signum: int = signal.SIGUSR2) -> bool:
+        """
+        Start a sampling profile of the process on a signal.
+
+        Parameters:
+            signum (int): signal number
+
+        Returns:
+            True when installed, signals are handled by the main thread
+        """
+        try:
+            signal.signal(signum, self._handle_signal)
+        except ValueError:
+            return False  # Not the main thread
+        return True
+
+    def sample(self) -> "SamplingProfiler":
+        """
+        Start a sampling profile unless one is running.
+
+        Returns:
+            running sampling profiler
+        """
+        sampler = self._sampler
+        if sampler is None or not sampler.running:
+            sampler = self._sampler = SamplingProfiler(
+                self._duration, self._interval, self._output
+            )
+            sampler.start()
+        return sampler
+
+    def _handle_signal(self, *_args: Any) -> None:
+        """
+        Start sampling, the signal handler only starts a thread.
+
+        Parameters:
+            *_args (Any): signal number and frame
+        """  # noqa: RST210
+        self.sample()
+
+
+class SamplingProfiler:
+    """
+    Statistical profile of all threads of the process.
+
+    A daemon thread samples the stack of every other thread each
+    `interval` seconds for `duration` seconds, then writes the counts as
+    collapsed stacks, one `thread;outer;...;inner count` line per stack,
+    the input of `flamegraph.pl` and speedscope.
+    """
+
+    def __init__(
+        self, duration: float, interval: float, output: Path
+    ) -> None:
+        """
+        Initialise the profiler.
+
+        Parameters:
+            duration (float): seconds to sample
+            interval (float): seconds between samples
+            output (Path): directory of the collapsed stacks files
+        """
+        self._duration = duration
+        self._interval = interval
+        self._output = output
+        self._stacks: Counter[str] = collections.Counter()
+        self._thread: Optional[threading.Thread] = None
+        self._path: Optional[Path] = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> Optional[Path]:
+        """
+        Wait for the profile to be written.
+
+        Parameters:
+            timeout (Optional[float]): seconds to wait, None to wait until
+                it is written
+
+        Returns:
+            collapsed stacks file, None if not written yet
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self._path
+
+    def sample(self) -> None:
+        """Count the current stack of every other thread."""
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        current = threading.get_ident()
+        for ident, frame in sys._current_frames().items():  # noqa # pylint: disable=protected-access
+            if ident == current:
+                continue
+            stack = _collapse(frame)
+            self._stacks[f"{names.get(ident, ident)};{stack}"] += 1
+
+    def write(self) -> Path:
+        """
+        Write collapsed stacks file.
+
+        Returns:
+            file path, named after the process id and start time
+        """
+        self._output.mkdir(parents=True, exist_ok=True)
+        path = self._output / (
+            f"profile-{os.getpid()}-{time.strftime('%Y%m%d%H%M%S')}.collapsed"
+        )
+        path.write_text(
+            "".join(
+                f"{stack} {count}\n"
+                for stack, count in self._stacks.most_common()
+            ),
+            encoding="utf-8",
+        )
+        return path
+
+    @property
+    def running(self) -> bool:
+        """
+        Getter method for running flag.
+
+        Returns:
+            True while sampling or writing
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def stacks(self) -> Counter[str]:
+        """
+        Getter method for sampled stacks.
+
+        Returns:
+            samples by collapsed stack
+        """
+        return self._stacks
+
+    def _run(self) -> None:
+        """Sample until the duration is over, then write the profile."""
+        print(
+            f"Sampling profile of process {os.getpid()} for "
+            f"{self._duration:g} seconds"
+        )
+        deadline = time.monotonic() + self._duration
+        try:
+            while time.monotonic() < deadline:
+                self.sample()
+                time.sleep(self._interval)
+            self._path = self.write()
+        except Exception:  # pylint: disable=broad-except
+            # Profiling must never take the worker down
+            traceback.print_exc()
+            return
+        print(f"Sampling profile written to {self._path}")
+
+
+def _collapse(frame: Optional[FrameType]) -> str:
+    """
+    Collapse stack to `outer;...;inner` frames.
+
+    Parameters:
+        frame (Optional[FrameType]): innermost frame
+
+    Returns:
+        frames as `function (file:line)`, outermost first
+    """
+    frames: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        name = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+        frames.append(name.replace(";", ":"))
+        frame = frame.f_back
+    return ";".join(reversed(frames))
+
+
+# Profiler of this process, configured from the `[*.profiling]` settings
+PROFILER = Profiler()
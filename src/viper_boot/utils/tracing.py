@@ -0,0 +1,423 @@
+"""Request Tracing."""
+import contextvars
+import json
+import os
+import random
+import re
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+# W3C Trace Context `traceparent` header, version 00
+_TRACEPARENT = re.compile(
+    r"^00-(?P<trace>[0-9a-f]{32})"
+    r"-(?P<parent>[0-9a-f]{16})"
+    r"-(?P<flags>[0-9a-f]{2})$"
+)
+_INVALID_TRACE = "0" * 32
+_INVALID_SPAN = "0" * 16
+
+
+# Trace context, timing and attributes make up the span
+class Span:  # pylint: disable=too-many-instance-attributes
+    """
+    Timed operation of a trace.
+
+    Properties:
+        name (str): operation name, e.g. `StudentService.get`
+        trace_id (str): 32 hex digits shared by the spans of a request
+        span_id (str): 16 hex digits
+        parent_id (Optional[str]): span id of the parent, None for roots
+        attributes (Dict[str, Any]): span attributes, e.g. the URL
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "error",
+        "_trace",
+        "_start",
+        "_start_ns",
+    )
+
+    def __init__(
+        self,
+        trace: "_Trace",
+        name: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ) -> None:
+        """
+        Start the span.
+
+        Parameters:
+            trace (_Trace): trace collecting the span
+            name (str): operation name
+            parent_id (Optional[str]): span id of the parent
+            attributes (Dict[str, Any]): span attributes
+        """
+        self.name = name
+        self.trace_id = trace.trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self._trace = trace
+        self._start_ns = time.time_ns()
+        self._start = time.perf_counter()
+
+    def end(self) -> None:
+        """End the span and add it to its trace."""
+        duration = time.perf_counter() - self._start
+        self._trace.spans.append(
+            {
+                "trace_id": self.trace_id,
+                "span_id": self.span_id,
+                "parent_id": self.parent_id,
+                "name": self.name,
+                "start_ns": self._start_ns,
+                "duration_ms": round(duration * 1000, 3),
+                "attributes": self.attributes,
+                "error": self.error,
+                "pid": os.getpid(),
+            }
+        )
+
+    @property
+    def traceparent(self) -> str:
+        """
+        Getter method for `traceparent` header of requests made in the span.
+
+        Returns:
+            W3C Trace Context header value
+        """
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+
+class _Trace:
+    """Spans of a sampled request, exported when its root span ends."""
+
+    __slots__ = ("trace_id", "spans")
+
+    def __init__(self, trace_id: str) -> None:
+        """
+        Initialise the trace.
+
+        Parameters:
+            trace_id (str): 32 hex digits
+        """
+        self.trace_id = trace_id
+        self.spans: List[Dict[str, Any]] = []
+
+
+# Span of the current thread or task, None outside sampled requests
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "viper_boot_span", default=None
+)
+
+
+class Tracer:
+    """
+    Trace requests with spans of the code they run.
+
+    The dispatcher starts a trace per sampled request with `trace`, code it
+    calls opens child spans with `span`, e.g. the controllers, services
+    and schemas. Outside sampled requests spans are not created, so the
+    cost is a context variable lookup. A request continues the trace of
+    its `traceparent` header, upstream calls send the current span as
+    theirs. Spans are exported together when the request ends.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the tracer, disabled until configured."""
+        self._exporter: Optional[Any] = None
+        self._sample_rate = 1.0
+
+    def configure(self, settings: Optional[Mapping[str, Any]]) -> None:
+        """
+        Apply tracing settings.
+
+        Parameters:
+            settings (Optional[Mapping[str, Any]]): `[*.tracing]` settings
+                block, `exporter`, `path`, `address` and `sample_rate`
+
+        Raises:
+            ValueError: if the exporter is unknown
+        """
+        settings = settings or {}
+        exporter = settings.get("exporter", "none")
+        previous = self._exporter
+        if exporter == "none":
+            self._exporter = None
+        elif exporter == "file":
+            self._exporter = FileExporter(
+                Path(settings.get("path", "traces.jsonl"))
+            )
+        elif exporter == "udp":
+            host, _, port = settings.get(
+                "address", "127.0.0.1:6831"
+            ).rpartition(":")
+            self._exporter = UdpExporter(host, int(port))
+        else:
+            raise ValueError(f"Unknown tracing exporter: {exporter}")
+        self._sample_rate = float(settings.get("sample_rate", 1.0))
+        if previous is not None:
+            previous.close()
+
+    @contextmanager
+    def trace(
+        self, name: str, traceparent: str = "", **attributes: Any
+    ) -> Iterator[Optional[Span]]:
+        """
+        Start the root span of a request, sampled or not.
+
+        Parameters:
+            name (str): operation name, e.g. the OpenAPI operationId
+            traceparent (str): `traceparent` request header, continues the
+                trace of the caller
+            **attributes (Any): span attributes
+
+        Yields:
+            root span, None when not traced
+        """  # noqa: RST210
+        exporter = self._exporter
+        parent = _parse_traceparent(traceparent) if exporter else None
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = "", None
+            sampled = random.random() < self._sample_rate
+        if exporter is None or not sampled:
+            yield None
+            return
+
+        trace = _Trace(trace_id or f"{random.getrandbits(128):032x}")
+        try:
+            with self._span(trace, name, parent_id, attributes) as span:
+                yield span
+        finally:
+            exporter.export(trace.spans)
+
+    def span(self, name: str, **attributes: Any) -> Any:
+        """
+        Open child span of the current span, no-op outside traces.
+
+        Parameters:
+            name (str): operation name
+            **attributes (Any): span attributes
+
+        Returns:
+            context manager yielding the span, or None outside traces
+        """  # noqa: RST210
+        parent = _current.get()
+        if parent is None:
+            return _NO_SPAN
+        return self._span(
+            parent._trace,  # pylint: disable=protected-access
+            name,
+            parent.span_id,
+            attributes,
+        )
+
+    @staticmethod
+    @contextmanager
+    def _span(
+        trace: _Trace,
+        name: str,
+        parent_id: Optional[str],
+        attributes: Dict[str, Any],
+    ) -> Iterator[Span]:
+        """
+        Make span current while the block runs.
+
+        Parameters:
+            trace (_Trace): trace collecting the span
+            name (str): operation name
+            parent_id (Optional[str]): span id of the parent
+            attributes (Dict[str, Any]): span attributes
+
+        Yields:
+            the span
+        """
+        span = Span(trace, name, parent_id, attributes)
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.error = type(error).__name__
+            raise
+        finally:
+            _current.reset(token)
+            span.end()
+
+    @property
+    def current(self) -> Optional[Span]:
+        """
+        Getter method for current span.
+
+        Returns:
+            span of the current thread or task, None outside traces
+        """
+        return _current.get()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Getter method for enabled flag.
+
+        Returns:
+            True when an exporter is configured
+        """
+        return self._exporter is not None
+
+
+class FileExporter:
+    """
+    Append spans to a file, one JSON object per line.
+
+    The file is opened per process, the spans of a trace are written with
+    one call, so lines of pre-forked workers do not interleave.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialise the exporter.
+
+        Parameters:
+            path (Path): JSON lines file
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._pid = 0
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        """
+        Write spans of a trace.
+
+        Parameters:
+            spans (List[Dict[str, Any]]): ended spans
+        """
+        data = "".join(
+            json.dumps(span, default=str) + "\n" for span in spans
+        ).encode("utf-8")
+        with self._lock:
+            if self._fd is None or self._pid != os.getpid():
+                self._fd = os.open(
+                    self._path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+                )
+                self._pid = os.getpid()
+            os.write(self._fd, data)
+
+    def close(self) -> None:
+        """Close the file of this process."""
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = None
+
+
+class UdpExporter:
+    """
+    Send spans to a UDP collector, one JSON object per datagram.
+
+    Datagrams are dropped when no collector listens, so requests never
+    wait for it.
+    """
+
+    def __init__(self, host: str, port: int) -> None:
+        """
+        Initialise the exporter.
+
+        Parameters:
+            host (str): collector host
+            port (int): collector port
+        """
+        self._address = (host, port)
+        self._lock = threading.Lock()
+        self._socket: Optional[socket.socket] = None
+        self._pid = 0
+
+    def export(self, spans: List[Dict[str, Any]]) -> None:
+        """
+        Send spans of a trace.
+
+        Parameters:
+            spans (List[Dict[str, Any]]): ended spans
+        """
+        with self._lock:
+            if self._socket is None or self._pid != os.getpid():
+                self._socket = socket.socket(
+                    socket.AF_INET, socket.SOCK_DGRAM
+                )
+                self._socket.setblocking(False)
+                self._pid = os.getpid()
+            for span in spans:
+                try:
+                    self._socket.sendto(
+                        json.dumps(span, default=str).encode("utf-8"),
+                        self._address,
+                    )
+                except OSError:
+                    pass  # Collector is down or the buffer is full
+
+    def close(self) -> None:
+        """Close the socket of this process."""
+        with self._lock:
+            if self._socket is not None and self._pid == os.getpid():
+                self._socket.close()
+            self._socket = None
+
+
+class _NoSpan:
+    """Context manager doing nothing, for spans outside traces."""
+
+    def __enter__(self) -> None:
+        """Enter the block."""
+
+    def __exit__(self, *_args: Any) -> None:
+        """
+        Exit the block.
+
+        Parameters:
+            *_args (Any): exception type, value and traceback
+        """  # noqa: RST210
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _parse_traceparent(value: str) -> Optional[Tuple[str, str, bool]]:
+    """
+    Parse `traceparent` header.
+
+    Parameters:
+        value (str): header value
+
+    Returns:
+        trace id, parent span id and sampled flag, None if invalid
+    """
+    match = _TRACEPARENT.match(value.strip().lower()) if value else None
+    if (
+        match is None
+        or match["trace"] == _INVALID_TRACE
+        or match["parent"] == _INVALID_SPAN
+    ):
+        return None
+    return match["trace"], match["parent"], bool(int(match["flags"], 16) & 1)
+
+
+# Tracer of this process, configured from the `[*.tracing]` settings
+TRACER = Tracer()
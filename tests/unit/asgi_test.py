@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from src.viper_boot.server.asgi import AsgiApplication
+from src.viper_boot.server.dispatcher import Dispatcher
+from src.viper_boot.server.dispatcher import Response
+from src.viper_boot.server.router import Route
+from src.viper_boot.server.router import Router
+
+
+@pytest.fixture
+def app():
+    router = Router()
+    router.add(
+        Route("POST", "/api/v1/student", lambda request: request, 201, True)
+    )
+    router.add(
+        Route("GET", "/api/v1/student/{id}", lambda _id: {"id": _id}, 200, False)  # noqa
+    )
+    router.add(
+        Route("GET", "/api/v1/students", lambda: Response.json_stream(200, [{"id": 1}, {"id": 2}], batch_size=1), 200, False)  # noqa
+    )
+
+    def fallback(method, path, headers):
+        return Response(200, headers.get("if-none-match", "").encode(), "text/plain")  # noqa
+
+    _app = AsgiApplication(Dispatcher(router, fallback=fallback), max_workers=1)  # noqa
+    yield _app
+    _app.close()
+
+
+def _call(app, scope, events):
+    sent = []
+
+    async def receive():
+        return events.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+@pytest.mark.parametrize(
+    argnames="method, path, events, status, body",
+    argvalues=[
+        ("POST", "/api/v1/student", [{"type": "http.request", "body": b'{"a": ', "more_body": True}, {"type": "http.request", "body": b"1}"}], 201, b'{"a":1}'),  # noqa
+        ("GET", "/api/v1/student/abc", [{"type": "http.request"}], 200, b'{"id":"abc"}'),  # noqa
+    ],
+    ids=[
+        "it should read chunked request body and respond.",
+        "it should pass path parameters and respond.",
+    ]
+)
+def test_http(app, method, path, events, status, body):
+    # Arrange
+    scope = {"type": "http", "method": method, "path": path}
+
+    # Act
+    sent = _call(app, scope, events)
+
+    # Assert
+    assert sent[0]["type"] == "http.response.start"
+    assert sent[0]["status"] == status
+    assert (b"content-type", b"application/json") in sent[0]["headers"]
+    assert sent[1] == {"type": "http.response.body", "body": body}
+
+
+def test_http_headers(app):
+    # Arrange
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"if-none-match", b'"a"'), (b"If-None-Match", b'"b"')],
+    }
+
+    # Act
+    sent = _call(app, scope, [{"type": "http.request"}])
+
+    # Assert
+    assert sent[1]["body"] == b'"a", "b"'
+
+
+def test_lifespan(app):
+    # Arrange
+    events = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+
+    # Act
+    sent = _call(app, {"type": "lifespan"}, events)
+
+    # Assert
+    assert [message["type"] for message in sent] == [
+        "lifespan.startup.complete",
+        "lifespan.shutdown.complete",
+    ]
+
+
+def test_http_stream(app):
+    # Arrange
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/students"}
+
+    # Act
+    sent = _call(app, scope, [{"type": "http.request"}])
+
+    # Assert
+    assert not any(name == b"content-length" for name, _ in sent[0]["headers"])  # noqa
+    assert [message["body"] for message in sent[1:]] == [
+        b'[{"id":1}', b',{"id":2}', b"]", b""
+    ]
+    assert [message.get("more_body") for message in sent[1:]] == [
+        True, True, True, None
+    ]
+
+
+@pytest.mark.parametrize(
+    "extensions, expected",
+    [
+        ({"http.response.zerocopysend": {}}, ["http.response.zerocopysend"]),
+        ({}, ["http.response.body", "http.response.body"]),
+    ],
+    ids=[
+        "it should send files with zero-copy when supported.",
+        "it should send file content without zero-copy support.",
+    ]
+)
+def test_http_file(tmp_path, extensions, expected):
+    # Arrange
+    path = tmp_path / "app.js"
+    path.write_bytes(b"console.log(1);")
+    dispatcher = Dispatcher(Router(), fallback=lambda *_: Response(200, content_type="text/javascript", file=path))  # noqa
+    app = AsgiApplication(dispatcher, max_workers=1)
+    scope = {"type": "http", "method": "GET", "path": "/app.js", "extensions": extensions}  # noqa
+
+    # Act
+    sent = _call(app, scope, [{"type": "http.request"}])
+    app.close()
+
+    # Assert
+    assert (b"content-length", b"15") in sent[0]["headers"]
+    assert [message["type"] for message in sent[1:]] == expected
+    if not extensions:
+        assert sent[1]["body"] == b"console.log(1);"
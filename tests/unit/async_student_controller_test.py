@@ -0,0 +1,141 @@
+import asyncio
+import uuid
+
+import pytest
+
+from src.viper_boot.controllers.async_student_controller import (
+    AsyncStudentController
+)
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [AsyncStudentController],
+    ids=[
+        "it should return list of schema.",
+    ]
+)
+def test_schema(cls):
+    # Arrange
+    obj = cls()
+
+    # Act, Assert
+    assert obj.schemas is not None
+
+
+def test_get(get_response, mocker):
+    # Arrange
+    _id = uuid.uuid4().hex
+    spy = mocker.patch(
+        "src.viper_boot.services.AsyncStudentService.get",
+        return_value=get_response
+    )
+
+    # Act
+    response = asyncio.run(AsyncStudentController.get(_id))
+
+    # Assert
+    spy.assert_awaited_once_with(_id)
+    assert response["id"] != ""
+    assert response["student"]["dob"] == "1978-10-10"
+
+
+def test_get_all(get_all_response, mocker):
+    # Arrange
+    spy = mocker.patch(
+        "src.viper_boot.services.AsyncStudentService.get_all",
+        return_value=get_all_response
+    )
+
+    # Act
+    response = asyncio.run(AsyncStudentController.get_all())
+
+    # Assert
+    spy.assert_awaited_once_with()
+    assert len(response) == 2
+
+
+def test_get_page(get_all_response, mocker):
+    # Arrange
+    spy = mocker.patch(
+        "src.viper_boot.services.AsyncStudentService.get_page",
+        return_value=(get_all_response, "next")
+    )
+
+    # Act
+    response, cursor = asyncio.run(AsyncStudentController.get_page("c", 2))
+
+    # Assert
+    spy.assert_awaited_once_with("c", 2)
+    assert cursor == "next"
+    assert response[1]["student"]["dob"] == "1978-10-10"
+
+
+def test_iter_all(get_all_response, mocker):
+    # Arrange
+    async def students(_page_size):
+        for student in get_all_response:
+            yield student
+
+    async def collect():
+        return [
+            student async for student in AsyncStudentController.iter_all(10)
+        ]
+
+    mocker.patch(
+        "src.viper_boot.services.AsyncStudentService.iter_all", students
+    )
+
+    # Act
+    response = asyncio.run(collect())
+
+    # Assert
+    assert len(response) == 2
+    assert response[0]["student"]["dob"] == "1978-10-10"
+
+
+def test_post(post_request, mocker):
+    # Arrange
+    spy = mocker.patch(
+        "src.viper_boot.services.AsyncStudentService.post",
+        return_value={"id": uuid.uuid4().hex}
+    )
+
+    # Act
+    response = asyncio.run(AsyncStudentController.post(post_request))
+
+    # Assert
+    spy.assert_awaited()
+    assert response["id"] != ""
+
+
+def test_patch(patch_request, get_response, mocker):
+    # Arrange
+    _id = uuid.uuid4().hex
+    spy = mocker.patch(
+        "src.viper_boot.services.AsyncStudentService.patch",
+        return_value=get_response
+    )
+
+    # Act
+    response = asyncio.run(AsyncStudentController.patch(_id, patch_request))
+
+    # Assert
+    spy.assert_awaited_once_with(_id, patch_request)
+    assert response["student"]["first_name"] == "James"
+
+
+def test_delete(mocker):
+    # Arrange
+    _id = uuid.uuid4().hex
+    spy = mocker.patch(
+        "src.viper_boot.services.AsyncStudentService.delete",
+        return_value={}
+    )
+
+    # Act
+    response = asyncio.run(AsyncStudentController.delete(_id))
+
+    # Assert
+    spy.assert_awaited_once_with(_id)
+    assert response == {}
@@ -0,0 +1,163 @@
+import asyncio
+import uuid
+
+import httpx
+import pytest
+
+from src.viper_boot.config.config import Config
+from src.viper_boot.services.async_student_service import (
+    AsyncStudentService
+)
+from src.viper_boot.services.base_student_service import CACHE
+
+# Set application config environment
+Config().environment = "development"
+SETTINGS = Config().get
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    CACHE.clear()
+
+
+@pytest.fixture
+def mock_get(mocker):
+    request = httpx.Request("GET", SETTINGS["API"]["url"])
+    return mocker.patch(
+        "httpx.AsyncClient.get",
+        return_value=httpx.Response(200, text="Success", request=request)
+    )
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("get", (uuid.uuid4().hex,)),
+        ("get_all", ()),
+        ("post", ({"first_name": "James"},)),
+        ("delete", (uuid.uuid4().hex,)),
+    ],
+    ids=[
+        "it should get student without blocking.",
+        "it should get all students without blocking.",
+        "it should create student without blocking.",
+        "it should delete student without blocking.",
+    ]
+)
+def test_methods(method, args, mock_get):
+    # Arrange, Act
+    response = asyncio.run(getattr(AsyncStudentService, method)(*args))
+
+    # Assert
+    mock_get.assert_awaited_once_with(SETTINGS["API"]["url"])
+    assert response is not None
+
+
+def test_patch(patch_request, mock_get):
+    # Arrange
+    _id = uuid.uuid4().hex
+
+    # Act
+    response = asyncio.run(AsyncStudentService.patch(_id, patch_request))
+
+    # Assert
+    mock_get.assert_awaited_once_with(SETTINGS["API"]["url"])
+    assert response["id"] == _id
+    assert response["student"]["first_name"] != ""
+
+
+def test_upstream_error(mocker):
+    # Arrange
+    request = httpx.Request("GET", SETTINGS["API"]["url"])
+    mocker.patch(
+        "httpx.AsyncClient.get",
+        return_value=httpx.Response(404, request=request)
+    )
+
+    # Act, Assert
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(AsyncStudentService.get(uuid.uuid4().hex))
+
+
+def test_get_cached(mock_get):
+    # Arrange
+    _id = uuid.uuid4().hex
+
+    async def get_twice():
+        return (
+            await AsyncStudentService.get(_id),
+            await AsyncStudentService.get(_id),
+        )
+
+    # Act
+    first, second = asyncio.run(get_twice())
+
+    # Assert
+    mock_get.assert_awaited_once()
+    assert first == second
+
+
+def test_get_coalesced(mocker):
+    # Arrange
+    request = httpx.Request("GET", SETTINGS["API"]["url"])
+
+    async def slow_get(*_args, **_kwargs):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, request=request)
+
+    mock_get = mocker.patch("httpx.AsyncClient.get", side_effect=slow_get)
+
+    async def gather():
+        return await asyncio.gather(
+            *(AsyncStudentService.get("abc") for _ in range(10))
+        )
+
+    # Act
+    results = asyncio.run(gather())
+
+    # Assert
+    assert mock_get.call_count == 1
+    assert all(result == results[0] for result in results)
+
+
+def test_get_many(mock_get):
+    # Arrange
+    ids = [uuid.uuid4().hex, uuid.uuid4().hex]
+
+    # Act
+    response = asyncio.run(AsyncStudentService.get_many(ids + ids))
+
+    # Assert
+    mock_get.assert_awaited_once()
+    assert [student["id"] for student in response] == ids
+
+
+def test_get_page(mock_get):
+    # Arrange, Act
+    first, cursor = asyncio.run(AsyncStudentService.get_page(limit=1))
+    second, last_cursor = asyncio.run(
+        AsyncStudentService.get_page(cursor, limit=1)
+    )
+
+    # Assert
+    mock_get.assert_awaited_with(
+        SETTINGS["API"]["url"], params={"offset": 1, "limit": 2}
+    )
+    assert first[0]["student"]["first_name"] == "James"
+    assert second[0]["student"]["first_name"] == "Sarah"
+    assert last_cursor is None
+
+
+def test_iter_all(mock_get):
+    # Arrange
+    async def collect():
+        return [
+            student async for student in AsyncStudentService.iter_all(1)
+        ]
+
+    # Act
+    students = asyncio.run(collect())
+
+    # Assert
+    assert len(students) == 2
+    assert mock_get.await_count == 2
@@ -0,0 +1,212 @@
+import asyncio
+import socket
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from src.viper_boot.server.asyncio_server import _BadRequestError
+from src.viper_boot.server.asyncio_server import _set_nodelay
+from src.viper_boot.server.asyncio_server import AsyncioServer
+
+
+class _Writer:
+    def __init__(self):
+        self.data = b""
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+
+def _read(data, writer=None):
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await AsyncioServer(None)._read_request(
+            reader, writer or _Writer()
+        )
+
+    return asyncio.run(read())
+
+
+@pytest.mark.parametrize(
+    argnames="data, expected, exception",
+    argvalues=[
+        (b"GET /api/v1/student%20x?limit=1 HTTP/1.1\r\nHost: a\r\n\r\n", ("GET", "/api/v1/student x", b"limit=1", b"", True), does_not_raise()),  # noqa
+        (b"POST /a HTTP/1.1\r\nContent-Length: 2\r\nConnection: close\r\n\r\n{}", ("POST", "/a", b"", b"{}", False), does_not_raise()),  # noqa
+        (b"GET /a HTTP/1.0\r\n\r\n", ("GET", "/a", b"", b"", False), does_not_raise()),  # noqa
+        (b"GET /a\r\n\r\n", None, pytest.raises(_BadRequestError)),
+        (b"POST /a HTTP/1.1\r\nContent-Length: 2\r\nExpect: 100-continue\r\n\r\n{}", ("POST", "/a", b"", b"{}", True), does_not_raise()),  # noqa
+    ],
+    ids=[
+        "it should parse path, query string and keep connection alive.",
+        "it should read body and close connection when asked.",
+        "it should close HTTP/1.0 connection by default.",
+        "it should raise _BadRequestError for invalid request line.",
+        "it should read body when client expects 100-continue.",
+    ]
+)
+def test_read_request(data, expected, exception):
+    # Arrange, Act, Assert
+    with exception:
+        scope, body, keep_alive = _read(data)
+
+        assert (
+            scope["method"],
+            scope["path"],
+            scope["query_string"],
+            body,
+            keep_alive,
+        ) == expected
+
+
+@pytest.mark.parametrize(
+    argnames="headers, status",
+    argvalues=[
+        (b"Transfer-Encoding: chunked\r\n", 411),
+        (b"Content-Length: -1\r\n", 400),
+        (b"Content-Length: 2097152\r\n", 413),
+        (b"Content-Length: 2\r\nExpect: later\r\n", 417),
+    ],
+    ids=[
+        "it should return `411` for chunked request body.",
+        "it should return `400` for invalid content length.",
+        "it should return `413` for body above maximum.",
+        "it should return `417` for unsupported expectation.",
+    ]
+)
+def test_read_request_refused(headers, status):
+    # Arrange
+    data = b"POST /a HTTP/1.1\r\n" + headers + b"\r\n{}"
+
+    # Act, Assert
+    with pytest.raises(_BadRequestError) as error:
+        _read(data)
+    assert error.value.status == status
+
+
+def test_read_request_continue():
+    # Arrange
+    writer = _Writer()
+
+    # Act
+    _read(
+        b"PUT /a HTTP/1.1\r\nContent-Length: 2\r\n"
+        b"Expect: 100-Continue\r\n\r\n{}",
+        writer,
+    )
+
+    # Assert
+    assert writer.data == b"HTTP/1.1 100 Continue\r\n\r\n"
+
+
+def test_read_request_body_timeout():
+    # Arrange
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"POST /a HTTP/1.1\r\nContent-Length: 2\r\n\r\n")
+        server = AsyncioServer(None, keep_alive_timeout=5, body_timeout=0.01)
+        return await server._read_request(reader, _Writer())
+
+    # Act, Assert
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(read())
+
+
+def test_read_request_closed():
+    # Arrange, Act, Assert
+    assert _read(b"") is None
+
+
+def test_set_nodelay():
+    # Arrange, inherited listening sockets are created without IPPROTO_TCP
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+    client = socket.create_connection(listener.getsockname())
+    connection, _ = listener.accept()
+
+    # Act
+    _set_nodelay(connection)
+    _set_nodelay(None)
+
+    # Assert
+    try:
+        assert connection.getsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY
+        )
+    finally:
+        for sock in (connection, client, listener):
+            sock.close()
+
+
+async def _stream_app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await receive()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ab", "more_body": True})  # noqa
+    await send({"type": "http.response.body", "body": b"cd"})
+
+
+def _exchange(data):
+    async def exchange():
+        sock = socket.create_server(("127.0.0.1", 0))
+        server = AsyncioServer(_stream_app, sock=sock)
+        serving = asyncio.create_task(server.serve())
+        try:
+            reader, writer = await asyncio.open_connection(
+                *sock.getsockname()[:2]
+            )
+            writer.write(data)
+            response = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return response
+        finally:
+            server.stop()
+            await serving
+
+    return asyncio.run(exchange())
+
+
+@pytest.mark.parametrize(
+    argnames="data, expected",
+    argvalues=[
+        (b"GET /a HTTP/1.1\r\nX-Large: " + b"x" * 9000 + b"\r\n\r\n", b"HTTP/1.1 431 Request Header Fields Too Large\r\n"),  # noqa
+        (b"GET /a HTTP/1.1\r\n" + b"X-A: 1\r\n" * 101 + b"\r\n", b"HTTP/1.1 431 Request Header Fields Too Large\r\n"),  # noqa
+    ],
+    ids=[
+        "it should return `431` for a header line above the limit.",
+        "it should return `431` for too many headers.",
+    ]
+)
+def test_serve_large_headers(data, expected):
+    # Act
+    response = _exchange(data)
+
+    # Assert
+    assert response.startswith(expected)
+
+
+@pytest.mark.parametrize(
+    argnames="request_line, expected_headers, expected_body",
+    argvalues=[
+        (b"GET /a HTTP/1.1\r\nConnection: close", [b"transfer-encoding: chunked", b"connection: close"], b"2\r\nab\r\n2\r\ncd\r\n0\r\n\r\n"),  # noqa
+        (b"GET /a HTTP/1.0\r\nConnection: keep-alive", [b"connection: close"], b"abcd"),  # noqa
+    ],
+    ids=[
+        "it should send streamed body chunked to HTTP/1.1 clients.",
+        "it should send streamed body as is and close HTTP/1.0 connection.",  # noqa
+    ]
+)
+def test_serve_streamed_body(request_line, expected_headers, expected_body):
+    # Act
+    response = _exchange(request_line + b"\r\n\r\n")
+
+    # Assert
+    head, _, body = response.partition(b"\r\n\r\n")
+    assert head.split(b"\r\n")[1:] == expected_headers
+    assert body == expected_body
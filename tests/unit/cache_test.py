@@ -0,0 +1,232 @@
+import asyncio
+import os
+import stat
+
+import pytest
+
+from src.viper_boot.utils.cache import MemoryCache
+from src.viper_boot.utils.cache import NullCache
+from src.viper_boot.utils.cache import SocketCache
+from src.viper_boot.utils.cache import create_cache
+
+
+@pytest.mark.parametrize(
+    "settings, cls",
+    [
+        (None, MemoryCache),
+        ({"backend": "none", "maxsize": 10}, NullCache),
+        ({"backend": "socket", "address": "/tmp/test.sock", "authkey": "key"}, SocketCache),  # noqa
+    ],
+    ids=[
+        "it should create memory cache by default.",
+        "it should create null cache ignoring options.",
+        "it should create socket cache.",
+    ]
+)
+def test_create_cache(settings, cls):
+    # Arrange, Act
+    cache = create_cache(settings)
+
+    # Assert
+    assert isinstance(cache, cls)
+
+
+def test_create_cache_unknown():
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        create_cache({"backend": "redis"})
+
+
+def test_get_or_load():
+    # Arrange
+    cache = MemoryCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"id": "abc"}
+
+    # Act
+    first = cache.get_or_load("abc", loader)
+    second = cache.get_or_load("abc", loader)
+
+    # Assert
+    assert first == second == {"id": "abc"}
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_get_or_load_async():
+    # Arrange
+    cache = MemoryCache()
+
+    async def loader():
+        return "value"
+
+    # Act
+    value = asyncio.run(cache.get_or_load_async("key", loader))
+
+    # Assert
+    assert value == "value"
+    assert cache.lookup("key") == (True, "value")
+
+
+def test_lru_eviction():
+    # Arrange
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.lookup("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.lookup("b") == (False, None)
+    assert cache.lookup("a") == (True, 1)
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_ttl_expiration(mocker):
+    # Arrange
+    cache = MemoryCache(ttl=10)
+    monotonic = mocker.patch("time.monotonic", return_value=100.0)
+    cache.set("a", 1)
+
+    # Act
+    monotonic.return_value = 110.0
+    found, _ = cache.lookup("a")
+
+    # Assert
+    assert not found
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_delete():
+    # Arrange
+    cache = MemoryCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    # Act
+    cache.delete("a", "b")
+
+    # Assert
+    assert cache.stats()["size"] == 1
+    cache.clear()
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.parametrize(
+    argnames="invalidate",
+    argvalues=[
+        lambda cache: cache.delete("a"),
+        lambda cache: cache.clear(),
+        lambda cache: cache.delete("b", "c"),
+    ],
+    ids=[
+        "it should not store value when key is deleted during load.",
+        "it should not store value when cache is cleared during load.",
+        "it should not store value when invalidation is no longer tracked.",
+    ]
+)
+def test_get_or_load_invalidated(invalidate):
+    # Arrange
+    cache = MemoryCache(maxsize=1)
+
+    def loader():
+        invalidate(cache)
+        return "stale"
+
+    # Act
+    value = cache.get_or_load("a", loader)
+
+    # Assert
+    assert value == "stale"
+    assert cache.lookup("a") == (False, None)
+
+
+def test_get_or_load_after_invalidation():
+    # Arrange
+    cache = MemoryCache()
+    cache.delete("a")
+
+    # Act
+    cache.get_or_load("a", lambda: "fresh")
+
+    # Assert
+    assert cache.lookup("a") == (True, "fresh")
+
+
+def test_socket_cache(tmp_path):
+    # Arrange
+    address = str(tmp_path / "cache.sock")
+    server = SocketCache(address, b"key", maxsize=2)
+    server.start()
+    client = SocketCache(address, b"key", maxsize=2)
+
+    # Act
+    client.set("a", {"id": "a"})
+    found = server.lookup("a")
+    client.delete("a")
+
+    # Assert
+    assert found == (True, {"id": "a"})
+    assert client.lookup("a") == (False, None)
+    assert client.stats()["hits"] == 1
+    server._manager.shutdown()
+
+
+def test_socket_cache_unreachable(tmp_path):
+    # Arrange
+    cache = SocketCache(str(tmp_path / "missing.sock"))
+
+    # Act, Assert
+    assert cache.get_or_load("a", lambda: 1) == 1
+    assert cache.stats() == {}
+
+
+def test_socket_cache_private():
+    # Arrange
+    cache = SocketCache()
+
+    # Act
+    cache.start()
+
+    # Assert
+    try:
+        mode = os.stat(os.path.dirname(cache._address)).st_mode
+        assert stat.S_IMODE(mode) == 0o700
+        assert SocketCache(cache._address).lookup("a") == (False, None)
+        cache.set("a", 1)
+        assert cache.lookup("a") == (True, 1)
+    finally:
+        cache._manager.shutdown()
+
+
+def test_socket_cache_listening(tmp_path):
+    # Arrange
+    address = str(tmp_path / "cache.sock")
+    server = SocketCache(address, b"key")
+    server.start()
+
+    # Act, Assert
+    try:
+        with pytest.raises(OSError):
+            SocketCache(address, b"key").start()
+        assert server.generation() == 0
+    finally:
+        server._manager.shutdown()
+
+
+def test_socket_cache_shared_directory(tmp_path):
+    # Arrange
+    tmp_path.chmod(0o777)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        SocketCache(str(tmp_path / "cache.sock")).start()
@@ -0,0 +1,260 @@
+import datetime
+import pickle
+import threading
+import uuid
+
+import pytest
+from marshmallow import EXCLUDE
+from marshmallow import Schema
+from marshmallow import ValidationError
+from marshmallow import fields
+from marshmallow import post_load
+
+from src.viper_boot.schemas.compiled_schema import CompiledSchema
+from src.viper_boot.schemas.compiled_schema import WireRecord
+from src.viper_boot.schemas.compiled_schema import compile_schema
+from src.viper_boot.schemas.person_schema import PersonSchema
+from src.viper_boot.schemas.student_id_schema import StudentIdSchema
+from src.viper_boot.schemas.student_schema import StudentSchema
+
+PERSON = {
+    "first_name": "James",
+    "last_name": "Smith",
+    "dob": "1978-10-10",
+    "gender": "MALE",
+}
+
+
+class _HookSchema(Schema):
+    """Schema with a post load hook, not compiled."""
+
+    class Meta:
+        """Configure schema meta."""
+
+        unknown = EXCLUDE
+
+    name = fields.Str(required=True)
+
+    @post_load
+    def upper(self, data, **_kwargs):
+        return {"name": data["name"].upper()}
+
+
+class _FieldsSchema(Schema):
+    """Schema with field options handled by the compiler."""
+
+    name = fields.Str(data_key="fullName", attribute="full_name")
+    age = fields.Int(load_default=18)
+    role = fields.Str(dump_default="student")
+    city = fields.Str(attribute="address.city", dump_only=True)
+    upper = fields.Method("get_upper", dump_only=True)
+
+    def get_upper(self, obj):
+        return obj["full_name"].upper()
+
+
+def test_compile_schema_cached():
+    # Arrange, Act
+    compiled = [compile_schema(StudentSchema) for _ in range(2)]
+
+    # Assert
+    assert compiled[0] is compiled[1]
+    assert isinstance(compiled[0].schema, StudentSchema)
+
+
+def test_compile_schema_thread_safe():
+    # Arrange
+    compiled = []
+    threads = [
+        threading.Thread(
+            target=lambda: compiled.append(compile_schema(_FieldsSchema))
+        )
+        for _ in range(8)
+    ]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert all(item is compiled[0] for item in compiled)
+
+
+@pytest.mark.parametrize(
+    "cls, obj, many",
+    [
+        (StudentSchema, {"id": uuid.uuid4(), "student": {**PERSON, "dob": datetime.date(1978, 10, 10)}}, False),  # noqa
+        (StudentSchema, [{"id": uuid.uuid4(), "student": None}] * 2, True),
+        (PersonSchema, {"first_name": b"James", "dob": datetime.date.today()}, False),  # noqa
+        (StudentIdSchema, {"id": uuid.uuid4()}, False),
+        (_FieldsSchema, {"full_name": "James", "address": {"city": "Leeds"}}, False),  # noqa
+    ],
+    ids=[
+        "it should dump nested student.",
+        "it should dump many students.",
+        "it should dump defaults and bytes.",
+        "it should dump UUID.",
+        "it should dump attribute, data key and method fields.",
+    ]
+)
+def test_compiled_schema_dump(cls, obj, many):
+    # Arrange
+    compiled = CompiledSchema(cls())
+
+    # Act
+    data = compiled.dump(obj, many=many)
+
+    # Assert
+    assert data == cls(many=many).dump(obj)
+
+
+@pytest.mark.parametrize(
+    "cls, data, many",
+    [
+        (StudentSchema, {"id": uuid.uuid4().hex, "student": PERSON}, False),
+        (StudentSchema, [{"student": PERSON, "extra": 1}] * 2, True),
+        (StudentIdSchema, {"id": uuid.uuid4().hex}, False),
+        (_FieldsSchema, {"fullName": "James"}, False),
+    ],
+    ids=[
+        "it should load nested student.",
+        "it should load many students and include unknown fields.",
+        "it should include dump only field as unknown.",
+        "it should load attribute, data key and load default.",
+    ]
+)
+def test_compiled_schema_load(cls, data, many):
+    # Arrange
+    compiled = CompiledSchema(cls())
+
+    # Act
+    loaded = compiled.load(data, many=many)
+
+    # Assert
+    assert loaded == cls(many=many).load(data)
+
+
+@pytest.mark.parametrize(
+    "cls, data, many",
+    [
+        (StudentSchema, {"student": {"first_name": 1}}, False),
+        (PersonSchema, {**PERSON, "extra": 1}, False),
+        (PersonSchema, {**PERSON, "dob": "today"}, False),
+        (PersonSchema, PERSON, True),
+        (StudentSchema, "student", False),
+    ],
+    ids=[
+        "it should raise nested errors.",
+        "it should raise unknown field errors.",
+        "it should raise invalid field errors.",
+        "it should raise invalid collection errors.",
+        "it should raise invalid type errors.",
+    ]
+)
+def test_compiled_schema_load_errors(cls, data, many):
+    # Arrange
+    compiled = CompiledSchema(cls())
+    with pytest.raises(ValidationError) as expected:
+        cls(many=many).load(data)
+
+    # Act, Assert
+    with pytest.raises(ValidationError) as error:
+        compiled.load(data, many=many)
+    assert error.value.messages == expected.value.messages
+
+
+def test_compiled_schema_hooks_fallback():
+    # Arrange
+    compiled = CompiledSchema(_HookSchema())
+
+    # Act
+    data = compiled.load({"name": "james", "extra": 1})
+
+    # Assert
+    assert data == {"name": "JAMES"}
+
+
+@pytest.mark.parametrize(
+    "cls, data, many",
+    [
+        (StudentSchema, {"id": uuid.uuid4().hex, "student": PERSON}, False),
+        (StudentSchema, [{"student": PERSON, "extra": 1}] * 2, True),
+        (_HookSchema, {"name": "james"}, False),
+    ],
+    ids=[
+        "it should validate student into wire record.",
+        "it should validate many students into wire records.",
+        "it should validate with marshmallow when not compiled.",
+    ]
+)
+def test_compiled_schema_validate(cls, data, many):
+    # Arrange
+    compiled = CompiledSchema(cls())
+    expected = cls(many=many).dump(cls(many=many).load(data))
+
+    # Act
+    records = compiled.validate(data, many=many)
+
+    # Assert
+    assert records == expected
+    for record in records if many else [records]:
+        assert type(record) is WireRecord
+        assert record.schema_cls is cls
+
+
+def test_compiled_schema_validate_errors():
+    # Arrange
+    compiled = CompiledSchema(PersonSchema())
+
+    # Act, Assert
+    with pytest.raises(ValidationError):
+        compiled.validate({**PERSON, "dob": "today"})
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [StudentSchema, _HookSchema],
+    ids=[
+        "it should pass compiled schema records through.",
+        "it should pass marshmallow schema records through.",
+    ]
+)
+def test_compiled_schema_dump_passthrough(cls):
+    # Arrange
+    compiled = CompiledSchema(cls())
+    record = WireRecord(cls, {"name": "wire"})
+
+    # Act
+    data = compiled.dump(record)
+    items = compiled.dump([record, record], many=True)
+
+    # Assert
+    assert data is record
+    assert all(item is record for item in items)
+
+
+def test_compiled_schema_dump_other_record():
+    # Arrange
+    compiled = CompiledSchema(PersonSchema())
+    record = WireRecord(StudentSchema, {"first_name": "James"})
+
+    # Act
+    data = compiled.dump(record)
+
+    # Assert
+    assert type(data) is not WireRecord
+    assert data["first_name"] == "James"
+
+
+def test_wire_record_pickle():
+    # Arrange
+    record = WireRecord(StudentSchema, {"id": "abc"})
+
+    # Act
+    loaded = pickle.loads(pickle.dumps(record))
+
+    # Assert
+    assert loaded == record
+    assert loaded.schema_cls is StudentSchema
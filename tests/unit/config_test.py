@@ -5,6 +5,13 @@
 from src.viper_boot.config import Config
 
 
+@pytest.fixture(autouse=True)
+def environment():
+    previous = Config().environment
+    yield
+    Config().environment = previous
+
+
 @pytest.mark.parametrize(
     argnames="environment, expected, exception",
     argvalues=[
@@ -50,3 +57,81 @@ def test_get_environment(environment, expected) -> None:
 
     # Assert
     assert env == expected
+
+
+def test_get_cached() -> None:
+    # Arrange
+    Config().environment = "development"
+
+    # Act
+    first, second = Config().get, Config().get
+    Config().reload()
+
+    # Assert
+    assert first is second
+    assert Config().get is not first
+    assert Config().get == first
+
+
+@pytest.mark.parametrize(
+    "update",
+    [
+        lambda settings: settings.__setitem__("PROFILE", "prd"),
+        lambda settings: settings["API"].__setitem__("url", ""),
+        lambda settings: settings["API"]["timeout"].append(1),
+    ],
+    ids=[
+        "it should not allow to set settings.",
+        "it should not allow to set nested settings.",
+        "it should not allow to change settings arrays.",
+    ]
+)
+def test_get_immutable(update) -> None:
+    # Arrange
+    Config().environment = "development"
+
+    # Act, Assert
+    with pytest.raises((TypeError, AttributeError)):
+        update(Config().get)
+
+
+def test_get_environment_snapshot() -> None:
+    # Arrange
+    Config().environment = "production"
+    production = Config().get
+
+    # Act
+    Config().environment = "development"
+
+    # Assert
+    assert Config().get["PROFILE"] == "dev"
+    assert production["PROFILE"] == "prd"
+
+
+def test_reload_subscribe(mocker) -> None:
+    # Arrange
+    Config().environment = "development"
+    listener = mocker.Mock()
+    Config().subscribe(listener)
+
+    # Act
+    Config().reload()
+
+    # Assert
+    listener.assert_called_once_with(Config().get)
+    Config()._listeners.remove(listener)
+
+
+def test_reload_failed(mocker) -> None:
+    # Arrange
+    Config().environment = "development"
+    settings, snapshot = Config().settings, Config().get
+    mocker.patch.object(
+        Config(), "_create_settings", side_effect=ValueError("invalid toml")
+    )
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        Config().reload()
+    assert Config().settings is settings
+    assert Config().get is snapshot
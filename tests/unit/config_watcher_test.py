@@ -0,0 +1,127 @@
+import os
+import threading
+
+import pytest
+
+from src.viper_boot.config.config_watcher import ConfigWatcher
+from src.viper_boot.config.config_watcher import watched
+
+
+class _Config:
+    """Config reloading settings files of a temporary directory."""
+
+    def __init__(self, directory, error=None):
+        self.files = [directory / "settings.toml", directory / ".secrets.toml"]
+        self.files[0].write_text("url = 'a'")
+        self.error = error
+        self.reloads = 0
+        self.reloaded = threading.Event()
+
+    def reload(self):
+        self.reloads += 1
+        self.reloaded.set()
+        if self.error is not None:
+            raise self.error
+
+
+def _touch(path, text):
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+@pytest.mark.parametrize(
+    "update, expected",
+    [
+        (lambda files: None, False),
+        (lambda files: _touch(files[0], "url = 'b'"), True),
+        (lambda files: _touch(files[1], "token = 'secret'"), True),
+        (lambda files: files[0].unlink(), True),
+    ],
+    ids=[
+        "it should not reload unchanged files.",
+        "it should reload changed settings file.",
+        "it should reload created secrets file.",
+        "it should reload deleted settings file.",
+    ]
+)
+def test_check(update, expected, tmp_path):
+    # Arrange
+    config = _Config(tmp_path)
+    watcher = ConfigWatcher(config)
+    watcher._signature = watcher.signature()
+    update(config.files)
+
+    # Act
+    reloaded = watcher.check()
+
+    # Assert
+    assert reloaded is expected
+    assert config.reloads == int(expected)
+    assert watcher.check() is False
+
+
+def test_check_failed(tmp_path, capsys):
+    # Arrange
+    config = _Config(tmp_path, error=ValueError("invalid toml"))
+    watcher = ConfigWatcher(config)
+    watcher._signature = watcher.signature()
+    _touch(config.files[0], "url = ")
+
+    # Act
+    reloaded = watcher.check()
+
+    # Assert
+    assert reloaded is False
+    assert config.reloads == 1
+    assert "previous settings are kept" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize(
+    "inotify",
+    [True, False],
+    ids=[
+        "it should reload on inotify events.",
+        "it should reload polling files without inotify.",
+    ]
+)
+def test_start(inotify, tmp_path, mocker):
+    # Arrange
+    if not inotify:
+        mocker.patch(
+            "src.viper_boot.config.config_watcher._Inotify.create",
+            return_value=None,
+        )
+    config = _Config(tmp_path)
+    watcher = ConfigWatcher(config, interval=0.05, debounce=0.01)
+    watcher.start()
+
+    # Act
+    _touch(config.files[0], "url = 'b'")
+    reloaded = config.reloaded.wait(5)
+    watcher.stop()
+
+    # Assert
+    assert reloaded
+    assert config.reloads == 1
+    assert watcher._thread is None
+
+
+def test_watched(tmp_path):
+    # Arrange
+    config = _Config(tmp_path)
+    threads = []
+
+    def serve(sock, max_requests):
+        threads.append(threading.enumerate())
+        return sock, max_requests
+
+    # Act
+    result = watched(serve, config, interval=0.05)("sock", 10)
+
+    # Assert
+    assert result == ("sock", 10)
+    assert any(thread.name == "config-watcher" for thread in threads[0])
+    assert all(
+        thread.name != "config-watcher" for thread in threading.enumerate()
+    )
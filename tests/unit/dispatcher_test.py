@@ -0,0 +1,284 @@
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+from marshmallow import ValidationError
+
+from src.viper_boot.server.dispatcher import Dispatcher
+from src.viper_boot.server.dispatcher import Response
+from src.viper_boot.server.router import Route
+from src.viper_boot.server.router import Router
+from src.viper_boot.utils.tracing import TRACER
+
+
+def _raise_validation_error(*_args):
+    raise ValidationError({"id": ["Not a valid UUID."]})
+
+
+def _raise_key_error(*_args):
+    raise KeyError("id")
+
+
+@pytest.fixture
+def dispatcher():
+    router = Router()
+    router.add(
+        Route("GET", "/api/v1/student/{id}", lambda _id: {"id": _id}, 200, False)  # noqa
+    )
+    router.add(
+        Route("POST", "/api/v1/student", lambda request: request, 201, True)
+    )
+    router.add(
+        Route("DELETE", "/api/v1/student/{id}", lambda _id: {}, 204, False)
+    )
+    router.add(
+        Route("GET", "/api/v1/invalid", _raise_validation_error, 200, False)
+    )
+    router.add(Route("GET", "/api/v1/broken", _raise_key_error, 200, False))
+
+    def fallback(method, path, headers):
+        if method == "GET":
+            body = headers.get("accept", "index").encode()
+            return Response(200, body, "text/html")
+        return None
+
+    return Dispatcher(router, fallback=fallback)
+
+
+@pytest.mark.parametrize(
+    argnames="method, target, body, status, expected",
+    argvalues=[
+        ("GET", "/api/v1/student/abc?x=1", b"", 200, {"id": "abc"}),
+        ("POST", "/api/v1/student", b'{"name": "James"}', 201, {"name": "James"}),  # noqa
+        ("POST", "/api/v1/student", b"[]", 400, {"code": 400, "message": "Bad request"}),  # noqa
+        ("DELETE", "/api/v1/student/abc", b"", 204, None),
+        ("PUT", "/api/v1/student/abc", b"", 405, {"code": 405, "message": "Method not allowed"}),  # noqa
+        ("GET", "/api/v1/invalid", b"", 422, {"code": 422, "message": {"id": ["Not a valid UUID."]}}),  # noqa
+        ("POST", "/unknown", b"", 404, {"code": 404, "message": "Not found"}),  # noqa
+        ("GET", "/api/v1/broken", b"", 500, {"code": 500, "message": "Server error"}),  # noqa
+    ],
+    ids=[
+        "it should call handler with path parameters.",
+        "it should call handler with request body.",
+        "it should return `400` when request body is not JSON object.",
+        "it should return `204` without body.",
+        "it should return `405` when method is not registered.",
+        "it should return `422` when handler raise validation error.",
+        "it should return `404` when fallback does not handle request.",
+        "it should return `500` when handler raise unexpected error.",
+    ]
+)
+def test_dispatch(dispatcher, method, target, body, status, expected):
+    # Arrange, Act
+    response = dispatcher.dispatch(method, target, body)
+
+    # Assert
+    assert response.status == status
+    assert (json.loads(response.body) if response.body else None) == expected
+
+
+def test_dispatch_fallback(dispatcher):
+    # Arrange, Act
+    response = dispatcher.dispatch("GET", "/")
+
+    # Assert
+    assert response.status == 200
+    assert response.body == b"index"
+    assert ("Content-Type", "text/html") in response.headers
+
+
+def test_dispatch_fallback_headers(dispatcher):
+    # Arrange, Act
+    response = asyncio.run(
+        dispatcher.dispatch_async("GET", "/", headers={"accept": "text/html"})
+    )
+
+    # Assert
+    assert response.body == b"text/html"
+
+
+async def _get_student(_id):
+    await asyncio.sleep(0)
+    return {"id": _id}
+
+
+async def _raise_upstream_error():
+    raise httpx.ConnectError("Connection refused")
+
+
+async def _raise_key_error_async():
+    raise KeyError("id")
+
+
+@pytest.fixture
+def async_dispatcher():
+    router = Router()
+    router.add(
+        Route("GET", "/api/v1/student/{id}", _get_student, 200, False)
+    )
+    router.add(
+        Route("GET", "/api/v1/students", lambda: [{"id": "abc"}], 200, False)  # noqa
+    )
+    router.add(
+        Route("GET", "/api/v1/upstream", _raise_upstream_error, 200, False)
+    )
+    router.add(
+        Route("GET", "/api/v1/broken", _raise_key_error_async, 200, False)
+    )
+
+    return Dispatcher(router)
+
+
+@pytest.mark.parametrize(
+    argnames="target, status, expected",
+    argvalues=[
+        ("/api/v1/student/abc", 200, {"id": "abc"}),
+        ("/api/v1/students", 200, [{"id": "abc"}]),
+        ("/api/v1/upstream", 500, {"code": 500, "message": "Server error"}),
+        ("/api/v1/broken", 500, {"code": 500, "message": "Server error"}),
+        ("/unknown", 404, {"code": 404, "message": "Not found"}),
+    ],
+    ids=[
+        "it should await coroutine handler.",
+        "it should run plain handler on executor.",
+        "it should return `500` when upstream call fails.",
+        "it should return `500` when handler raise unexpected error.",
+        "it should return `404` when route is not registered.",
+    ]
+)
+def test_dispatch_async(async_dispatcher, target, status, expected):
+    # Arrange, Act
+    response = asyncio.run(async_dispatcher.dispatch_async("GET", target))
+
+    # Assert
+    assert response.status == status
+    assert json.loads(response.body) == expected
+
+
+def test_dispatch_coroutine(async_dispatcher):
+    # Arrange, Act
+    first = async_dispatcher.dispatch("GET", "/api/v1/student/abc")
+    loop = async_dispatcher._loop
+    second = async_dispatcher.dispatch("GET", "/api/v1/student/def")
+    reused = async_dispatcher._loop is loop
+    async_dispatcher.close()
+
+    # Assert
+    assert json.loads(first.body) == {"id": "abc"}
+    assert json.loads(second.body) == {"id": "def"}
+    assert reused
+    assert loop.is_closed()
+
+
+@pytest.mark.parametrize(
+    argnames="records, ndjson, expected",
+    argvalues=[
+        ([], False, [b"[]"]),
+        ([1, 2, 3], False, [b"[1,2", b",3", b"]"]),
+        ([{"a": 1}, {"b": 2}, {"c": 3}], True, [b'{"a":1}\n{"b":2}\n', b'{"c":3}\n']),  # noqa
+    ],
+    ids=[
+        "it should stream empty JSON array.",
+        "it should stream JSON array in batches.",
+        "it should stream newline delimited JSON in batches.",
+    ]
+)
+def test_json_stream(records, ndjson, expected):
+    # Arrange, Act
+    response = Response.json_stream(200, iter(records), ndjson, batch_size=2)
+
+    # Assert
+    assert list(response.chunks) == expected
+    assert response.body == b""
+    assert [name for name, _ in response.headers] == ["Content-Type"]
+
+
+def test_json_stream_pretty():
+    # Arrange
+    records = [{"a": 1}, {"b": 2}, {"c": 3}]
+
+    # Act
+    response = Response.json_stream(200, records, batch_size=2, pretty=True)
+
+    # Assert
+    body = b"".join(response.chunks)
+    assert body == b'[{\n  "a": 1\n},\n{\n  "b": 2\n},\n{\n  "c": 3\n}]'
+    assert json.loads(body) == records
+
+
+def test_dispatch_stream_observed(tmp_path):
+    # Arrange
+    path = tmp_path / "traces.jsonl"
+    TRACER.configure({"exporter": "file", "path": str(path)})
+
+    def records():
+        with TRACER.span("record"):
+            yield {"id": "abc"}
+
+    router = Router()
+    router.add(
+        Route("GET", "/api/v1/students", lambda: Response.json_stream(200, records()), 200, False, operation_id="getStudents")  # noqa
+    )
+
+    # Act
+    try:
+        response = Dispatcher(router).dispatch("GET", "/api/v1/students")
+        exported = path.exists()
+        chunks = []
+        thread = threading.Thread(  # Produced by another thread, e.g. ASGI
+            target=lambda: chunks.extend(response.chunks)
+        )
+        thread.start()
+        thread.join()
+    finally:
+        TRACER.configure(None)
+
+    # Assert
+    spans = {
+        span["name"]: span
+        for span in map(json.loads, path.read_text().splitlines())
+    }
+    assert not exported
+    assert b"".join(chunks) == b'[{"id":"abc"}]'
+    assert spans["record"]["parent_id"] == spans["getStudents"]["span_id"]
+
+
+def test_dispatch_query():
+    # Arrange
+    router = Router()
+    router.add(
+        Route("GET", "/api/v1/students", lambda **query: Response(200, repr(sorted(query.items())).encode()), 200, False, {}, ("cursor", "limit", "pretty"))  # noqa
+    )
+
+    # Act
+    response = Dispatcher(router).dispatch(
+        "GET", "/api/v1/students?limit=1&limit=5&other=x&pretty"
+    )
+
+    # Assert
+    assert response.body == b"[('limit', '5'), ('pretty', '')]"
+
+
+@pytest.mark.parametrize(
+    "target, expected",
+    [
+        ("/api/v1/student/abc", b'{"id":"abc"}'),
+        ("/api/v1/student/abc?pretty", b'{\n  "id": "abc"\n}'),
+        ("/api/v1/student/abc?pretty=1", b'{\n  "id": "abc"\n}'),
+        ("/api/v1/student/abc?pretty=false", b'{"id":"abc"}'),
+    ],
+    ids=[
+        "it should encode compact JSON by default.",
+        "it should indent JSON on `pretty`.",
+        "it should indent JSON on `pretty=1`.",
+        "it should encode compact JSON on `pretty=false`.",
+    ]
+)
+def test_dispatch_pretty(dispatcher, target, expected):
+    # Arrange, Act
+    response = dispatcher.dispatch("GET", target)
+
+    # Assert
+    assert response.body == expected
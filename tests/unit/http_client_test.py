@@ -0,0 +1,224 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.viper_boot.utils.http_client import AsyncHttpClient
+from src.viper_boot.utils.http_client import HttpClient
+
+SETTINGS = {
+    "url": "http://127.0.0.1/get",
+    "timeout": [1, 2],
+    "pool_connections": 2,
+    "pool_maxsize": 4,
+    "retries": 3,
+    "backoff_factor": 0.5,
+}
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [HttpClient],
+    ids=[
+        "it should reuse one pooled session per process.",
+    ]
+)
+def test_session(cls, mocker):
+    # Arrange
+    client = cls(SETTINGS)
+    session = client.session
+
+    # Act, Assert
+    assert client.session is session
+
+    mocker.patch("os.getpid", return_value=-1)
+    assert client.session is not session
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [HttpClient],
+    ids=[
+        "it should configure pool size and retries from settings.",
+    ]
+)
+def test_adapter(cls):
+    # Arrange, Act
+    adapter = cls(SETTINGS).session.get_adapter(SETTINGS["url"])
+
+    # Assert
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.backoff_factor == 0.5
+
+
+@pytest.mark.parametrize(
+    "settings, url, expected",
+    [
+        (SETTINGS, "", (SETTINGS["url"], (1, 2))),
+        ({}, "http://127.0.0.1/other", ("http://127.0.0.1/other", (3.05, 27))),  # noqa
+    ],
+    ids=[
+        "it should call settings url with settings timeout.",
+        "it should call given url with default timeout.",
+    ]
+)
+def test_get(settings, url, expected, mocker):
+    # Arrange
+    mock_get = mocker.patch("requests.Session.get")
+
+    # Act
+    HttpClient(settings).get(url)
+
+    # Assert
+    mock_get.assert_called_once_with(expected[0], timeout=expected[1])
+
+
+def test_keep_alive_disabled():
+    # Arrange, Act
+    session = HttpClient({"keep_alive": False}).session
+
+    # Assert
+    assert session.headers["Connection"] == "close"
+
+
+@pytest.mark.parametrize(
+    "statuses, retries, expected",
+    [
+        ([503, 200], 1, (200, 2)),
+        ([503, 503], 1, (503, 2)),
+        ([404], 3, (404, 1)),
+    ],
+    ids=[
+        "it should retry unavailable upstream.",
+        "it should return last response when retries are spent.",
+        "it should not retry client errors.",
+    ]
+)
+def test_async_get(statuses, retries, expected, mocker):
+    # Arrange
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(statuses[len(calls) - 1])
+
+    client = AsyncHttpClient({**SETTINGS, "retries": retries})
+    mocker.patch.object(
+        client,
+        "_create_client",
+        return_value=httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+    )
+    mocker.patch("asyncio.sleep", mocker.AsyncMock())
+
+    async def get():
+        response = await client.get()
+        await client.aclose()
+        return response
+
+    # Act
+    response = asyncio.run(get())
+
+    # Assert
+    assert (response.status_code, len(calls)) == expected
+    assert str(calls[0].url) == SETTINGS["url"]
+
+
+def test_async_client():
+    # Arrange
+    client = AsyncHttpClient(SETTINGS)
+
+    async def clients():
+        first, second = client.client, client.client
+        await client.aclose()
+        return first, second
+
+    # Act
+    first, second = asyncio.run(clients())
+    other, _ = asyncio.run(clients())
+
+    # Assert
+    assert first is second
+    assert first is not other
+    assert first.timeout.connect == 1
+    assert first.timeout.read == 2
+
+
+def test_configure():
+    # Arrange
+    client = HttpClient(SETTINGS)
+    session = client.session
+
+    # Act
+    client.configure({**SETTINGS, "url": "http://127.0.0.1/new", "pool_maxsize": 8})  # noqa
+    adapter = client.session.get_adapter(client.url)
+
+    # Assert
+    assert client.url == "http://127.0.0.1/new"
+    assert client.session is not session
+    assert adapter._pool_maxsize == 8
+
+
+def test_async_configure():
+    # Arrange
+    client = AsyncHttpClient(SETTINGS)
+
+    async def clients():
+        first = client.client
+        client.configure({**SETTINGS, "timeout": [3, 4]})
+        second = client.client
+        await client.aclose()
+        return first, second
+
+    # Act
+    first, second = asyncio.run(clients())
+
+    # Assert
+    assert first is not second
+    assert first.is_closed
+    assert second.timeout.connect == 3
+    assert second.timeout.read == 4
+
+
+def test_async_configure_in_flight(mocker):
+    # Arrange
+    client = AsyncHttpClient(SETTINGS)
+    mocker.patch.object(
+        client,
+        "_create_client",
+        side_effect=lambda: httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ),
+    )
+    released = None
+
+    async def handler(request):
+        if request.url.path == "/slow":
+            await released.wait()
+        return httpx.Response(200)
+
+    async def clients():
+        nonlocal released
+        released = asyncio.Event()
+        slow = asyncio.create_task(client.get("http://127.0.0.1/slow"))
+        await asyncio.sleep(0)
+        first = client.client
+        client.configure(SETTINGS)
+        await client.get()
+        open_in_flight = not first.is_closed
+        released.set()
+        await slow
+        second = client.client
+        closed = first.is_closed and not second.is_closed
+        await client.aclose()
+        return open_in_flight, closed
+
+    # Act
+    open_in_flight, closed = asyncio.run(clients())
+
+    # Assert
+    assert open_in_flight
+    assert closed
@@ -0,0 +1,71 @@
+import pytest
+
+from src.viper_boot.utils.json_encoder import OrjsonEncoder
+from src.viper_boot.utils.json_encoder import StdlibJsonEncoder
+from src.viper_boot.utils.json_encoder import create_json_encoder
+
+orjson = pytest.importorskip("orjson")
+
+ENCODERS = [StdlibJsonEncoder, OrjsonEncoder]
+ENCODER_IDS = ["stdlib", "orjson"]
+
+
+@pytest.mark.parametrize(
+    "settings, cls",
+    [
+        (None, OrjsonEncoder),
+        ({"encoder": "stdlib"}, StdlibJsonEncoder),
+        ({"ENCODER": "orjson"}, OrjsonEncoder),
+    ],
+    ids=[
+        "it should create orjson encoder when installed by default.",
+        "it should create stdlib encoder.",
+        "it should create orjson encoder.",
+    ]
+)
+def test_create_json_encoder(settings, cls):
+    # Arrange, Act
+    encoder = create_json_encoder(settings)
+
+    # Assert
+    assert type(encoder) is cls
+
+
+def test_create_json_encoder_unknown():
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        create_json_encoder({"encoder": "ujson"})
+
+
+@pytest.mark.parametrize(
+    "pretty, expected",
+    [
+        (False, '{"name":"Zoë","errors":{"0":["Invalid."]},"ids":[1,2]}'),
+        (True, '{\n  "name": "Zoë",\n  "errors": {\n    "0": [\n      "Invalid."\n    ]\n  },\n  "ids": [\n    1,\n    2\n  ]\n}'),  # noqa
+    ],
+    ids=[
+        "it should encode compact UTF-8 JSON.",
+        "it should encode pretty UTF-8 JSON.",
+    ]
+)
+@pytest.mark.parametrize("cls", ENCODERS, ids=ENCODER_IDS)
+def test_encode(cls, pretty, expected):
+    # Arrange
+    data = {"name": "Zoë", "errors": {0: ["Invalid."]}, "ids": [1, 2]}
+
+    # Act
+    encoded = cls().encode(data, pretty)
+
+    # Assert
+    assert encoded == expected.encode("utf-8")
+
+
+@pytest.mark.parametrize("cls", ENCODERS, ids=ENCODER_IDS)
+def test_decode(cls):
+    # Arrange
+    encoder = cls()
+
+    # Act, Assert
+    assert encoder.decode('{"name":"Zoë"}'.encode("utf-8")) == {"name": "Zoë"}
+    with pytest.raises(ValueError):
+        encoder.decode(b"{")
@@ -0,0 +1,89 @@
+import subprocess
+import sys
+
+import pytest
+
+from src.viper_boot.utils.lazy_import import ImportProfiler
+from src.viper_boot.utils.lazy_import import lazy_import
+
+
+@pytest.mark.parametrize(
+    "module, unexpected",
+    [
+        ("src.viper_boot.__main__", ["dynaconf", "apispec", "marshmallow", "requests"]),  # noqa
+        ("src.viper_boot.services", ["dynaconf", "requests"]),
+        ("src.viper_boot.services.student_service", ["httpx", "apispec"]),
+    ],
+    ids=[
+        "it should load the CLI without the application.",
+        "it should not import services with the package.",
+        "it should import sync service without httpx.",
+    ]
+)
+def test_lazy_exports_imports(module, unexpected):
+    # Arrange
+    script = (
+        f"import sys, {module}; "
+        f"print(*[name for name in {unexpected!r} if name in sys.modules])"
+    )
+
+    # Act
+    output = subprocess.check_output([sys.executable, "-c", script])
+
+    # Assert
+    assert output.decode().split() == []
+
+
+def test_lazy_exports():
+    # Arrange
+    import src.viper_boot.services as services
+
+    # Act
+    service = services.StudentService
+
+    # Assert
+    assert "StudentService" in dir(services)
+    assert services.StudentService is service
+    with pytest.raises(AttributeError):
+        services.UnknownService  # noqa: B018  # pylint: disable=W0104
+
+
+def test_lazy_import(tmp_path, monkeypatch):
+    # Arrange
+    (tmp_path / "lazy_module.py").write_text("LOADED = True\nVALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_module", raising=False)
+
+    # Act
+    module = lazy_import("lazy_module")
+
+    # Assert
+    assert "lazy_module" not in sys.modules
+    assert module.VALUE == 1
+    assert module.LOADED is sys.modules["lazy_module"].LOADED
+    assert lazy_import("lazy_module") is sys.modules["lazy_module"]
+    with pytest.raises(ModuleNotFoundError):
+        lazy_import("not_installed_module")
+
+
+def test_import_profiler(tmp_path, monkeypatch, capsys):
+    # Arrange
+    (tmp_path / "profiled_parent.py").write_text("import profiled_child\n")
+    (tmp_path / "profiled_child.py").write_text("import time\ntime.sleep(0.01)\n")  # noqa
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    # Act
+    with ImportProfiler() as profiler:
+        import profiled_parent  # noqa: F401  # pylint: disable=W0611,C0415
+    profiler.report(sys.stdout)
+
+    # Assert
+    timings = {name: (total, own) for name, total, own in profiler.timings}
+    assert list(timings) == ["profiled_child", "profiled_parent"]
+    assert timings["profiled_child"][0] >= 0.01
+    assert timings["profiled_parent"][0] >= timings["profiled_child"][0]
+    assert timings["profiled_parent"][1] < timings["profiled_child"][0]
+    assert "profiled_parent" in capsys.readouterr().out
+    assert profiler not in sys.meta_path
+    for name in timings:
+        sys.modules.pop(name)
@@ -0,0 +1,100 @@
+from collections import Counter
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from src.viper_boot.server.stub_upstream import StubUpstream
+from src.viper_boot.utils.load_generator import LoadGenerator
+from src.viper_boot.utils.load_generator import LoadReport
+from src.viper_boot.utils.load_generator import LoadRequest
+
+
+@pytest.mark.parametrize(
+    argnames="latencies, percent, expected",
+    argvalues=[
+        ([0.4, 0.1, 0.3, 0.2], 50, 0.2),
+        ([0.4, 0.1, 0.3, 0.2], 99, 0.4),
+        ([0.1], 1, 0.1),
+        ([], 50, 0.0),
+    ],
+    ids=[
+        "it should get the median by nearest rank.",
+        "it should get the slowest request as p99 of few requests.",
+        "it should get the only request for low percentiles.",
+        "it should get 0 without requests.",
+    ]
+)
+def test_percentile(latencies, percent, expected):
+    # Arrange
+    report = LoadReport(latencies, Counter(), 1.0)
+
+    # Act, Assert
+    assert report.percentile(percent) == expected
+
+
+def test_report():
+    # Arrange
+    report = LoadReport([0.01, 0.03], Counter({200: 1, 503: 1}), 2.0)
+
+    # Act
+    result = report.as_dict()
+
+    # Assert
+    assert result["requests"] == 2
+    assert result["errors"] == 1
+    assert result["statuses"] == {"200": 1, "503": 1}
+    assert result["throughput"] == 1.0
+    assert result["latency_ms"]["max"] == 30.0
+
+
+@pytest.mark.parametrize(
+    argnames="rate, concurrency, expected",
+    argvalues=[
+        (0.0, 2, None),
+        (50.0, 4, 10),
+    ],
+    ids=[
+        "it should send requests closed-loop until the duration is over.",
+        "it should send the requests scheduled at the fixed rate.",
+    ]
+)
+def test_run(rate, concurrency, expected):
+    # Arrange
+    stub = StubUpstream(port=0)
+    stub.start()
+    generator = LoadGenerator(
+        stub.url.rsplit("/", 1)[0],
+        [LoadRequest("GET", "/get"), LoadRequest("POST", "/get", {})],
+        concurrency=concurrency,
+        rate=rate,
+        duration=0.2,
+    )
+
+    # Act
+    try:
+        report = generator.run()
+    finally:
+        stub.stop()
+
+    # Assert
+    assert report.errors == 0
+    assert report.statuses[200] == len(report.latencies) > 0
+    if expected is not None:
+        assert len(report.latencies) == expected
+
+
+@pytest.mark.parametrize(
+    argnames="url, exception",
+    argvalues=[
+        ("http://127.0.0.1:3000", does_not_raise()),
+        ("https://127.0.0.1:3000", pytest.raises(ValueError)),
+    ],
+    ids=[
+        "it should accept HTTP URLs.",
+        "it should raise ValueError for other schemes.",
+    ]
+)
+def test_url(url, exception):
+    # Arrange, Act, Assert
+    with exception:
+        LoadGenerator(url)
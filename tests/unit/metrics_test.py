@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from src.viper_boot.server.dispatcher import Dispatcher
+from src.viper_boot.server.router import Route
+from src.viper_boot.server.router import Router
+from src.viper_boot.utils.metrics import Histogram
+from src.viper_boot.utils.metrics import Metrics
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([], [(0.1, 0), (1.0, 0), (float("inf"), 0)]),
+        ([0.05, 0.1, 0.5, 2.0], [(0.1, 2), (1.0, 3), (float("inf"), 4)]),
+    ],
+    ids=[
+        "it should start with empty buckets.",
+        "it should count values cumulatively, bounds inclusive.",
+    ]
+)
+def test_histogram(values, expected):
+    # Arrange
+    histogram = Histogram((1.0, 0.1))
+
+    # Act
+    for value in values:
+        histogram.observe(value)
+
+    # Assert
+    buckets, total, count = histogram.snapshot()
+    assert buckets == expected
+    assert total == pytest.approx(sum(values))
+    assert count == len(values)
+
+
+def test_request_stages():
+    # Arrange
+    registry = Metrics()
+
+    # Act
+    with registry.request("getStudent") as timings:
+        timings.add("routing", 0.001)
+        with registry.stage("load"):
+            with registry.stage("load"):
+                pass
+        with registry.stage("dump"):
+            pass
+    with registry.stage("upstream"):
+        pass
+
+    # Assert
+    for stage in ("routing", "load", "dump", "total"):
+        assert registry.histogram("getStudent", stage).snapshot()[2] == 1
+    assert registry.histogram("getStudent", "upstream") is None
+
+
+def test_request_disabled():
+    # Arrange
+    registry = Metrics()
+    registry.configure({"enabled": False})
+
+    # Act
+    with registry.request("getStudent") as timings:
+        with registry.stage("load"):
+            pass
+
+    # Assert
+    assert timings is None
+    assert registry.histogram("getStudent", "total") is None
+
+
+def test_configure_buckets():
+    # Arrange
+    registry = Metrics()
+    registry.observe("getStudent", "total", 0.2)
+
+    # Act
+    registry.configure({"buckets": [0.5]})
+    registry.observe("getStudent", "total", 0.2)
+
+    # Assert
+    buckets, _, count = registry.histogram("getStudent", "total").snapshot()
+    assert buckets == [(0.5, 1), (float("inf"), 1)]
+    assert count == 1
+
+
+def test_render():
+    # Arrange
+    registry = Metrics((0.5,))
+    registry.observe('get"Student', "total", 0.25)
+    registry.add_collector(
+        "viper_boot_cache", lambda: {"hits": 3, "size": 1}, counters=("hits",)
+    )
+
+    # Act
+    text = registry.render()
+
+    # Assert
+    labels = 'operation="get\\"Student",stage="total"'
+    assert "# TYPE viper_boot_request_duration_seconds histogram\n" in text
+    assert f'viper_boot_request_duration_seconds_bucket{{{labels},le="0.5"}} 1\n' in text  # noqa
+    assert f'viper_boot_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1\n' in text  # noqa
+    assert f"viper_boot_request_duration_seconds_sum{{{labels}}} 0.25\n" in text  # noqa
+    assert f"viper_boot_request_duration_seconds_count{{{labels}}} 1\n" in text  # noqa
+    assert "# TYPE viper_boot_cache_hits_total counter\nviper_boot_cache_hits_total 3\n" in text  # noqa
+    assert "# TYPE viper_boot_cache_size gauge\nviper_boot_cache_size 1\n" in text  # noqa
+
+
+def test_dispatch_metrics(mocker):
+    # Arrange
+    registry = Metrics()
+    mocker.patch("src.viper_boot.server.dispatcher.METRICS", registry)
+
+    async def get_async(_id):
+        return {"id": _id}
+
+    router = Router()
+    router.add(Route("GET", "/student/{id}", lambda _id: {"id": _id}, 200, False, operation_id="getStudent"))  # noqa
+    router.add(Route("GET", "/async/{id}", get_async, 200, False, operation_id="getAsync"))  # noqa
+    dispatcher = Dispatcher(router)
+
+    # Act
+    dispatcher.dispatch("GET", "/student/1")
+    asyncio.run(dispatcher.dispatch_async("GET", "/async/1"))
+    dispatcher.dispatch("GET", "/missing")
+
+    # Assert
+    for operation in ("getStudent", "getAsync"):
+        for stage in ("routing", "dump", "total"):
+            assert registry.histogram(operation, stage).snapshot()[2] == 1
+    assert "operation=\"\"" not in registry.render()
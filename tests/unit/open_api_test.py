@@ -0,0 +1,115 @@
+import http.client
+import subprocess
+import threading
+from http.server import HTTPServer
+
+import pytest
+
+from src.viper_boot import __version__
+from src.viper_boot.openapi_docs import open_api
+from src.viper_boot.openapi_docs.open_api import OpenApi
+from src.viper_boot.server.dispatcher import Response
+
+
+@pytest.mark.parametrize(
+    "settings, expected",
+    [
+        (None, __version__),
+        ({"version": ""}, __version__),
+        ({"version": "2.1.0"}, "2.1.0"),
+    ],
+    ids=[
+        "it should return stamped version without settings.",
+        "it should return stamped version when setting is empty.",
+        "it should return version of settings.",
+    ]
+)
+def test_api_version(settings, expected):
+    # Arrange, Act
+    version = OpenApi.api_version(settings)
+
+    # Assert
+    assert version == expected
+
+
+def test_spec_version_without_git(mocker):
+    # Arrange
+    popen = mocker.patch.object(subprocess, "Popen", side_effect=OSError)
+
+    # Act
+    spec = OpenApi.__wrapped__().spec
+
+    # Assert
+    assert spec.version == __version__
+    popen.assert_not_called()
+
+
+@pytest.fixture
+def openapi_server(mocker):
+    openapi = mocker.patch.object(open_api, "OpenApi")
+    openapi.return_value.dispatcher.dispatch.return_value = Response.json(
+        200, {"ok": True}
+    )
+    server = HTTPServer(("127.0.0.1", 0), open_api._OpenApiServer)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.mark.parametrize(
+    argnames="length, status",
+    argvalues=[
+        ("2", 200),
+        ("abc", 400),
+        ("-1", 400),
+        (str(2 * 1024 * 1024), 413),
+    ],
+    ids=[
+        "it should dispatch request with valid content length.",
+        "it should return `400` when content length is malformed.",
+        "it should return `400` when content length is negative.",
+        "it should return `413` when content length is above maximum.",
+    ]
+)
+def test_server_content_length(openapi_server, length, status):
+    # Arrange
+    connection = http.client.HTTPConnection(*openapi_server.server_address)
+
+    # Act
+    connection.putrequest("POST", "/api/v1/student")
+    connection.putheader("Content-Length", length)
+    connection.endheaders(b"{}")
+    response = connection.getresponse()
+    response.read()
+    connection.close()
+
+    # Assert
+    assert response.status == status
+
+
+@pytest.mark.parametrize(
+    argnames="path, status, content_type",
+    argvalues=[
+        ("/", 200, "text/html; charset=utf-8"),
+        ("/api/v1/unknown", 404, "application/json"),
+        ("/api/v1/student/not-a-uuid", 404, "application/json"),
+    ],
+    ids=[
+        "it should serve index page at the root path.",
+        "it should return `404` for an unknown API path.",
+        "it should return `404` for a malformed student path.",
+    ]
+)
+def test_dispatch_fallback(path, status, content_type):
+    # Arrange
+    openapi = OpenApi.__wrapped__()
+
+    # Act
+    response = openapi.dispatcher.dispatch("GET", path)
+
+    # Assert
+    assert response.status == status
+    assert dict(response.headers)["Content-Type"] == content_type
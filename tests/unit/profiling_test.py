@@ -0,0 +1,112 @@
+import os
+import signal
+import threading
+
+import pytest
+
+from src.viper_boot.server.dispatcher import Dispatcher
+from src.viper_boot.server.dispatcher import Response
+from src.viper_boot.server.router import Route
+from src.viper_boot.server.router import Router
+from src.viper_boot.utils.profiling import Profiler
+from src.viper_boot.utils.profiling import PROFILER
+from src.viper_boot.utils.profiling import SamplingProfiler
+
+
+@pytest.mark.parametrize(
+    "settings, target, headers, expected",
+    [
+        ({}, "/students?profile", {}, False),
+        ({"request": True}, "/students", {}, False),
+        ({"request": True}, "/students?profile", {}, True),
+        ({"request": True}, "/students", {"x-profile": "1"}, True),
+        ({"request": True, "token": "secret"}, "/students?profile=secret", {}, True),  # noqa
+        ({"request": True, "token": "secret"}, "/students?profile=other", {}, False),  # noqa
+        ({"request": True, "token": "secret"}, "/students", {"x-profile": "secret"}, True),  # noqa
+    ],
+    ids=[
+        "it should not profile when disabled.",
+        "it should not profile requests not asking for it.",
+        "it should profile requests with the query parameter.",
+        "it should profile requests with the header.",
+        "it should profile requests with the token.",
+        "it should not profile requests with another token.",
+        "it should profile requests with the token header.",
+    ]
+)
+def test_requested(settings, target, headers, expected):
+    # Arrange
+    profiler = Profiler()
+    profiler.configure(settings)
+
+    # Act, Assert
+    assert profiler.requested(target, headers) is expected
+
+
+def test_dispatch_profile(mocker):
+    # Arrange
+    profiler = Profiler()
+    profiler.configure({"request": True})
+    mocker.patch("src.viper_boot.server.dispatcher.PROFILER", profiler)
+
+    def get_students():
+        return Response.json_stream(200, ({"id": i} for i in range(3)))
+
+    router = Router()
+    router.add(Route("GET", "/students", get_students, 200, False))
+
+    # Act
+    response = Dispatcher(router).dispatch("GET", "/students?profile")
+
+    # Assert
+    assert response.status == 200
+    assert ("Content-Type", "text/plain; charset=utf-8") in response.headers
+    assert ("X-Profile-Status", "200") in response.headers
+    assert b"function calls" in response.body
+    assert b"get_students" in response.body
+
+
+def test_sampling_profiler(tmp_path):
+    # Arrange
+    release = threading.Event()
+
+    def wait_for_release():
+        release.wait(5)
+
+    thread = threading.Thread(target=wait_for_release, name="worker")
+    thread.start()
+    sampler = SamplingProfiler(0.05, 0.01, tmp_path)
+
+    # Act
+    sampler.start()
+    path = sampler.join(5)
+    release.set()
+    thread.join()
+
+    # Assert
+    lines = path.read_text().splitlines()
+    stack, _, count = next(
+        line for line in lines if line.startswith("worker;")
+    ).rpartition(" ")
+    assert path.name.startswith(f"profile-{os.getpid()}-")
+    assert int(count) >= 1
+    assert stack.split(";")[-1].startswith("wait (")
+    assert "wait_for_release (" in stack
+
+
+def test_install_signal(tmp_path):
+    # Arrange
+    PROFILER.configure({"duration": 0.01, "interval": 0.005, "output": str(tmp_path)})  # noqa
+    previous = signal.getsignal(signal.SIGUSR2)
+
+    # Act
+    try:
+        assert PROFILER.install_signal()
+        os.kill(os.getpid(), signal.SIGUSR2)
+        path = PROFILER.sample().join(5)
+    finally:
+        signal.signal(signal.SIGUSR2, previous)
+        PROFILER.configure(None)
+
+    # Assert
+    assert path is not None and path.parent == tmp_path
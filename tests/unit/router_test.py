@@ -0,0 +1,112 @@
+import uuid
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from src.viper_boot.server.router import MethodNotAllowedError
+from src.viper_boot.server.router import Route
+from src.viper_boot.server.router import RouteNotFoundError
+from src.viper_boot.server.router import Router
+
+
+@pytest.fixture
+def router():
+    _router = Router()
+    for method, path in [
+        ("GET", "/api/v1/students"),
+        ("GET", "/api/v1/student/{id}"),
+        ("PATCH", "/api/v1/student/{id}"),
+        ("POST", "/api/v1/student"),
+    ]:
+        _router.add(Route(method, path, None, 200, method != "GET"))
+
+    return _router
+
+
+@pytest.mark.parametrize(
+    argnames="method, path, expected, exception",
+    argvalues=[
+        ("GET", "/api/v1/students", ("/api/v1/students", {}), does_not_raise()),  # noqa
+        ("GET", "/api/v1/student/abc", ("/api/v1/student/{id}", {"id": "abc"}), does_not_raise()),  # noqa
+        ("patch", "/api/v1/student/abc", ("/api/v1/student/{id}", {"id": "abc"}), does_not_raise()),  # noqa
+        ("GET", "/api/v1/student/abc/x", None, pytest.raises(RouteNotFoundError)),  # noqa
+        ("DELETE", "/api/v1/student", None, pytest.raises(MethodNotAllowedError)),  # noqa
+    ],
+    ids=[
+        "it should match static path.",
+        "it should match path template and return path parameters.",
+        "it should match method case insensitively.",
+        "it should raise RouteNotFoundError when no template matches.",
+        "it should raise MethodNotAllowedError when method is not registered.",  # noqa
+    ]
+)
+def test_match(router, method, path, expected, exception):
+    # Arrange, Act, Assert
+    with exception:
+        route, params = router.match(method, path)
+
+        assert (route.path, params) == expected
+
+
+def test_routes(router):
+    # Arrange, Act
+    routes = router.routes
+
+    # Assert
+    assert len(routes) == 4
+
+
+@pytest.mark.parametrize(
+    argnames="path, expected",
+    argvalues=[
+        ("/api/v1/student/12345678-1234-5678-1234-567812345678", ("/api/v1/student/{id}", {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")})),  # noqa
+        ("/api/v1/student/42", ("/api/v1/student/{number}", {"number": 42})),  # noqa
+        ("/api/v1/student/me", ("/api/v1/student/me", {})),
+        ("/api/v1/student/james", ("/api/v1/student/{name}", {"name": "james"})),  # noqa
+        ("/api/v1/student/james/courses/1", ("/api/v1/student/{name}/courses/{course}", {"name": "james", "course": 1})),  # noqa
+    ],
+    ids=[
+        "it should convert `uuid` path parameter.",
+        "it should convert `int` path parameter.",
+        "it should prefer literal segment over path parameter.",
+        "it should fall back to `str` path parameter.",
+        "it should return path parameters in template order.",
+    ]
+)
+def test_match_typed(path, expected):
+    # Arrange
+    router = Router()
+    for template, param_types in [
+        ("/api/v1/student/{name}", {}),
+        ("/api/v1/student/{id}", {"id": "uuid"}),
+        ("/api/v1/student/{number}", {"number": "int"}),
+        ("/api/v1/student/me", {}),
+        ("/api/v1/student/{name}/courses/{course}", {"course": "int"}),
+    ]:
+        router.add(Route("GET", template, None, 200, False, param_types))
+
+    # Act
+    route, params = router.match("GET", path)
+
+    # Assert
+    assert (route.path, params) == expected
+
+
+@pytest.mark.parametrize(
+    argnames="path, param_types",
+    argvalues=[
+        ("/api/v1/student.{format}", {}),
+        ("/api/v1/student/{id}", {"id": "date"}),
+    ],
+    ids=[
+        "it should raise ValueError when segment mixes literal and parameter.",  # noqa
+        "it should raise ValueError when converter is unknown.",
+    ]
+)
+def test_add_invalid(path, param_types):
+    # Arrange
+    router = Router()
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        router.add(Route("GET", path, None, 200, False, param_types))
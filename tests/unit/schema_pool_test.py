@@ -0,0 +1,95 @@
+import threading
+
+import pytest
+
+from src.viper_boot.schemas.compiled_schema import compile_schema
+from src.viper_boot.schemas.person_schema import PersonSchema
+from src.viper_boot.schemas.schema_pool import get_schema
+from src.viper_boot.schemas.student_schema import StudentSchema
+
+
+@pytest.mark.parametrize(
+    "options, other",
+    [
+        ({}, {}),
+        ({"only": ["first_name", "dob"]}, {"only": ("dob", "first_name")}),
+        ({"partial": ["dob"]}, {"partial": {"dob"}}),
+        ({"exclude": ["dob"], "many": True}, {"exclude": ("dob",), "many": 1}),  # noqa
+    ],
+    ids=[
+        "it should reuse default instance.",
+        "it should reuse instance with same `only` in any order.",
+        "it should reuse instance with same `partial` fields.",
+        "it should reuse instance with same `exclude` and `many`.",
+    ]
+)
+def test_get_schema_reused(options, other):
+    # Arrange, Act
+    schema = get_schema(PersonSchema, **options)
+
+    # Assert
+    assert schema is get_schema(PersonSchema, **other)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"many": True},
+        {"partial": True},
+        {"only": ["dob"]},
+        {"exclude": ["dob"]},
+    ],
+    ids=[
+        "it should key instances by `many`.",
+        "it should key instances by `partial`.",
+        "it should key instances by `only`.",
+        "it should key instances by `exclude`.",
+    ]
+)
+def test_get_schema_options(options):
+    # Arrange, Act
+    schema = get_schema(PersonSchema, **options)
+
+    # Assert
+    assert schema is not get_schema(PersonSchema)
+    for name, value in options.items():
+        expected = value if isinstance(value, bool) else set(value)
+        assert getattr(schema, name) == expected
+
+
+def test_get_schema_binds_nested():
+    # Arrange, Act
+    schema = get_schema(StudentSchema)
+
+    # Assert
+    assert isinstance(schema.fields["student"]._schema, PersonSchema)
+
+
+def test_get_schema_thread_safe():
+    # Arrange
+    schemas = []
+    threads = [
+        threading.Thread(
+            target=lambda: schemas.append(
+                get_schema(StudentSchema, only=["id"])
+            )
+        )
+        for _ in range(8)
+    ]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert all(schema is schemas[0] for schema in schemas)
+
+
+def test_compile_schema_pooled():
+    # Arrange, Act
+    compiled = compile_schema(PersonSchema)
+
+    # Assert
+    assert compiled.schema is get_schema(PersonSchema)
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.viper_boot.utils.decorators.single_flight_decorator import (
+    single_flight
+)
+
+
+def test_single_flight():
+    # Arrange
+    calls = []
+    release = threading.Event()
+
+    @single_flight
+    def load(_id):
+        calls.append(_id)
+        release.wait(5)
+        return {"id": _id}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(load("abc")))
+        for _ in range(5)
+    ]
+
+    # Act
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert calls == ["abc"]
+    assert results == [{"id": "abc"}] * 5
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.parametrize(
+    "ids, expected",
+    [
+        (["a", "a", "a"], 1),
+        (["a", "b", "c"], 3),
+    ],
+    ids=[
+        "it should share concurrent calls with equal arguments.",
+        "it should not share calls with different arguments.",
+    ]
+)
+def test_async_single_flight(ids, expected):
+    # Arrange
+    calls = []
+
+    @single_flight
+    async def load(_id):
+        calls.append(_id)
+        await asyncio.sleep(0.01)
+        return _id
+
+    async def gather():
+        return await asyncio.gather(*(load(_id) for _id in ids))
+
+    # Act
+    results = asyncio.run(gather())
+
+    # Assert
+    assert results == ids
+    assert len(calls) == expected
+
+
+def test_single_flight_error():
+    # Arrange
+    @single_flight
+    async def load():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("Upstream unavailable")
+
+    async def gather():
+        return await asyncio.gather(load(), load(), return_exceptions=True)
+
+    # Act
+    errors = asyncio.run(gather())
+
+    # Assert
+    assert all(isinstance(error, ConnectionError) for error in errors)
+
+
+def test_single_flight_leader_cancelled():
+    # Arrange
+    calls = []
+
+    @single_flight
+    async def load(_id):
+        calls.append(_id)
+        await asyncio.sleep(0.05)
+        return _id
+
+    async def gather():
+        leader = asyncio.create_task(load("a"))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(load("a")) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return leader, await asyncio.gather(*waiters)
+
+    # Act
+    leader, results = asyncio.run(gather())
+
+    # Assert
+    assert leader.cancelled()
+    assert results == ["a", "a", "a"]
+    assert calls == ["a", "a"]
+
+
+def test_single_flight_waiter_cancelled():
+    # Arrange
+    @single_flight
+    async def load():
+        await asyncio.sleep(0.05)
+        return "a"
+
+    async def gather():
+        leader = asyncio.create_task(load())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(load())
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        return waiter, await leader
+
+    # Act
+    waiter, result = asyncio.run(gather())
+
+    # Assert
+    assert waiter.cancelled()
+    assert result == "a"
+
+
+def test_single_flight_sequential():
+    # Arrange
+    calls = []
+
+    @single_flight
+    def load(_id):
+        calls.append(_id)
+        return _id
+
+    # Act
+    load("a")
+    load("a")
+
+    # Assert
+    assert calls == ["a", "a"]
@@ -0,0 +1,218 @@
+import gzip
+
+import pytest
+
+from src.viper_boot.server import static
+from src.viper_boot.server.static import StaticContent
+from src.viper_boot.server.static import StaticFiles
+
+BODY = b'{"openapi": "3.0.2", "paths": {}}' * 64
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("", "identity"),
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0, deflate", "identity"),
+        ("*", "gzip"),
+        ("br;q=1.0, gzip;q=0.8", "gzip"),
+    ],
+    ids=[
+        "it should send identity body without `Accept-Encoding`.",
+        "it should send gzip variant when accepted.",
+        "it should not send gzip variant with zero quality.",
+        "it should send gzip variant for any coding.",
+        "it should fall back to gzip without brotli.",
+    ]
+)
+def test_response_encoding(accept_encoding, expected, mocker):
+    # Arrange
+    mocker.patch.object(static, "brotli", None)
+    content = StaticContent(BODY, "application/json")
+
+    # Act
+    response = content.response({"accept-encoding": accept_encoding})
+
+    # Assert
+    headers = dict(response.headers)
+    assert response.status == 200
+    assert headers.get("Content-Encoding", "identity") == expected
+    assert headers["ETag"] == content.etag(expected)
+    assert headers["Vary"] == "Accept-Encoding"
+    body = gzip.decompress(response.body) if expected == "gzip" else response.body  # noqa
+    assert body == BODY
+
+
+def test_response_brotli(mocker):
+    # Arrange
+    brotli = mocker.Mock()
+    brotli.compress.return_value = b"br"
+    mocker.patch.object(static, "brotli", brotli)
+    content = StaticContent(BODY, "application/json")
+
+    # Act
+    response = content.response({"accept-encoding": "gzip, br"})
+
+    # Assert
+    assert response.body == b"br"
+    assert ("Content-Encoding", "br") in response.headers
+
+
+@pytest.mark.parametrize(
+    "if_none_match, accept_encoding, status",
+    [
+        ('"{identity}"', "", 304),
+        ('"{gzip}"', "gzip", 304),
+        ('W/"{identity}"', "", 304),
+        ('"other", "{identity}"', "", 304),
+        ("*", "", 304),
+        ('"other"', "", 200),
+    ],
+    ids=[
+        "it should return `304` for current entity tag.",
+        "it should return `304` for current gzip entity tag.",
+        "it should compare weak entity tags.",
+        "it should match any listed entity tag.",
+        "it should return `304` for any entity tag.",
+        "it should return `200` for changed entity tag.",
+    ]
+)
+def test_response_not_modified(if_none_match, accept_encoding, status):
+    # Arrange
+    content = StaticContent(BODY, "application/json")
+    etags = {"identity": content.etag()[1:-1], "gzip": content.etag("gzip")[1:-1]}  # noqa
+    headers = {
+        "if-none-match": if_none_match.format(**etags),
+        "accept-encoding": accept_encoding,
+    }
+
+    # Act
+    response = content.response(headers)
+
+    # Assert
+    assert response.status == status
+    assert (response.body == b"") is (status == 304)
+    assert ("ETag", content.etag(accept_encoding or "identity")) in response.headers  # noqa
+    if status == 304:
+        assert all(name != "Content-Length" for name, _ in response.headers)
+
+
+def test_small_body_not_compressed():
+    # Arrange
+    content = StaticContent(b"{}", "application/json")
+
+    # Act
+    response = content.response({"accept-encoding": "gzip"})
+
+    # Assert
+    assert response.body == b"{}"
+    assert all(name != "Vary" for name, _ in response.headers)
+
+
+@pytest.fixture
+def site(tmp_path):
+    (tmp_path / "index.html").write_text("{{ static('app.js') }}")
+    (tmp_path / "app.js").write_bytes(b"console.log(1);\n" * 64)
+    (tmp_path / "app.css").write_bytes(b"body {}\n" * 64)
+    (tmp_path / "app.css.gz").write_bytes(b"precompressed")
+    (tmp_path / "icon.png").write_bytes(b"\x89PNG")
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "name, content_type",
+    [
+        ("app.js", "text/javascript; charset=utf-8"),
+        ("app.css", "text/css; charset=utf-8"),
+        ("icon.png", "image/png"),
+    ],
+    ids=[
+        "it should serve scripts as JavaScript.",
+        "it should serve style sheets as CSS.",
+        "it should serve images with their media type.",
+    ]
+)
+def test_static_files_url(site, name, content_type):
+    # Arrange
+    files = StaticFiles(site, exclude=("index.html",))
+
+    # Act
+    response = files.response(files.url(name))
+
+    # Assert
+    headers = dict(response.headers)
+    assert response.status == 200
+    assert response.file == site / name
+    assert headers["Content-Type"] == content_type
+    assert headers["Content-Length"] == str((site / name).stat().st_size)
+    assert headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+
+@pytest.mark.parametrize(
+    "path, cache_control",
+    [
+        ("/static/app.js", "no-cache"),
+        ("/static/0123456789ab/app.js", "no-cache"),
+        ("/static/index.html", None),
+        ("/static/app.css.gz", None),
+        ("/static/missing.js", None),
+        ("/static/a/b/app.js", None),
+        ("/other/app.js", None),
+    ],
+    ids=[
+        "it should revalidate unversioned URLs.",
+        "it should revalidate previous version URLs.",
+        "it should not serve excluded files.",
+        "it should not serve precompressed files by name.",
+        "it should not serve unknown files.",
+        "it should not serve nested paths.",
+        "it should not serve paths outside the prefix.",
+    ]
+)
+def test_static_files_paths(site, path, cache_control):
+    # Arrange
+    files = StaticFiles(site, exclude=("index.html",))
+
+    # Act
+    response = files.response(path)
+
+    # Assert
+    if cache_control is None:
+        assert response is None
+    else:
+        assert ("Cache-Control", cache_control) in response.headers
+
+
+def test_static_files_variants(site, mocker):
+    # Arrange
+    mocker.patch.object(static, "brotli", None)
+    files = StaticFiles(site)
+    headers = {"accept-encoding": "gzip, br"}
+
+    # Act
+    css = files.response("/static/app.css", headers)
+    js = files.response("/static/app.js", headers)
+    png = files.response("/static/icon.png", headers)
+
+    # Assert
+    assert css.file == site / "app.css.gz"
+    assert ("Content-Encoding", "gzip") in css.headers
+    assert js.file is None
+    assert gzip.decompress(js.body) == (site / "app.js").read_bytes()
+    assert ("Content-Encoding", "gzip") in js.headers
+    assert png.file == site / "icon.png"
+    assert all(name != "Vary" for name, _ in png.headers)
+
+
+def test_static_files_not_modified(site):
+    # Arrange
+    files = StaticFiles(site)
+    etag = dict(files.response("/static/app.js").headers)["ETag"]
+
+    # Act
+    response = files.response(files.url("app.js"), {"if-none-match": etag})
+
+    # Assert
+    assert response.status == 304
+    assert response.file is None
@@ -0,0 +1,61 @@
+import json
+import urllib.error
+import urllib.request
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from src.viper_boot.server.stub_upstream import StubUpstream
+
+
+@pytest.mark.parametrize(
+    argnames="error_rate, payload_size, expected",
+    argvalues=[
+        (0.0, 1024, (200, 1024)),
+        (0.0, 0, (200, None)),
+        (1.0, 1024, (503, None)),
+    ],
+    ids=[
+        "it should answer with a payload of the configured size.",
+        "it should answer with the unpadded payload.",
+        "it should fail every request with error rate 1.",
+    ]
+)
+def test_stub_upstream(error_rate, payload_size, expected):
+    # Arrange
+    stub = StubUpstream(
+        port=0, error_rate=error_rate, payload_size=payload_size
+    )
+    stub.start()
+
+    # Act
+    try:
+        with urllib.request.urlopen(stub.url, timeout=5) as response:
+            status, body = response.status, response.read()
+    except urllib.error.HTTPError as error:
+        status, body = error.code, error.read()
+    finally:
+        stub.stop()
+
+    # Assert
+    assert status == expected[0]
+    assert isinstance(json.loads(body), dict)
+    if expected[1] is not None:
+        assert len(body) == expected[1]
+
+
+@pytest.mark.parametrize(
+    argnames="error_rate, exception",
+    argvalues=[
+        (0.5, does_not_raise()),
+        (1.5, pytest.raises(ValueError)),
+    ],
+    ids=[
+        "it should accept an error rate between 0 and 1.",
+        "it should raise ValueError for an error rate above 1.",
+    ]
+)
+def test_stub_upstream_error_rate(error_rate, exception):
+    # Arrange, Act, Assert
+    with exception:
+        StubUpstream(port=0, error_rate=error_rate).stop()
@@ -5,6 +5,8 @@
 from src.viper_boot.controllers.student_controller import (
     StudentController
 )
+from src.viper_boot.schemas import compile_schema
+from src.viper_boot.schemas import PersonSchema
 
 
 @pytest.mark.parametrize(
@@ -122,6 +124,21 @@ def test_post(cls, post_request, mocker):
     assert response["id"] != ""
 
 
+def test_post_wire_record(patch_request, mocker):
+    # Arrange
+    person = compile_schema(PersonSchema).validate(patch_request)
+    spy = mocker.patch(
+        "src.viper_boot.services.StudentService.post",
+        return_value={"id": uuid.uuid4().hex}
+    )
+
+    # Act
+    StudentController.post(person)
+
+    # Assert
+    assert spy.call_args.args[0] is person
+
+
 @pytest.mark.parametrize(
     "cls",
     [StudentController],
@@ -172,3 +189,51 @@ def test_delete(cls, mocker):
     spy.assert_called()
 
     assert response != ""
+
+
+def test_get_many(get_all_response, mocker):
+    # Arrange
+    ids = [uuid.uuid4().hex, uuid.uuid4().hex]
+    spy = mocker.patch(
+        "src.viper_boot.services.StudentService.get_many",
+        return_value=get_all_response
+    )
+
+    # Act
+    response = StudentController.get_many(ids)
+
+    # Assert
+    spy.assert_called_once_with(ids)
+    assert len(response) == 2
+    assert response[0]["student"]["dob"] == "1978-10-10"
+
+
+def test_get_page(get_all_response, mocker):
+    # Arrange
+    spy = mocker.patch(
+        "src.viper_boot.services.StudentService.get_page",
+        return_value=(get_all_response, "next")
+    )
+
+    # Act
+    response, cursor = StudentController.get_page("cursor", 2)
+
+    # Assert
+    spy.assert_called_once_with("cursor", 2)
+    assert cursor == "next"
+    assert response[1]["student"]["dob"] == "1978-10-10"
+
+
+def test_iter_all(get_all_response, mocker):
+    # Arrange
+    mocker.patch(
+        "src.viper_boot.services.StudentService.iter_all",
+        return_value=iter(get_all_response)
+    )
+
+    # Act
+    response = list(StudentController.iter_all(10))
+
+    # Assert
+    assert len(response) == 2
+    assert response[0]["student"]["dob"] == "1978-10-10"
@@ -0,0 +1,53 @@
+import uuid
+
+import pytest
+from marshmallow import ValidationError
+
+from src.viper_boot.schemas.student_ids_schema import StudentIdsSchema
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [StudentIdsSchema],
+    ids=[
+        "it should contain `ids` attribute.",
+    ]
+)
+def test_student_ids_schema_ids_attribute(cls):
+    # Arrange, Act
+    obj = cls()
+
+    # Assert
+    assert "ids" in obj.__class__.__dict__["_declared_fields"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"ids": []},
+        {"ids": ["abc"]},
+        {"ids": [uuid.uuid4().hex] * (StudentIdsSchema.MAX_IDS + 1)},
+    ],
+    ids=[
+        "it should require `ids`.",
+        "it should reject empty `ids`.",
+        "it should reject invalid UUID.",
+        "it should reject more than `MAX_IDS` ids.",
+    ]
+)
+def test_student_ids_schema_validation(data):
+    # Arrange, Act, Assert
+    with pytest.raises(ValidationError):
+        StudentIdsSchema().load(data)
+
+
+def test_student_ids_schema_load():
+    # Arrange
+    _id = uuid.uuid4()
+
+    # Act
+    data = StudentIdsSchema().load({"ids": [str(_id)]})
+
+    # Assert
+    assert data == {"ids": [_id]}
@@ -1,8 +1,10 @@
 import uuid
 
 import pytest
+from marshmallow import ValidationError
 
 from src.viper_boot.config.config import Config
+from src.viper_boot.services.student_service import CACHE
 from src.viper_boot.services.student_service import StudentService
 
 # Set application config environment
@@ -10,6 +12,11 @@
 SETTINGS = Config().get
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    CACHE.clear()
+
+
 @pytest.mark.parametrize(
     "cls",
     [StudentService],
@@ -35,7 +42,7 @@ def test_student_service(cls):
 def test_get(cls, get_response, mocker):
     # Arrange
     _id = uuid.uuid4().hex
-    mock_requests = mocker.patch("requests.get")
+    mock_requests = mocker.patch("requests.Session.get")
     mock_requests.return_value.ok = True
     mock_requests.return_value.text = "Success"
 
@@ -65,7 +72,7 @@ def test_get(cls, get_response, mocker):
 def test_get_all(cls, get_all_response, mocker):
     # Arrange
     _id = uuid.uuid4().hex
-    mock_requests = mocker.patch("requests.get")
+    mock_requests = mocker.patch("requests.Session.get")
     mock_requests.return_value.ok = True
     mock_requests.return_value.text = "Success"
 
@@ -100,7 +107,7 @@ def test_get_all(cls, get_all_response, mocker):
 )
 def test_post(cls, post_request, mocker):
     # Arrange
-    mock_requests = mocker.patch("requests.get")
+    mock_requests = mocker.patch("requests.Session.get")
     mock_requests.return_value.ok = True
     mock_requests.return_value.text = "Success"
 
@@ -126,7 +133,7 @@ def test_post(cls, post_request, mocker):
 def test_patch(cls, patch_request, mocker):
     # Arrange
     _id = uuid.uuid4().hex
-    mock_requests = mocker.patch("requests.get")
+    mock_requests = mocker.patch("requests.Session.get")
     mock_requests.return_value.ok = True
     mock_requests.return_value.text = "Success"
 
@@ -156,7 +163,7 @@ def test_patch(cls, patch_request, mocker):
 def test_delete(cls, mocker):
     # Arrange
     _id = uuid.uuid4().hex
-    mock_requests = mocker.patch("requests.get")
+    mock_requests = mocker.patch("requests.Session.get")
     mock_requests.return_value.ok = True
     mock_requests.return_value.text = "Success"
 
@@ -170,3 +177,91 @@ def test_delete(cls, mocker):
     )
 
     assert response != ""
+
+
+@pytest.mark.parametrize(
+    "method, args, calls",
+    [
+        ("get", ("abc",), 1),
+        ("patch", ("abc", {"first_name": "Sarah", "last_name": "Smith", "dob": "1988-10-10", "gender": "FEMALE"}), 3),  # noqa
+        ("delete", ("abc",), 3),
+    ],
+    ids=[
+        "it should serve repeated reads from cache.",
+        "it should invalidate cached student on patch.",
+        "it should invalidate cached student on delete.",
+    ]
+)
+def test_cache(method, args, calls, mocker):
+    # Arrange
+    mock_requests = mocker.patch("requests.Session.get")
+    first = StudentService.get("abc")
+
+    # Act
+    getattr(StudentService, method)(*args)
+    second = StudentService.get("abc")
+
+    # Assert
+    assert mock_requests.call_count == calls
+    assert (first == second) == (calls == 1)
+
+
+def test_get_many(mocker):
+    # Arrange
+    ids = [uuid.uuid4() for _ in range(3)]
+    mock_requests = mocker.patch("requests.Session.get")
+    cached = StudentService.get_many(ids[:1])
+
+    # Act
+    response = StudentService.get_many(ids + ids[:1])
+
+    # Assert
+    assert mock_requests.call_count == 2
+    assert [student["id"] for student in response] == [str(_id) for _id in ids]  # noqa
+    assert response[0] is cached[0]
+
+
+def test_get_page(mocker):
+    # Arrange
+    mock_requests = mocker.patch("requests.Session.get")
+
+    # Act
+    first, cursor = StudentService.get_page(limit=1)
+    second, last_cursor = StudentService.get_page(cursor, limit=1)
+
+    # Assert
+    assert mock_requests.call_args.kwargs["params"] == {
+        "offset": 1,
+        "limit": 2,
+    }
+    assert len(first) == len(second) == 1
+    assert first[0]["student"]["first_name"] == "James"
+    assert second[0]["student"]["first_name"] == "Sarah"
+    assert last_cursor is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-base64!", "e30=", "eyJvZmZzZXQiOiAtMX0="],
+    ids=[
+        "it should reject malformed cursor.",
+        "it should reject cursor without offset.",
+        "it should reject negative offset.",
+    ]
+)
+def test_get_page_invalid_cursor(cursor):
+    # Arrange, Act, Assert
+    with pytest.raises(ValidationError):
+        StudentService.get_page(cursor)
+
+
+def test_iter_all(mocker):
+    # Arrange
+    mock_requests = mocker.patch("requests.Session.get")
+
+    # Act
+    students = list(StudentService.iter_all(page_size=1))
+
+    # Assert
+    assert len(students) == 2
+    assert mock_requests.call_count == 2
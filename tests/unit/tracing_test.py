@@ -0,0 +1,169 @@
+import asyncio
+import json
+import socket
+
+import pytest
+
+from src.viper_boot.config import Config
+from src.viper_boot.utils.decorators.traced_decorator import traced
+from src.viper_boot.utils.http_client import HttpClient
+from src.viper_boot.utils.tracing import Tracer
+from src.viper_boot.utils.tracing import TRACER
+
+PARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    TRACER.configure({"exporter": "file", "path": str(tmp_path / "traces.jsonl")})  # noqa
+    yield TRACER
+    TRACER.configure(None)
+
+
+def _spans(tmp_path):
+    lines = (tmp_path / "traces.jsonl").read_text().splitlines()
+    return {span["name"]: span for span in map(json.loads, lines)}
+
+
+@traced
+class _Service:
+    @staticmethod
+    def get(_id):
+        with TRACER.span("inner"):
+            return {"id": _id}
+
+    @staticmethod
+    async def get_async(_id):
+        return {"id": _id}
+
+    @staticmethod
+    def iter_all():
+        yield TRACER.current
+
+    @staticmethod
+    def fail():
+        raise ValueError("invalid")
+
+
+def test_trace(tracer, tmp_path):
+    # Act
+    with tracer.trace("getStudent", path="/student/1"):
+        _Service.get("1")
+        asyncio.run(_Service.get_async("1"))
+        with pytest.raises(ValueError):
+            _Service.fail()
+        generated = list(_Service.iter_all())
+
+    # Assert
+    spans = _spans(tmp_path)
+    root = spans["getStudent"]
+    assert root["parent_id"] is None
+    assert root["attributes"] == {"path": "/student/1"}
+    assert spans["_Service.get"]["parent_id"] == root["span_id"]
+    assert spans["_Service.get_async"]["parent_id"] == root["span_id"]
+    assert spans["inner"]["parent_id"] == spans["_Service.get"]["span_id"]
+    assert spans["_Service.fail"]["error"] == "ValueError"
+    assert "_Service.iter_all" not in spans
+    assert generated[0].name == "getStudent"
+    assert {span["trace_id"] for span in spans.values()} == {root["trace_id"]}
+
+
+@pytest.mark.parametrize(
+    "traceparent, sample_rate, expected",
+    [
+        (PARENT, 0.0, "0af7651916cd43dd8448eb211c80319c"),
+        (PARENT[:-2] + "00", 1.0, None),
+        ("00-" + "0" * 32 + "-b7ad6b7169203331-01", 0.0, None),
+        ("invalid", 1.0, "new"),
+        ("", 0.0, None),
+    ],
+    ids=[
+        "it should continue sampled trace of the caller.",
+        "it should not trace unsampled trace of the caller.",
+        "it should ignore invalid trace id.",
+        "it should start new trace for invalid header.",
+        "it should not trace unsampled requests.",
+    ]
+)
+def test_trace_sampling(tmp_path, traceparent, sample_rate, expected):
+    # Arrange
+    tracer = Tracer()
+    tracer.configure({"exporter": "file", "path": str(tmp_path / "traces.jsonl"), "sample_rate": sample_rate})  # noqa
+
+    # Act
+    with tracer.trace("getStudent", traceparent) as span:
+        pass
+
+    # Assert
+    if expected is None:
+        assert span is None
+        assert not (tmp_path / "traces.jsonl").exists()
+    else:
+        root = _spans(tmp_path)["getStudent"]
+        assert len(root["trace_id"]) == 32
+        if expected != "new":
+            assert root["trace_id"] == expected
+            assert root["parent_id"] == PARENT.split("-")[2]
+
+
+def test_config_reload_span(tracer, tmp_path):
+    # Act
+    with tracer.trace("reload"):
+        Config().reload()
+        Config().get["PROFILE"]
+
+    # Assert
+    spans = _spans(tmp_path)
+    assert spans["Config.reload"]["parent_id"] == spans["reload"]["span_id"]
+    assert "Config.get" not in spans
+
+
+def test_span_outside_trace():
+    # Act
+    with TRACER.span("inner") as span:
+        pass
+
+    # Assert
+    assert span is None
+    assert TRACER.current is None
+
+
+def test_upstream_traceparent(tracer, tmp_path, mocker):
+    # Arrange
+    mock_get = mocker.patch("requests.Session.get")
+
+    # Act
+    with tracer.trace("getStudent"):
+        HttpClient({"url": "http://127.0.0.1/get"}).get()
+
+    # Assert
+    upstream = _spans(tmp_path)["upstream.get"]
+    headers = mock_get.call_args.kwargs["headers"]
+    assert headers["traceparent"] == f"00-{upstream['trace_id']}-{upstream['span_id']}-01"  # noqa
+    assert upstream["attributes"] == {"url": "http://127.0.0.1/get"}
+
+
+def test_udp_exporter():
+    # Arrange
+    collector = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    collector.bind(("127.0.0.1", 0))
+    collector.settimeout(5)
+    tracer = Tracer()
+    tracer.configure({"exporter": "udp", "address": "127.0.0.1:%d" % collector.getsockname()[1]})  # noqa
+
+    # Act
+    with tracer.trace("getStudent"):
+        with tracer.span("StudentService.get"):
+            pass
+
+    # Assert
+    names = {json.loads(collector.recv(65536))["name"] for _ in range(2)}
+    assert names == {"getStudent", "StudentService.get"}
+    collector.close()
+    tracer.configure(None)
+
+
+def test_unknown_exporter():
+    # Act, Assert
+    with pytest.raises(ValueError):
+        Tracer().configure({"exporter": "jaeger"})
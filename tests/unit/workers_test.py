@@ -0,0 +1,69 @@
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+
+import pytest
+
+from src.viper_boot.server.workers import Arbiter
+from src.viper_boot.server.workers import serve_requests
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.mark.parametrize(
+    argnames="workers",
+    argvalues=[0, -1],
+    ids=[
+        "it should raise ValueError when workers is `0`.",
+        "it should raise ValueError when workers is negative.",
+    ]
+)
+def test_arbiter_invalid_workers(workers):
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        Arbiter(lambda sock, max_requests: None, "127.0.0.1", 0, workers)
+
+
+def test_bind():
+    # Arrange, Act
+    sock = Arbiter.bind("127.0.0.1", 0)
+
+    # Assert
+    try:
+        assert sock.getsockname()[1] != 0
+    finally:
+        sock.close()
+
+
+def test_serve_requests():
+    # Arrange
+    sock = Arbiter.bind("127.0.0.1", 0)
+    server = HTTPServer(sock.getsockname(), _Handler, bind_and_activate=False)
+    server.socket.close()
+    server.socket = sock
+    url = f"http://127.0.0.1:{sock.getsockname()[1]}/"
+    statuses = []
+
+    def client():
+        for _ in range(3):
+            with urllib.request.urlopen(url) as response:
+                statuses.append(response.status)
+
+    thread = threading.Thread(target=client)
+    thread.start()
+
+    # Act
+    serve_requests(server, max_requests=3)
+    thread.join()
+    server.server_close()
+
+    # Assert
+    assert statuses == [204, 204, 204]